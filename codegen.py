@@ -64,6 +64,12 @@ class XmlParser:
         self.tag_dict = {}
         # order is relevant to ensure that structs are later imported in the correct order in generated code
         self.processed_types = {}
+        # compounds whose arrays are read as structured numpy arrays, see Compound.has_fixed_layout
+        self.np_types = set()
+        # compounds with __slots__ and the names of their slots, including inherited ones, see Compound.get_slots
+        self.slotted_types = {}
+        # slots="false" on the root opts out the whole format, see the rule for it in codegen/README.md
+        self.use_slots = True
 
         self.basics = None
 
@@ -117,6 +123,7 @@ class XmlParser:
 
         tree = ET.parse(xml_file)
         root = tree.getroot()
+        self.use_slots = root.attrib.get("slots", "true") != "false"
 
         self.versions = Versions(self, gen_dir=self.gen_dir)
         self.basics = Basics(self)
@@ -307,6 +314,8 @@ class XmlParser:
         self.copy_dict_info(self.tag_dict, other_parser.tag_dict)
         self.basics.add_other_basics(other_parser.basics)
         self.copy_dict_info(self.processed_types, other_parser.processed_types)
+        self.np_types.update(other_parser.np_types)
+        self.copy_dict_info(self.slotted_types, other_parser.slotted_types)
 
     @staticmethod
     def get_attr_with_backups(field, attribute_keys):
@@ -1,8 +1,15 @@
+import ast
+import logging
+import os
+
 from .BaseClass import BaseClass
 from .Imports import Imports
 from .Union import Union
 
 FIELD_TYPES = ("add", "field")
+BASE_BASICS = os.path.join("formats", "base", "basic")
+# the attributes set by BaseStruct.__init__
+BASE_SLOTS = ("name", "_context", "arg", "template", "io_size", "io_start")
 
 
 class Compound(BaseClass):
@@ -10,6 +17,81 @@ class Compound(BaseClass):
     def __init__(self, parser, struct, gen_dir):
         super().__init__(parser, struct, gen_dir=gen_dir)
 
+    def has_fixed_layout(self):
+        """Check if arrays of this compound can be read as structured numpy arrays
+
+        That is if it has fields without any conditions, and they are basics or other such compounds
+        """
+        # code from the source snippets may rely on python instances
+        if self.src_code or not self.field_unions:
+            return False
+        if self.class_basename != "BaseStruct" and self.class_basename not in self.parser.np_types:
+            return False
+        for union in self.field_unions:
+            if not union.has_static_layout():
+                return False
+            for field in union.members:
+                field_type = field.attrib["type"]
+                # numpy records have no context to evaluate conditions on
+                if any(union.get_conditions(field, "instance")):
+                    return False
+                if self.parser.get_attr_with_backups(field, ["arr1", "length"]):
+                    return False
+                if self.parser.tag_dict.get(field_type.lower()) == "basic":
+                    # format specific basics, eg. OffsetString, may read something else than their storage
+                    if self.parser.path_dict[field_type] != BASE_BASICS:
+                        return False
+                elif field_type not in self.parser.np_types:
+                    return False
+        return True
+
+    def get_slots(self, allow_np):
+        """Returns the names for __slots__ of this compound, or None if its instances need a __dict__
+
+        slots="false" on the compound or the format opts out, eg. if code outside of the source snippet
+        attaches attributes to the instances
+        """
+        # numpy records subclass the struct, which does not work with slots
+        if allow_np or not self.parser.use_slots or self.struct.get("slots", None) == "false":
+            return None
+        if self.class_basename == "BaseStruct":
+            inherited = ()
+            own = list(BASE_SLOTS)
+        elif self.class_basename in self.parser.slotted_types:
+            inherited = self.parser.slotted_types[self.class_basename]
+            own = []
+        else:
+            return None
+        own.extend(union.name for union in self.field_unions if union.name not in inherited and union.name not in own)
+        all_names = (*inherited, *own)
+        if not self.src_fits_slots(all_names):
+            return None
+        self.parser.slotted_types[self.class_name] = all_names
+        return own
+
+    def src_fits_slots(self, names):
+        """Check that the source snippet of this class only sets the given attributes on its instances"""
+        if not self.src_code:
+            return True
+        for node in ast.parse(self.src_code).body:
+            if isinstance(node, ast.ClassDef) and node.name == self.class_name:
+                for stmt in node.body:
+                    # slots can't share a name with a class attribute, eg. a property
+                    if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)) and stmt.name in names:
+                        return False
+                    if isinstance(stmt, (ast.Assign, ast.AnnAssign)):
+                        targets = stmt.targets if isinstance(stmt, ast.Assign) else (stmt.target,)
+                        if any(isinstance(target, ast.Name) and target.id in names for target in targets):
+                            return False
+                for sub in ast.walk(node):
+                    if isinstance(sub, ast.Attribute) and isinstance(sub.ctx, ast.Store) and sub.attr not in names:
+                        return False
+                    if isinstance(sub, ast.Name) and sub.id in ("setattr", "vars"):
+                        return False
+                    if isinstance(sub, ast.Attribute) and sub.attr == "__dict__":
+                        return False
+        return True
+
     def read(self):
         """Create a self.struct class"""
         super().read()
@@ -35,8 +117,26 @@ class Compound(BaseClass):
             super().write(f)
 
             self.write_line(f)
-            if self.struct.get("allow_np", None) == "true":
+            # allow_np="auto" opts in only if the layout is fixed, so plain vectors can be read in bulk
+            allow_np = self.struct.get("allow_np", None)
+            if allow_np == "auto":
+                allow_np = self.has_fixed_layout()
+                if not allow_np:
+                    logging.warning(f"{self.class_name} in format {self.parser.format_name} has allow_np=\"auto\", "
+                                    f"but no fixed layout, so it is read as python instances")
+            else:
+                allow_np = allow_np == "true"
+            if allow_np:
+                self.parser.np_types.add(self.class_name)
                 self.write_line(f, 1, f"allow_np = True")
+            # store the fields in slots instead of a __dict__ per instance
+            slots = self.get_slots(allow_np)
+            if slots is not None:
+                self.write_line(f, 1, f"__slots__ = {tuple(slots)}")
+            # read and write with a plan that is cached per context, see BaseStruct.get_field_plan
+            if "def _get_filtered_attribute_list(" not in self.src_code \
+                    and all(union.has_static_layout() for union in self.field_unions):
+                self.write_line(f, 1, f"_static_layout = True")
 
             # handle more-than-one length attributes as properties, to keep it synced with the main one
             nr_args = int(self.struct.attrib.get("args", "1"))
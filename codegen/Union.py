@@ -39,6 +39,17 @@ class Union:
             if field_type in ("Pointer", "ArrayPointer", "ForEachPointer"):
                 return True
 
+    def has_static_layout(self):
+        """Check if the fields of this union only depend on the context, so they can be read with a cached plan"""
+        for field in self.members:
+            arg, template, arr1, arr2, (global_conditionals, local_conditionals), field_name, (field_type, field_type_access), _ = self.get_params(field, "instance")
+            # fields named version are copied to the context while reading, which changes the following fields
+            if local_conditionals or field_type == "template" or "version" in field_name:
+                return False
+            if any("instance" in str(param) for param in (arg, template, arr1, arr2) if param is not None):
+                return False
+        return True
+
     def append(self, member):
         self.members.append(member)
 
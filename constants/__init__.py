@@ -1,10 +1,15 @@
 import json
+import mmap
 import os
 import time
 import sys
+from collections.abc import Mapping
 from pkgutil import iter_modules
 from importlib import import_module
 from dataclasses import dataclass
+
+import numpy as np
+
 from root_path import root_dir
 
 dict_names = ("hashes", "mimes", "shaders")
@@ -49,38 +54,181 @@ class Shader:
 	# 	return f".{self.name.split(':')[2]}"
 
 
-class ConstantsProvider(dict):
-
-	def __init__(self):
-		super().__init__()
-
-		# iterate through the modules in the current package
-		package_dir = os.path.join(root_dir, "constants")
+class HashStore:
+	"""Read-only map of djb2 hash to name, memory mapped from a binary file
+
+	layout: uint32 count, count sorted uint32 hashes, count + 1 uint32 offsets into the utf-8 names blob, names blob
+	"""
+
+	def __init__(self, filepath, overlay=None):
+		# custom additions, these take priority over the stored names
+		self.overlay = overlay if overlay is not None else {}
+		with open(filepath, "rb") as f:
+			self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+		count = int(np.frombuffer(self.data, dtype=np.uint32, count=1)[0])
+		self.hashes = np.frombuffer(self.data, dtype=np.uint32, count=count, offset=4)
+		self.offsets = np.frombuffer(self.data, dtype=np.uint32, count=count + 1, offset=4 + 4 * count)
+		self.names_start = 4 + 4 * count + 4 * (count + 1)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+	def close(self):
+		"""Unmap the file, the arrays viewing it are dropped first so the mmap can be closed"""
+		if self.data is not None:
+			self.hashes = self.offsets = np.zeros(0, dtype=np.uint32)
+			self.data.close()
+			self.data = None
+
+	@staticmethod
+	def write(filepath, hashes):
+		"""Store the hashes dict in the binary layout"""
+		keys = np.array(sorted(hashes), dtype=np.uint32)
+		names = [hashes[int(h)].encode() for h in keys]
+		offsets = np.zeros(len(names) + 1, dtype=np.uint32)
+		np.cumsum([len(name) for name in names], out=offsets[1:])
+		with open(filepath, "wb") as f:
+			f.write(np.uint32(len(keys)).tobytes())
+			f.write(keys.tobytes())
+			f.write(offsets.tobytes())
+			f.write(b"".join(names))
+
+	def index(self, h):
+		if 0 <= h <= 0xFFFFFFFF:
+			i = int(self.hashes.searchsorted(h))
+			if i < len(self.hashes) and self.hashes[i] == h:
+				return i
+
+	def __contains__(self, h):
+		return h in self.overlay or self.index(h) is not None
+
+	def __getitem__(self, h):
+		if h in self.overlay:
+			return self.overlay[h]
+		i = self.index(h)
+		if i is None:
+			raise KeyError(h)
+		return self.name_at(i)
+
+	def name_at(self, i):
+		start = self.names_start + int(self.offsets[i])
+		end = self.names_start + int(self.offsets[i + 1])
+		return self.data[start:end].decode()
+
+	def lookup(self, hashes):
+		"""Returns a dict with the names of those hashes that are in the store, searching all of them at once"""
+		hashes = np.asarray(hashes, dtype=np.uint32)
+		names = {}
+		if len(self.hashes):
+			indices = self.hashes.searchsorted(hashes)
+			found = self.hashes[np.minimum(indices, len(self.hashes) - 1)] == hashes
+			names = {int(h): self.name_at(int(i)) for h, i in zip(hashes[found], indices[found])}
+		names.update({h: self.overlay[h] for h in hashes.tolist() if h in self.overlay})
+		return names
+
+	def get(self, h, default=None):
+		return self[h] if h in self else default
+
+	def __len__(self):
+		return len(self.hashes) + sum(self.index(h) is None for h in self.overlay)
+
+
+class GameConstants(Mapping):
+	"""The hashes, mimes and shaders of one game, each is loaded on first access"""
+
+	def __init__(self, game, game_dir):
+		self.game = game
+		self.game_dir = game_dir
+		# the tables that were accessed so far
+		self.loaded = {}
+
+	def __contains__(self, dict_name):
+		return dict_name in dict_names
+
+	def __iter__(self):
+		return iter(dict_names)
+
+	def __len__(self):
+		return len(dict_names)
+
+	def __getitem__(self, dict_name):
+		if dict_name not in dict_names:
+			raise KeyError(dict_name)
+		if dict_name not in self.loaded:
+			self.loaded[dict_name] = self.load(dict_name)
+		return self.loaded[dict_name]
+
+	def load(self, dict_name):
+		store_path = os.path.join(self.game_dir, "hashes.bin")
+		use_store = dict_name == "hashes" and os.path.isfile(store_path)
+		table = {}
+		for (_, module_name, _) in iter_modules([self.game_dir]):
+			# make sure the right variable is accessed
+			if dict_name in module_name:
+				# the store replaces the generated hashes module, but not the custom additions
+				if use_store and module_name == dict_name:
+					continue
+				module = import_module(f"constants.{self.game}.{module_name}")
+				# update the dict so we can easily have custom additions
+				table.update(getattr(module, dict_name))
+		if use_store:
+			return HashStore(store_path, overlay=table)
+		return table
+
+	def close(self):
+		"""Release the loaded tables, they are loaded again on the next access"""
+		for table in self.loaded.values():
+			if isinstance(table, HashStore):
+				table.close()
+		self.loaded.clear()
+
+
+class ConstantsProvider(Mapping):
+	"""Constants per game, a game's modules are only imported when its constants are first accessed"""
+
+	def __init__(self, package_dir=os.path.join(root_dir, "constants")):
+		# find the game packages in the current package
+		self.game_dirs = {}
 		for game in os.listdir(package_dir):
 			game_dir = os.path.join(package_dir, game)
 			# ignore that
 			if "pycache" in game:
 				continue
 			if os.path.isdir(game_dir):
-				self[game] = {}
-				for dict_name in dict_names:
-					self[game][dict_name] = {}
-				for (_, module_name, _) in iter_modules([game_dir]):
-					# import the module and iterate through its attributes
-					module = import_module(f"constants.{game}.{module_name}")
-					for dict_name in dict_names:
-						# make sure the right variable is accessed
-						if dict_name in module_name:
-							# update the dict so we can easily have custom additions
-							self[game][dict_name].update(getattr(module, dict_name))
+				self.game_dirs[game] = game_dir
+		# the games that were accessed so far
+		self.loaded = {}
 
-	@property
-	def extractables(self):
-		return [ext for ext, loader in self.items() if loader.can_extract]
+	def __contains__(self, game):
+		return game in self.game_dirs
 
-	@property
-	def ignore_types(self):
-		return [ext for ext, loader in self.items() if not loader.can_extract]
+	def __iter__(self):
+		return iter(self.game_dirs)
+
+	def __len__(self):
+		return len(self.game_dirs)
+
+	def __getitem__(self, game):
+		if game not in self.game_dirs:
+			raise KeyError(game)
+		if game not in self.loaded:
+			self.loaded[game] = GameConstants(game, self.game_dirs[game])
+		return self.loaded[game]
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+	def close(self):
+		"""Unmap the hash stores of all games, the constants stay usable and are loaded again when accessed"""
+		for game_constants in self.loaded.values():
+			game_constants.close()
+		self.loaded.clear()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,84 @@
+# Memory benchmark for the generated structs
+# loads an ovl with all its loaders collected and reports how many bytes each struct instance takes,
+# as it is now and as it would be without __slots__, ie. with a __dict__ per instance
+
+# run: struct_memory.py file.ovl [top]
+# use a motiongraph or specdef heavy ovl, those hold the most structs
+import gc
+import os
+import sys
+import time
+import logging
+import tracemalloc
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ovl_util.logs import addLoggingLevel
+
+addLoggingLevel('SUCCESS', logging.INFO + 5)
+
+from generated.base_struct import BaseStruct, instance_attributes
+from generated.formats.ovl import OvlFile
+
+# classes without slots, to measure the same attributes in a __dict__
+dict_classes = {}
+
+
+def struct_size(instance):
+	"""Returns the bytes used by the instance and its __dict__, without the field values"""
+	size = sys.getsizeof(instance)
+	if hasattr(instance, "__dict__"):
+		size += sys.getsizeof(instance.__dict__)
+	return size
+
+
+def dict_size(instance):
+	"""Returns the bytes the instance would use if its attributes were stored in a __dict__"""
+	cls = type(instance)
+	if cls not in dict_classes:
+		dict_classes[cls] = type(cls.__name__, (), {})
+	shadow = dict_classes[cls]()
+	for name, value in instance_attributes(instance).items():
+		setattr(shadow, name, value)
+	return struct_size(shadow)
+
+
+def measure(ovl_path, top=20):
+	tracemalloc.start()
+	start = time.time()
+	ovl = OvlFile()
+	ovl.load(ovl_path)
+	duration = time.time() - start
+	allocated, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	counts = defaultdict(int)
+	sizes = defaultdict(int)
+	dict_sizes = defaultdict(int)
+	for obj in gc.get_objects():
+		if isinstance(obj, BaseStruct):
+			cls = type(obj)
+			counts[cls] += 1
+			sizes[cls] += struct_size(obj)
+			dict_sizes[cls] += dict_size(obj)
+	total = sum(counts.values())
+	if not total:
+		print(f"No structs in {ovl_path}")
+		return
+	print(f"Loaded {ovl_path} in {duration:.2f} s, {allocated / 1024 ** 2:.1f} MB allocated, peak {peak / 1024 ** 2:.1f} MB")
+	print(f"{total} structs of {len(counts)} classes, {sum(cls.__dict__.get('__slots__') is not None for cls in counts)} with __slots__")
+	print(f"{'class':<40}{'count':>10}{'bytes/struct':>14}{'with __dict__':>15}")
+	for cls in sorted(counts, key=lambda c: sizes[c], reverse=True)[:top]:
+		print(f"{cls.__name__:<40}{counts[cls]:>10}{sizes[cls] / counts[cls]:>14.1f}{dict_sizes[cls] / counts[cls]:>15.1f}")
+	now = sum(sizes.values())
+	before = sum(dict_sizes.values())
+	print(f"{'total':<40}{total:>10}{now / total:>14.1f}{before / total:>15.1f}")
+	print(f"{(before - now) / 1024 ** 2:.1f} MB saved by __slots__")
+	ovl.close()
+
+
+if __name__ == '__main__':
+	if len(sys.argv) < 2:
+		print("run: struct_memory.py file.ovl [top]")
+		sys.exit(1)
+	measure(sys.argv[1], *(int(arg) for arg in sys.argv[2:3]))
@@ -1,11 +1,14 @@
 import contextlib
+import io
 import logging
+import struct
 import xml.etree.ElementTree as ET
 
 import numpy as np
 
 from generated.array import Array
 from generated.context import ContextReference
+from generated.io import ViewStream
 
 # these attributes present on the MemStruct will not be stored on the XML
 SKIPS = ("_context", "arg", "name", "io_start", "io_size", "template")
@@ -13,6 +16,23 @@ DTYPE = "dtype"
 DO_NOT_SERIALIZE = "_"
 INDENT_CHAR = " "
 INDENT_COUNT = 3
+# numpy record class for each struct class, see get_np_sig
+_np_records = {}
+# FieldPlan for each struct class and context key, see get_field_plan
+_field_plans = {}
+# the number of contexts a struct class caches plans for, beyond that it falls back to the filtered attribute list
+MAX_FIELD_PLANS = 16
+
+
+def instance_attributes(instance):
+    """Returns the attributes of instance, whether they are stored in slots or in its __dict__"""
+    attributes = {}
+    for cls in reversed(type(instance).__mro__):
+        for slot in cls.__dict__.get("__slots__", ()):
+            if hasattr(instance, slot):
+                attributes[slot] = getattr(instance, slot)
+    attributes.update(getattr(instance, "__dict__", {}))
+    return attributes
 
 
 class StructMetaClass(type):
@@ -58,8 +78,80 @@ class struct_record(np.record):
             return value
 
 
+def context_key(context):
+    """Returns a hashable key for the current state of context, or None if it has no simple state"""
+    key = [type(context)]
+    for value in getattr(context, "__dict__", {}).values():
+        if not isinstance(value, (int, float, str)):
+            # eg. bitfields
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                return None
+        key.append(value)
+    return tuple(key)
+
+
+class FieldPlan:
+    """The fields a struct reads and writes for one context, with runs of basic fields fused into one Struct"""
+
+    def __init__(self, attributes):
+        # each step is a Struct with a tuple of field names, or a type with a field name and its arguments
+        self.steps = []
+        run = []
+        for f_name, f_type, arguments, _ in attributes:
+            # only the basic classes themselves, subclasses such as OffsetString read differently
+            if isinstance(f_type, type) and f_type.__dict__.get("struct_format"):
+                run.append((f_name, f_type.struct_format))
+                continue
+            self.add_run(run)
+            run = []
+            self.steps.append((f_type, f_name, arguments))
+        self.add_run(run)
+
+    def add_run(self, run):
+        if run:
+            names, formats = zip(*run)
+            # all basic formats are little endian without padding
+            fused = struct.Struct("<" + "".join(fmt.lstrip("<") for fmt in formats))
+            self.steps.append((fused, names, None))
+
+    def read(self, cls, stream, instance):
+        context = instance.context
+        # buffer mode, unpack in place at the cursor
+        in_place = type(stream) is ViewStream
+        for f_type, f_name, arguments in self.steps:
+            try:
+                if arguments is None:
+                    if in_place:
+                        values = f_type.unpack_from(stream.view, stream.pos)
+                        stream.pos += f_type.size
+                    else:
+                        values = f_type.unpack(stream.read(f_type.size))
+                    for name, value in zip(f_name, values):
+                        setattr(instance, name, value)
+                else:
+                    setattr(instance, f_name, f_type.from_stream(stream, context, *arguments))
+            except:
+                raise BufferError(f"Failed reading '{cls.__name__}.{f_name}' at {stream.tell()}")
+
+    def write(self, cls, stream, instance):
+        context = instance.context
+        for f_type, f_name, arguments in self.steps:
+            try:
+                if arguments is None:
+                    stream.write(f_type.pack(*[getattr(instance, name) for name in f_name]))
+                else:
+                    f_type.to_stream(getattr(instance, f_name), stream, context, *arguments)
+            except:
+                raise BufferError(f"Failed writing '{cls.__name__}.{f_name}' at {stream.tell()}")
+
+
 class BaseStruct(metaclass=StructMetaClass):
 
+    # generated structs declare their fields as slots, the others keep a __dict__
+    __slots__ = ()
+
     context = ContextReference()
 
     _attribute_list = ()
@@ -155,21 +247,35 @@ class BaseStruct(metaclass=StructMetaClass):
         for attr, value in elem.attrib.items():
             if attr not in set_fields:
                 # logging.debug(f"Adding string metadata '{attr} = {value}' from XML element '{elem.tag}'")
-                setattr(instance, attr, value)
+                try:
+                    setattr(instance, attr, value)
+                except AttributeError:
+                    # structs with slots have no room for it, see slots="false" in codegen/README.md
+                    logging.warning(f"Dropped metadata '{attr} = {value}' from XML element '{elem.tag}', "
+                                    f"{cls.__name__} has slots")
         return instance
 
     @classmethod
     @contextlib.contextmanager
     def to_xml_file(cls, instance, file_path, debug=False):
         """Create an xml elem representing this MemStruct, recursively set its data, indent and save to 'file_path'"""
+        with io.BytesIO() as stream:
+            with cls.to_xml_stream(instance, stream, debug) as xml:
+                yield xml
+            with open(file_path, 'wb') as outfile:
+                outfile.write(stream.getbuffer())
+
+    @classmethod
+    @contextlib.contextmanager
+    def to_xml_stream(cls, instance, stream, debug=False):
+        """Create an xml elem representing this MemStruct, recursively set its data, indent and write to 'stream'"""
         xml = ET.Element(cls.__name__)
         cls._to_xml(instance, xml, debug)
         if hasattr(instance.context, "context_to_xml"):
             instance.context.context_to_xml(xml, "game", instance.context, 0, None, debug)
         yield xml
         indent(xml)
-        with open(file_path, 'wb') as outfile:
-            outfile.write(ET.tostring(xml))
+        stream.write(ET.tostring(xml))
 
     @classmethod
     def to_xml(cls, elem, prop, instance, arg, template, debug):
@@ -181,7 +287,7 @@ class BaseStruct(metaclass=StructMetaClass):
     @classmethod
     def _to_xml(cls, instance, elem, debug):
         # add any meta-data that is not directly part of the struct generated by the codegen
-        for prop, val in vars(instance).items():
+        for prop, val in instance_attributes(instance).items():
             if "name" in prop and isinstance(val, str) and val:
                 # logging.debug(f"Adding string metadata '{prop} = {val}' to XML element '{elem.tag}'")
                 elem.attrib[prop] = val
@@ -199,8 +305,41 @@ class BaseStruct(metaclass=StructMetaClass):
             if field_value is not None:
                 f_type.to_xml(elem, f_name, field_value, *arguments, debug)
 
+    @classmethod
+    def has_static_layout(cls):
+        """Check if the fields of cls and its parents only depend on the context, as marked by the codegen"""
+        static = cls.__dict__.get("_static_layout_all")
+        if static is None:
+            static = all(base.__dict__.get("_static_layout", False)
+                         for base in cls.__mro__ if issubclass(base, BaseStruct) and base is not BaseStruct)
+            cls._static_layout_all = static
+        return static
+
+    @classmethod
+    def get_field_plan(cls, instance):
+        """Returns the cached FieldPlan of cls for the context of instance, or None if cls can't use one"""
+        if not cls.has_static_layout():
+            return None
+        key = context_key(instance.context)
+        if key is None:
+            return None
+        plans = _field_plans.get(cls)
+        if plans is None:
+            plans = _field_plans[cls] = {}
+        plan = plans.get(key)
+        if plan is None:
+            if len(plans) >= MAX_FIELD_PLANS:
+                # the context holds more than versions, don't grow the cache for every new state
+                return None
+            plan = plans[key] = FieldPlan(cls._get_filtered_attribute_list(instance, include_abstract=False))
+        return plan
+
     @classmethod
     def read_fields(cls, stream, instance):
+        plan = cls.get_field_plan(instance)
+        if plan is not None:
+            plan.read(cls, stream, instance)
+            return
         for f_name, f_type, arguments, _ in cls._get_filtered_attribute_list(instance, include_abstract=False):
             try:
                 setattr(instance, f_name, f_type.from_stream(stream, instance.context, *arguments))
@@ -213,6 +352,10 @@ class BaseStruct(metaclass=StructMetaClass):
 
     @classmethod
     def write_fields(cls, stream, instance):
+        plan = cls.get_field_plan(instance)
+        if plan is not None:
+            plan.write(cls, stream, instance)
+            return
         for f_name, f_type, arguments, _ in cls._get_filtered_attribute_list(instance, include_abstract=False):
             try:
                 f_type.to_stream(getattr(instance, f_name), stream, instance.context, *arguments)
@@ -307,8 +450,8 @@ class BaseStruct(metaclass=StructMetaClass):
                         cls.from_value = from_value
             # check if all of the class's attributes have a from_value function
             if getattr(cls, "allow_np", False) and all(
-                    # check for a struct with get_np_dtype and flag set to True
-                    callable(getattr(attr_type, "get_np_dtype", None)) or
+                    # check for a struct with get_np_dtype whose own arrays are numpy arrays
+                    (callable(getattr(attr_type, "get_np_dtype", None)) and callable(getattr(attr_type, "read_array", None))) or
                     # or a basic numeric type
                     getattr(attr_type, "np_dtype", None)
                     for attr_type in attr_types):
@@ -327,10 +470,29 @@ class BaseStruct(metaclass=StructMetaClass):
                 if free_function("write_array"):
                     def write_array(instance, stream):
                         # todo - do type conversion, cf. basic.py
+                        if isinstance(instance, Array):
+                            # eg. filled member by member, write it the same way
+                            instance.write(stream)
+                            return
                         assert isinstance(instance, np.ndarray)
                         # np_dtype = cls.get_np_dtype(context, arg, template)
                         stream.write(instance.tobytes())
                     cls.write_array = write_array
+                if free_function("_to_xml_array"):
+                    def _to_xml_array(instance, elem, debug):
+                        # same layout as Array._to_xml, one sub-element per record
+                        dtype_name = cls.__name__.lower()
+                        for member in instance.flat:
+                            cls.to_xml(elem, dtype_name, member, 0, None, debug)
+                    cls._to_xml_array = _to_xml_array
+                if free_function("_from_xml_array"):
+                    def _from_xml_array(instance, elem):
+                        # records write their fields into the array
+                        array = cls.create_array((len(elem),))
+                        for member, sub in zip(array, elem):
+                            cls._from_xml(member, sub)
+                        return array
+                    cls._from_xml_array = _from_xml_array
 
     @classmethod
     def _get_attribute_list(cls):
@@ -433,9 +595,12 @@ class BaseStruct(metaclass=StructMetaClass):
                 else:
                     # instance is fake anyway so don't try to get a child struct
                     res.append((f_name, f_type.get_np_sig(instance)))
-        # dynamically subclass to get np.record behavior
-        # it does not work when dtype is not a subclass of struct_record
-        record = type(f"{cls.__name__}Record", (cls, struct_record), {})
+        record = _np_records.get(cls)
+        if record is None:
+            # dynamically subclass to get np.record behavior
+            # it does not work when dtype is not a subclass of struct_record
+            # create it once per struct, instead of a new class for every array that is read
+            record = _np_records[cls] = type(f"{cls.__name__}Record", (cls, struct_record), {})
         return record, res
 
     @classmethod
@@ -6,6 +6,8 @@ class AccountCustomisationRoot(MemStruct):
 
 	__name__ = 'AccountCustomisationRoot'
 
+	__slots__ = ('customization_uuid', 'customization_name', 'customization_description', 'customization_id')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
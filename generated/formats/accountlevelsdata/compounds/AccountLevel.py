@@ -6,6 +6,7 @@ class AccountLevel(MemStruct):
 
 	__name__ = 'AccountLevel'
 
+	__slots__ = ('level_id', 'level_list', 'level_count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
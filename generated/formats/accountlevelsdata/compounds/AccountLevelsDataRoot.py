@@ -6,6 +6,7 @@ class AccountLevelsDataRoot(MemStruct):
 
 	__name__ = 'AccountLevelsDataRoot'
 
+	__slots__ = ('account_level_version', 'account_level_list', 'account_level_count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class ResearchLevel(MemStruct):
 
 	__name__ = 'ResearchLevel'
 
+	__slots__ = ('level_name', 'next_levels', 'next_level_count', 'children', 'children_count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class AssetPack(MemStruct):
 
 	__name__ = 'AssetPack'
 
+	__slots__ = ('asset_pack_name', 'asset_pack_ui_name', 'asset_pack_ui_description', 'asset_pack_asset_package', 'asset_pack_list_flags_1', 'asset_pack_list_flags_2')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
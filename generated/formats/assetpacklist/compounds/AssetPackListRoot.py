@@ -6,6 +6,7 @@ class AssetPackListRoot(MemStruct):
 
 	__name__ = 'AssetPackListRoot'
 
+	__slots__ = ('asset_pack_list_version', 'asset_pack_list_list', 'asset_pack_list_count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
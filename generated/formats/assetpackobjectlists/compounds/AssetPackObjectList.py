@@ -6,6 +6,7 @@ class AssetPackObjectList(MemStruct):
 
 	__name__ = 'AssetPackObjectList'
 
+	__slots__ = ('asset_pack_object_list_name', 'asset_pack_object_list_items', 'asset_pack_object_list_count', 'asset_pack_object_list_unknown_1', 'asset_pack_object_list_unknown_2')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class AssetPackObjectListsRoot(MemStruct):
 
 	__name__ = 'AssetPackObjectListsRoot'
 
+	__slots__ = ('asset_pack_object_lists_list', 'asset_pack_object_lists_count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class AssetpkgRoot(MemStruct):
 
 	__name__ = 'AssetpkgRoot'
 
+	__slots__ = ('asset_path', '_zero')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,7 @@ class Vector3Ushort(BaseStruct):
 
 	__name__ = 'Vector3Ushort'
 
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
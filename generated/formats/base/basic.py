@@ -2,7 +2,7 @@ from ast import literal_eval
 import numpy as np
 from struct import Struct
 from generated.array import Array
-from generated.io import MAX_LEN
+from generated.io import MAX_LEN, ViewStream
 
 
 def class_from_struct(struct, from_value_func):
@@ -10,7 +10,9 @@ def class_from_struct(struct, from_value_func):
 	base_value = from_value_func(0)
 	pack = struct.pack
 	unpack = struct.unpack
+	unpack_from = struct.unpack_from
 	size = struct.size
+	view_stream = ViewStream
 	# these functions are used for efficient read/write of arrays
 	empty = np.empty
 	dtype = np.dtype(struct.format)
@@ -18,6 +20,8 @@ def class_from_struct(struct, from_value_func):
 	class ConstructedClass:
 
 		np_dtype = dtype
+		# runs of basic fields are read with one struct, see BaseStruct.get_field_plan
+		struct_format = struct.format
 
 		def __new__(cls, context=None, arg=0, template=None):
 			return base_value
@@ -26,6 +30,11 @@ def class_from_struct(struct, from_value_func):
 
 		@staticmethod
 		def from_stream(stream, context=None, arg=0, template=None):
+			# buffer mode, unpack in place at the cursor
+			if type(stream) is view_stream:
+				value = unpack_from(stream.view, stream.pos)[0]
+				stream.pos += size
+				return value
 			return unpack(stream.read(size))[0]
 
 		@staticmethod
@@ -110,21 +119,65 @@ Hfloat = class_from_struct(Struct("<e"), float)
 
 
 # @staticmethod
-def r_zstr(rfunc):
-	i = 0
-	val = b''
-	char = b''
-	while char != b'\x00':
-		i += 1
-		if i > MAX_LEN:
+def r_zstr(stream):
+	"""Read a zstring from stream, reading ahead in growing chunks and seeking back behind the terminator"""
+	chunks = []
+	length = 0
+	chunk_size = 64
+	while True:
+		chunk = stream.read(chunk_size)
+		if not chunk:
+			raise ValueError('Reached end of file before end of zstring')
+		i = chunk.find(b'\x00')
+		if i > -1:
+			break
+		chunks.append(chunk)
+		length += len(chunk)
+		if length >= MAX_LEN:
 			raise ValueError(f'string too long')
-		val += char
-		char = rfunc(1)
-		if not char:
+		chunk_size *= 2
+	if length + i >= MAX_LEN:
+		raise ValueError(f'string too long')
+	# the stream is now ahead of the terminator
+	stream.seek(i + 1 - len(chunk), 1)
+	if chunks:
+		chunks.append(chunk[:i])
+		return b''.join(chunks).decode(errors="surrogateescape")
+	return chunk[:i].decode(errors="surrogateescape")
+
+
+def r_zstr_view(stream):
+	"""Read a zstring at the cursor of a ViewStream, searching the terminator in growing chunks of the buffer"""
+	view = stream.view
+	start = end = stream.pos
+	chunk_size = 64
+	while True:
+		chunk = view[end:end + chunk_size].tobytes()
+		if not chunk:
 			raise ValueError('Reached end of file before end of zstring')
+		i = chunk.find(b'\x00')
+		if i > -1:
+			end += i
+			break
+		end += len(chunk)
+		if end - start >= MAX_LEN:
+			raise ValueError(f'string too long')
+		chunk_size *= 2
+	if end - start >= MAX_LEN:
+		raise ValueError(f'string too long')
+	stream.pos = end + 1
+	# usually the string fits into the first chunk
+	val = chunk[:i] if end - start == i else view[start:end].tobytes()
 	return val.decode(errors="surrogateescape")
 
 
+def read_zstr(stream):
+	"""Read a zstring from stream, in place if it is a ViewStream"""
+	if type(stream) is ViewStream:
+		return r_zstr_view(stream)
+	return r_zstr(stream)
+
+
 # @staticmethod
 def w_zstr(wfunc, val):
 	wfunc(val.encode(errors="surrogateescape"))
@@ -138,7 +191,7 @@ class ZString:
 
 	@staticmethod
 	def from_stream(stream, context=None, arg=0, template=None):
-		return r_zstr(stream.read)
+		return read_zstr(stream)
 
 	@staticmethod
 	def to_stream(instance, stream, context=None, arg=0, template=None):
@@ -9,6 +9,7 @@ class FixedString(BaseStruct):
 
 	__name__ = 'FixedString'
 
+	_static_layout = True
 
 	@classmethod
 	def _get_attribute_list(cls):
@@ -29,6 +29,7 @@ class PadAlign(BaseStruct):
 
 	__name__ = 'PadAlign'
 
+	_static_layout = True
 
 	@classmethod
 	def _get_attribute_list(cls):
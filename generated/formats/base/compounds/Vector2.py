@@ -10,6 +10,8 @@ class Vector2(BaseStruct):
 
 	__name__ = 'Vector2'
 
+	allow_np = True
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
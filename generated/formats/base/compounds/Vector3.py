@@ -10,6 +10,8 @@ class Vector3(BaseStruct):
 
 	__name__ = 'Vector3'
 
+	__slots__ = ('name', '_context', 'arg', 'template', 'io_size', 'io_start', 'x', 'y', 'z')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
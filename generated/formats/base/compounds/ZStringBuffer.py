@@ -18,6 +18,7 @@ class ZStringBuffer(BaseStruct):
 
 	__name__ = 'ZStringBuffer'
 
+	_static_layout = True
 
 	@classmethod
 	def _get_attribute_list(cls):
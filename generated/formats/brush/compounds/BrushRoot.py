@@ -10,6 +10,8 @@ class BrushRoot(MemStruct):
 
 	__name__ = 'BrushRoot'
 
+	__slots__ = ('_zero', 'num_pixels', 'x', 'y')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class BuildingBiomeData(MemStruct):
 
 	__name__ = 'BuildingBiomeData'
 
+	__slots__ = ('layer', 'name_1', 'name_2', 'padding')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
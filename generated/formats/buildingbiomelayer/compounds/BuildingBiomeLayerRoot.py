@@ -6,6 +6,7 @@ class BuildingBiomeLayerRoot(MemStruct):
 
 	__name__ = 'BuildingBiomeLayerRoot'
 
+	__slots__ = ('set_id_name', 'layer_data', 'count', 'unk_2_found_as_0')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
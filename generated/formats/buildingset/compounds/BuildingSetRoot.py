@@ -6,6 +6,8 @@ class BuildingSetRoot(MemStruct):
 
 	__name__ = 'BuildingSetRoot'
 
+	__slots__ = ('set_id_name', 'set_count_or_type', 'unk_1_found_as_0', 'unk_2_found_as_0')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
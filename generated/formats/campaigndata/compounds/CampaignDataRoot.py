@@ -6,6 +6,7 @@ class CampaignDataRoot(MemStruct):
 
 	__name__ = 'CampaignDataRoot'
 
+	__slots__ = ('campaign_name', 'campaign_description', 'campaign_unknown', 'chapter_list', 'chapter_count', 'chapter_unknown')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
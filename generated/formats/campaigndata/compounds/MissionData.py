@@ -6,6 +6,8 @@ class MissionData(MemStruct):
 
 	__name__ = 'MissionData'
 
+	__slots__ = ('dependency_name',)
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
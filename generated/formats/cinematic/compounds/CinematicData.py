@@ -6,6 +6,7 @@ class CinematicData(MemStruct):
 
 	__name__ = 'CinematicData'
 
+	__slots__ = ('default_name', 'next_levels', 'next_level_count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
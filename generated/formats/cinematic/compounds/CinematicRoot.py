@@ -6,6 +6,8 @@ class CinematicRoot(MemStruct):
 
 	__name__ = 'CinematicRoot'
 
+	__slots__ = ('u_0', 'u_1', 'data')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
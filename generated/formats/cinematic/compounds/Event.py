@@ -10,6 +10,8 @@ class Event(MemStruct):
 
 	__name__ = 'Event'
 
+	__slots__ = ('start_time', 'b', 'module_name', 'attributes', 'duration', 'd')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
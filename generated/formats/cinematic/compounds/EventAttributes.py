@@ -10,6 +10,8 @@ class EventAttributes(MemStruct):
 
 	__name__ = 'EventAttributes'
 
+	__slots__ = ('anim_name', 'event_name', 'empty_string')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,8 @@ class State(MemStruct):
 
 	__name__ = 'State'
 
+	__slots__ = ('abstract_name', 'concrete_name', 'prefab_name', 'a', 'b', 'c', 'events_list', 'd')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
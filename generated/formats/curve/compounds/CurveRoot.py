@@ -6,6 +6,7 @@ class CurveRoot(MemStruct):
 
 	__name__ = 'CurveRoot'
 
+	__slots__ = ('keys', 'count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class Key(MemStruct):
 
 	__name__ = 'Key'
 
+	__slots__ = ('time', 'value')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class Dxt10Header(BaseStruct):
 
 	__name__ = 'DXT10Header'
 
+	__slots__ = ('name', '_context', 'arg', 'template', 'io_size', 'io_start', 'dxgi_format', 'resource_dimension', 'misc_flag', 'num_tiles', 'misc_flag_2')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
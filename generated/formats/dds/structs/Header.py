@@ -7,6 +7,7 @@ class Header(BaseStruct):
 
 	__name__ = 'Header'
 
+	__slots__ = ('name', '_context', 'arg', 'template', 'io_size', 'io_start', 'header_string', 'size', 'flags', 'height', 'width', 'linear_size', 'depth', 'mipmap_count', 'reserved_1', 'pixel_format', 'caps_1', 'caps_2', 'caps_3', 'caps_4', 'unused', 'dx_10')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class PixelFormat(BaseStruct):
 
 	__name__ = 'PixelFormat'
 
+	__slots__ = ('name', '_context', 'arg', 'template', 'io_size', 'io_start', 'size', 'flags', 'four_c_c', 'bit_count', 'r_mask', 'g_mask', 'b_mask', 'a_mask')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
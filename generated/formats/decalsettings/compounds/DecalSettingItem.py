@@ -6,6 +6,8 @@ class DecalSettingItem(MemStruct):
 
 	__name__ = 'DecalSettingItem'
 
+	__slots__ = ('layer_name',)
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
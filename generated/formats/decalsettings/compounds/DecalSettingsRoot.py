@@ -6,6 +6,7 @@ class DecalSettingsRoot(MemStruct):
 
 	__name__ = 'DecalSettingsRoot'
 
+	__slots__ = ('atlas_name', 'layer_list', 'layer_count', 'unknown')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -7,6 +7,8 @@ class DinoEffectsHeader(CommonHeader):
 
 	__name__ = 'DinoEffectsHeader'
 
+	__slots__ = ('vec_0', 'vec_1', 'a', 'b', 'vec_2', 'vec_3', 'vec_4', 'vec_5', 'c', 'd', 'floats_1', 'e', 'floats_2', 'f', 'floats_3', 'g', 'floats_4', 'h', 'floats_5', 'i', 'float')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
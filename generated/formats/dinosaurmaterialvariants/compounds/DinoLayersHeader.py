@@ -6,6 +6,7 @@ class DinoLayersHeader(CommonHeader):
 
 	__name__ = 'DinoLayersHeader'
 
+	__slots__ = ('layers', 'layer_count', 'zero')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
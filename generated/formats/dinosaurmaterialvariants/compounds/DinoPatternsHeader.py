@@ -6,6 +6,7 @@ class DinoPatternsHeader(CommonHeader):
 
 	__name__ = 'DinoPatternsHeader'
 
+	__slots__ = ('set_count', 'set_name', 'patterns', 'pattern_count', 'zero')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class DinoVariantsHeader(CommonHeader):
 
 	__name__ = 'DinoVariantsHeader'
 
+	__slots__ = ('has_sets', 'set_name', 'variants', 'variant_count', 'zero')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
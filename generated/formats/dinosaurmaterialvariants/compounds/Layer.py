@@ -6,6 +6,8 @@ class Layer(MemStruct):
 
 	__name__ = 'Layer'
 
+	__slots__ = ('increment_channel', 'texture_fgm_name', 'transform_fgm_name')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class Vector3F(MemStruct):
 
 	__name__ = 'Vector3f'
 
+	__slots__ = ('x', 'y', 'z')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class DLCEntitlementsRoot(MemStruct):
 
 	__name__ = 'DLCEntitlementsRoot'
 
+	__slots__ = ('entitlement_list', 'entitlement_count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
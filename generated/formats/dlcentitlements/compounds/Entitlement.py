@@ -6,6 +6,7 @@ class Entitlement(MemStruct):
 
 	__name__ = 'Entitlement'
 
+	__slots__ = ('entitlement_name', 'id', 'reward_list', 'reward_count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class EnumnamerRoot(MemStruct):
 
 	__name__ = 'EnumnamerRoot'
 
+	__slots__ = ('count', 'strings')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
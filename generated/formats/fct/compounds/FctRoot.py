@@ -11,6 +11,8 @@ class FctRoot(MemStruct):
 
 	__name__ = 'FctRoot'
 
+	__slots__ = ('u_0', 'u_1', 'a', 'b', 'c', 'minus_1', 'z_0', 'z_1', 'z_2', 'offset', 'fonts')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,8 @@ class Font(MemStruct):
 
 	__name__ = 'Font'
 
+	__slots__ = ('data_size', 'zero')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
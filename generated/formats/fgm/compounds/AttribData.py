@@ -7,6 +7,7 @@ class AttribData(MemStruct):
 
 	__name__ = 'AttribData'
 
+	__slots__ = ('value',)
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
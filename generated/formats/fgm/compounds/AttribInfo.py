@@ -10,6 +10,8 @@ class AttribInfo(GenericInfo):
 
 	__name__ = 'AttribInfo'
 
+	__slots__ = ('_value_offset',)
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,8 @@ class Color(MemStruct):
 
 	__name__ = 'Color'
 
+	__slots__ = ('r', 'g', 'b', 'a')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
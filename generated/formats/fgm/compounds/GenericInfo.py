@@ -6,6 +6,8 @@ class GenericInfo(MemStruct):
 
 	__name__ = 'GenericInfo'
 
+	__slots__ = ('_name_offset', 'dtype')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,8 @@ class TexIndex(MemStruct):
 
 	__name__ = 'TexIndex'
 
+	__slots__ = ('_tex_index', 'array_index')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
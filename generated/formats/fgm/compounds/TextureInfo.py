@@ -11,6 +11,7 @@ class TextureInfo(GenericInfo):
 
 	__name__ = 'TextureInfo'
 
+	__slots__ = ('value', 'some_index_0', 'some_index_1')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
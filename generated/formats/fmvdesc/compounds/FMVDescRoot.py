@@ -6,6 +6,8 @@ class FMVDescRoot(MemStruct):
 
 	__name__ = 'FMVDescRoot'
 
+	__slots__ = ('asset_path', '_zero_01', '_zero_02', 'unk_65', 'speed', '_zero_03', '_zero_04', '_zero_05', '_zero_06')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class ContextSet1Item(MemStruct):
 
 	__name__ = 'ContextSet1Item'
 
+	__slots__ = ('stuff_1_name', 'stuff_11_sub', 'stuff_11_sub_count', 'stuff_12_sub', 'stuff_12_sub_count', 'stuff_13_sub', 'stuff_13_sub_count', 'stuff_14_sub_name', 'stuff_15_sub_name', 'stuff_1_unknown_1', 'stuff_1_unknown_2')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
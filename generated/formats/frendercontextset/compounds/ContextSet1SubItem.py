@@ -6,6 +6,8 @@ class ContextSet1SubItem(MemStruct):
 
 	__name__ = 'ContextSet1SubItem'
 
+	__slots__ = ('stuff_1_sub_name', 'stuff_1_sub_order_or_flags')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class ContextSet2Item(MemStruct):
 
 	__name__ = 'ContextSet2Item'
 
+	__slots__ = ('stuff_2_name', 'stuff_2_id')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class ContextSet3Item(MemStruct):
 
 	__name__ = 'ContextSet3Item'
 
+	__slots__ = ('stuff_3_name_1', 'stuff_3_sub', 'stuff_3_id_allways_1')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
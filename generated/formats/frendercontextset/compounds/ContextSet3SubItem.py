@@ -6,6 +6,8 @@ class ContextSet3SubItem(MemStruct):
 
 	__name__ = 'ContextSet3SubItem'
 
+	__slots__ = ('stuff_31_name_1', 'stuff_31_name_2', 'stuff_31_name_3', 'stuff_31_id_allways_0')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
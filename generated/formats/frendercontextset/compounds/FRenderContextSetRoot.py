@@ -6,6 +6,7 @@ class FRenderContextSetRoot(MemStruct):
 
 	__name__ = 'FRenderContextSetRoot'
 
+	__slots__ = ('ptr_1_list', 'ptr_1_count', 'ptr_2_list', 'ptr_2_count', 'ptr_3_list', 'ptr_3_count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class FRenderFeatureSetRoot(MemStruct):
 
 	__name__ = 'FRenderFeatureSetRoot'
 
+	__slots__ = ('featureset_list', 'featureset_count', 'unknown_always_1')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class FRenderLodSpecRoot(MemStruct):
 
 	__name__ = 'FRenderLodSpecRoot'
 
+	__slots__ = ('spec_list', 'spec_count', 'unknown')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class LodSpecItem(MemStruct):
 
 	__name__ = 'LodSpecItem'
 
+	__slots__ = ('group_name', 'unknown_1', 'max_model_bounding_sphere_radius', 'flags_1', 'flags_2', 'lod_point_0', 'lod_point_1', 'lod_point_2', 'lod_point_3', 'lod_point_4', 'pixel_size_off', 'unknown_2', 'unknown_3', 'unknown_4')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
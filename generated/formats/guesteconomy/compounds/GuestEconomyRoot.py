@@ -41,6 +41,8 @@ class GuestEconomyRoot(MemStruct):
 
 	__name__ = 'GuestEconomyRoot'
 
+	__slots__ = ('target_profit', 'u_00', 'target_dinosaur_prestige', 'dinosaur_prestige_power', 'u_01', 'u_02', 'u_03', 'u_04', 'visitor_arrival_rate', 'visitor_departure_rate', 'u_05', 'u_06', 'u_07', 'u_08', 'u_09', 'u_10', 'u_11', 'ticket_price_visitor_proportion_power', 'ticket_price_full_visitor_proportion', 'ticket_price_minimum_price_fraction', 'visitor_deaths_decay_rate', 'visitor_deaths_limit', 'danger_exposure_safe_decay_rate', 'danger_exposure_unnecessary_shelter_punishment', 'danger_exposure_storm_exposure_punishment', 'danger_exposure_dinosaur_exposure_punishment', 'danger_exposure_dinosaur_danger_radius', 'danger_exposure_limit', 'transport_rating_disabled', 'u_12', 'u_13', 'u_14')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -7,6 +7,8 @@ class GuestOnRideAnimSettingsChild(MemStruct):
 
 	__name__ = 'GuestOnRideAnimSettingsChild'
 
+	__slots__ = ('str_0', 'str_1', 'str_2', 'str_3', 'str_4', 'str_5', 'str_6', 'bools', 'float_0', 'unk_0', 'unk_1', 'unk_2', 'unk_3', 'unk_4', 'unk_5')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class GuestOnRideAnimSettingsRoot(MemStruct):
 
 	__name__ = 'GuestOnRideAnimSettingsRoot'
 
+	__slots__ = ('ptr', 'unk_0')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,8 @@ class ClimbproofDataRoot(MemStruct):
 
 	__name__ = 'ClimbproofDataRoot'
 
+	__slots__ = ('climb_proof', 'climb_proof_cap_start', 'climb_proof_cap_end', 'climb_proof_bracket', 'post_gap', 'u_1', 'zero')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
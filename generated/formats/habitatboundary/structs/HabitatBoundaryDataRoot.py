@@ -10,6 +10,8 @@ class HabitatBoundaryDataRoot(MemStruct):
 
 	__name__ = 'HabitatBoundaryDataRoot'
 
+	__slots__ = ('prefab', 'walls_extrusion', 'walls_extrusion_end', 'walls_extrusion_top', 'walls_extrusion_cap_top', 'walls_extrusion_bottom', 'walls_unk_2', 'walls_unk_3', 'walls_unk_4', 'walls_extrusion_door_cap_side', 'walls_extrusion_door_cap_end', 'walls_extrusion_door_cap_underside', 'climb_proof_data', 'broken_post', 'broken_extrusion', 'broken_extrusion_pile', 'broken_ground', 'broken_1_m', 'broken_10_m', 'post', 'post_cap', 'u_1', 'u_2', 'u_3', 'ui_options', 'u_4', 'u_5', 'offsets', 'wall_replace_level', 'type', 'padding')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
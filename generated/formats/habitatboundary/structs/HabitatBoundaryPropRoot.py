@@ -10,6 +10,8 @@ class HabitatBoundaryPropRoot(MemStruct):
 
 	__name__ = 'HabitatBoundaryPropRoot'
 
+	__slots__ = ('type', 'prefab', 'u_1', 'post', 'wall', 'is_guest', 'post_position', 'u_2', 'door_physics', 'path_physics', 'path_join_part', 'door_cutout', 'small', 'height')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
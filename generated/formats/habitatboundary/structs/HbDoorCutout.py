@@ -10,6 +10,8 @@ class HbDoorCutout(MemStruct):
 
 	__name__ = 'HB_DoorCutout'
 
+	__slots__ = ('height', 'right', 'left')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
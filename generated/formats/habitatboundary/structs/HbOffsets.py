@@ -6,6 +6,8 @@ class HbOffsets(MemStruct):
 
 	__name__ = 'HB_Offsets'
 
+	__slots__ = ('physics', 'post_height_offset', 'wall_height')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,8 @@ class HbPhysicsOffsets(MemStruct):
 
 	__name__ = 'HB_PhysicsOffsets'
 
+	__slots__ = ('thickness', 'post_size', 'wall_pad_top', 'wall_post_gap')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
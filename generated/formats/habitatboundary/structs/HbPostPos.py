@@ -6,6 +6,8 @@ class HbPostPos(MemStruct):
 
 	__name__ = 'HB_PostPos'
 
+	__slots__ = ('right', 'left')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
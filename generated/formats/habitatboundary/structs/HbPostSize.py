@@ -6,6 +6,8 @@ class HbPostSize(MemStruct):
 
 	__name__ = 'HB_PostSize'
 
+	__slots__ = ('front_back', 'left_right', 'top')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class HbPropPhysics(MemStruct):
 
 	__name__ = 'HB_PropPhysics'
 
+	__slots__ = ('pad_top', 'z_pos', 'half_width', 'pad_bottom', 'half_depth', 'u_6')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
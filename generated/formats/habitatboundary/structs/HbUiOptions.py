@@ -6,6 +6,8 @@ class HbUiOptions(MemStruct):
 
 	__name__ = 'HB_UI_Options'
 
+	__slots__ = ('straight_curve', 'windows')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
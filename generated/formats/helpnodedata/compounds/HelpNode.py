@@ -6,6 +6,8 @@ class HelpNode(MemStruct):
 
 	__name__ = 'HelpNode'
 
+	__slots__ = ('node_type', 'node_help_user_interface_icon_data', 'node_title_text_symbol', 'node_description_text_symbol', 'unknown_ptr_1', 'unknown_ptr_2', 'unknown_ptr_3', 'unknown_ptr_4', 'unknown_ptr_5', 'unknown_ptr_6')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class HelpNodeDataHeader(MemStruct):
 
 	__name__ = 'HelpNodeDataHeader'
 
+	__slots__ = ('parent_node', 'parent_type', 'node_count', 'nodes', 'ptr_0', 'ptr_1')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
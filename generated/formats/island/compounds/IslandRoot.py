@@ -10,6 +10,8 @@ class IslandRoot(MemStruct):
 
 	__name__ = 'IslandRoot'
 
+	__slots__ = ('path_name', 'a', 'b', 'count', 'zero')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
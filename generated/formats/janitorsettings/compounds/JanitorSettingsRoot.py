@@ -10,6 +10,7 @@ class JanitorSettingsRoot(MemStruct):
 
 	__name__ = 'JanitorSettingsRoot'
 
+	__slots__ = ('array_0', 'array_1', 'array_2', 'array_3', 'array_4', 'array_5', 'array_6', 'array_7', 'array_8', 'array_9', 'array_10', 'array_11', 'array_12', 'array_13', 'array_14', 'unk_0', 'unk_1', 'unk_2', 'unk_3', 'unk_4', 'unk_5', 'unk_6', 'unk_7', 'unk_8', 'unk_9', 'unk_10', 'count_0', 'count_1', 'count_2', 'count_3', 'count_4', 'count_5', 'count_6', 'count_7', 'count_8', 'count_9', 'count_10', 'count_11', 'count_12', 'count_13', 'count_14', 'possibly_unused_count_0', 'possibly_unused_count_1', 'possibly_unused_count_2', 'possibly_unused_count_3', 'possibly_unused_count_4', 'unk_11', 'unk_12', 'unk_13', 'unk_14', 'unk_15', 'unk_16', 'unk_17', 'unk_18', 'unk_19', 'unk_20', 'unk_21', 'unk_22', 'unk_23', 'unk_24', 'unk_25', 'unk_26', 'unk_27', 'unk_28', 'unk_29', 'unk_30', 'unk_31', 'unk_32')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class UIntPair(MemStruct):
 
 	__name__ = 'UIntPair'
 
+	__slots__ = ('value_0', 'value_1')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
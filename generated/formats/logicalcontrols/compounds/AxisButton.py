@@ -10,6 +10,8 @@ class AxisButton(MemStruct):
 
 	__name__ = 'AxisButton'
 
+	__slots__ = ('button_name', 'axis_name_x', 'axis_name_y')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
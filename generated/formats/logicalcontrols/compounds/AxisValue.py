@@ -6,6 +6,8 @@ class AxisValue(MemStruct):
 
 	__name__ = 'AxisValue'
 
+	__slots__ = ('axis_name', 'u_0', 'u_1', 'u_2', 'value_name', 'u_3', 'u_4')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class Button(MemStruct):
 
 	__name__ = 'Button'
 
+	__slots__ = ('button_name', 'datas', 'datas_count', 'flags')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
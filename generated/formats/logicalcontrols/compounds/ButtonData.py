@@ -12,6 +12,8 @@ class ButtonData(MemStruct):
 
 	__name__ = 'ButtonData'
 
+	__slots__ = ('k_1_a', 'k_1_b', 'k_2', 'k_3', 'k_4')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
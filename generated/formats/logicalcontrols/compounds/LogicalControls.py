@@ -6,6 +6,7 @@ class LogicalControls(MemStruct):
 
 	__name__ = 'LogicalControls'
 
+	__slots__ = ('buttons', 'axes', 'axis_buttons', 'd', 'button_count', 'axis_count', 'count_3', 'count_4', 'flags', 'unsure')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,7 @@ class Some(MemStruct):
 
 	__name__ = 'Some'
 
+	__slots__ = ('some_name', 'some_data', 'some_count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
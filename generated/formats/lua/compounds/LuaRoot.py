@@ -12,6 +12,8 @@ class LuaRoot(MemStruct):
 
 	__name__ = 'LuaRoot'
 
+	__slots__ = ('lua_size', 'sixteenk', 'hash', 'zero_0', 'source_path', 'likely_alignment', 'zero_1', 'zero_2')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
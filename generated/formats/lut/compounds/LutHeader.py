@@ -10,6 +10,7 @@ class LutHeader(MemStruct):
 
 	__name__ = 'LutHeader'
 
+	__slots__ = ('colors', 'colors_count', 'unk_0', 'unk_1', 'colors_in_column_count', 'unk_2')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
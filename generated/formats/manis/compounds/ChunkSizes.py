@@ -6,6 +6,7 @@ class ChunkSizes(BaseStruct):
 
 	__name__ = 'ChunkSizes'
 
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -7,6 +7,8 @@ class BoolAttrib(MemStruct):
 
 	__name__ = 'BoolAttrib'
 
+	__slots__ = ('attrib_name', 'attrib', 'padding')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
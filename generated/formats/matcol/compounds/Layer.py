@@ -6,6 +6,7 @@ class Layer(MemStruct):
 
 	__name__ = 'Layer'
 
+	__slots__ = ('layer_name', 'zero_0', 'zero_1', 'float_attributes', 'float_attributes_count', 'zero_2', 'zero_3', 'bool_attributes', 'bool_attributes_count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
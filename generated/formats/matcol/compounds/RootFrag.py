@@ -6,6 +6,7 @@ class RootFrag(MemStruct):
 
 	__name__ = 'RootFrag'
 
+	__slots__ = ('mat_type', 'textures', 'tex_count', 'materials', 'mat_count', 'unk')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class Texture(MemStruct):
 
 	__name__ = 'Texture'
 
+	__slots__ = ('fgm_name', 'texture_suffix', 'texture_type')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
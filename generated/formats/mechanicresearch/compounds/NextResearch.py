@@ -7,6 +7,7 @@ class NextResearch(MemStruct):
 
 	__name__ = 'NextResearch'
 
+	__slots__ = ('item_name', 'unk_1')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class Research(MemStruct):
 
 	__name__ = 'Research'
 
+	__slots__ = ('item_name', 'unk_0', 'is_entry_level', 'unk_2', 'next_research', 'next_research_count', 'unk_3', 'unk_4')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
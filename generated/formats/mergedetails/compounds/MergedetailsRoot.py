@@ -10,6 +10,7 @@ class MergedetailsRoot(MemStruct):
 
 	__name__ = 'MergedetailsRoot'
 
+	__slots__ = ('merge_names', 'zero_0', 'zero_1', 'queries', 'field_name', 'count', 'flag')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class MissionDataRoot(MemStruct):
 
 	__name__ = 'MissionDataRoot'
 
+	__slots__ = ('mission_ui_name', 'mission_ui_description', 'mission_ui_description_pause', 'mission_id', 'mission_name', 'mission_objective_fail_generic', 'mission_objective_success_generic', 'mission_level_list', 'mission_level_count', 'mission_level_ai_strategy', 'mission_level_unknown_01', 'mission_level_unknown_02', 'mission_level_unknown_03', 'mission_level_unknown_04', 'mission_level_unknown_05', 'mission_level_unknown_list', 'mission_level_unknown_count', 'mission_level_unknown_06', 'mission_level_unknown_07', 'mission_level_difficulty_list', 'mission_level_difficulty_count', 'mission_level_camera_list', 'mission_level_camera_count', 'mission_campaign_name', 'mission_mission_name')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
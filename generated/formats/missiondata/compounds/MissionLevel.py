@@ -6,6 +6,8 @@ class MissionLevel(MemStruct):
 
 	__name__ = 'MissionLevel'
 
+	__slots__ = ('mission_level_path', 'mission_level_graph')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
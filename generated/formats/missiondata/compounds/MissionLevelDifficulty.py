@@ -6,6 +6,8 @@ class MissionLevelDifficulty(MemStruct):
 
 	__name__ = 'MissionLevelDifficulty'
 
+	__slots__ = ('mission_level_difficulty_1', 'mission_level_difficulty_2', 'mission_level_difficulty_3', 'mission_level_difficulty_4', 'mission_level_difficulty_5', 'mission_level_difficulty_6')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
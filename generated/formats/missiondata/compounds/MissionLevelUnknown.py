@@ -6,6 +6,8 @@ class MissionLevelUnknown(MemStruct):
 
 	__name__ = 'MissionLevelUnknown'
 
+	__slots__ = ('mission_level_unknown_data_flags', 'mission_level_unknown_data', 'mission_level_unknown_data_flags_1', 'mission_level_unknown_data_flags_2', 'mission_level_unknown_data_flags_3', 'mission_level_unknown_data_flags_4')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class MissionLevelUnknownList(MemStruct):
 
 	__name__ = 'MissionLevelUnknownList'
 
+	__slots__ = ('mission_level_unknown_list',)
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -7,6 +7,7 @@ class ActivitiesLinks(MemStruct):
 
 	__name__ = 'ActivitiesLinks'
 
+	__slots__ = ('activities',)
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
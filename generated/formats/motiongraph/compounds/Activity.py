@@ -14,6 +14,8 @@ class Activity(MemStruct):
 
 	__name__ = 'Activity'
 
+	__slots__ = ('data_type', 'ptr', 'count_2', 'count_3', 'minus_one', 'name_b')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
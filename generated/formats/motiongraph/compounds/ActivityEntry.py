@@ -10,6 +10,8 @@ class ActivityEntry(MemStruct):
 
 	__name__ = 'ActivityEntry'
 
+	__slots__ = ('value',)
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
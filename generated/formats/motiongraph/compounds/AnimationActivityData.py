@@ -10,6 +10,8 @@ class AnimationActivityData(MemStruct):
 
 	__name__ = 'AnimationActivityData'
 
+	__slots__ = ('mani', 'animation_flags', 'priorities', 'weight', 'speed', 'starting_prop_through', 'lead_out_time', 'sync_prop_through_variable', 'count_6', 'output_prop_through_variable', 'additional_data_streams')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
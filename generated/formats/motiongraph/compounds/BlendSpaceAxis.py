@@ -10,6 +10,8 @@ class BlendSpaceAxis(MemStruct):
 
 	__name__ = 'BlendSpaceAxis'
 
+	__slots__ = ('variable_name',)
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
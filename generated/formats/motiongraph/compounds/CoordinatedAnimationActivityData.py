@@ -10,6 +10,8 @@ class CoordinatedAnimationActivityData(MemStruct):
 
 	__name__ = 'CoordinatedAnimationActivityData'
 
+	__slots__ = ('coord_group', 'waiting_anim', 'waiting_anim_data_streams', 'coordinated_anim', 'coordinated_anim_data_streams', 'priorities', 'looping', '_pad', 'blend_time', 'output_prop_through_variable')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,7 @@ class CurveData(MemStruct):
 
 	__name__ = 'CurveData'
 
+	__slots__ = ('count', 'points')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,8 @@ class CurveDataPoint(MemStruct):
 
 	__name__ = 'CurveDataPoint'
 
+	__slots__ = ('x', 'y', 'sub_curve_type', 'subsequent_curve_param', 'subsequent_curve_param_b')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
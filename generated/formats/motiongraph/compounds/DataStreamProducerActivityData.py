@@ -10,6 +10,8 @@ class DataStreamProducerActivityData(MemStruct):
 
 	__name__ = 'DataStreamProducerActivityData'
 
+	__slots__ = ('curve_type', 'ds_name', 'type', 'bone_i_d', 'location', 'curve', 'time_limit_mode', 'data_stream_producer_flags', 'prop_through_variable')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
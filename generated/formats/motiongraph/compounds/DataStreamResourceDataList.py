@@ -10,6 +10,7 @@ class DataStreamResourceDataList(MemStruct):
 
 	__name__ = 'DataStreamResourceDataList'
 
+	__slots__ = ('count', 'data_stream_resource_data')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
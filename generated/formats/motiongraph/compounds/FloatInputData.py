@@ -10,6 +10,8 @@ class FloatInputData(MemStruct):
 
 	__name__ = 'FloatInputData'
 
+	__slots__ = ('float', 'optional_var_and_curve_count', 'optional_var_and_curve')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
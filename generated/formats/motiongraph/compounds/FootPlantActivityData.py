@@ -10,6 +10,8 @@ class FootPlantActivityData(MemStruct):
 
 	__name__ = 'FootPlantActivityData'
 
+	__slots__ = ('weight', 'rotation_no_i_k_weight', 'sticky_feet_weight')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,8 @@ class ForwardActivityData(MemStruct):
 
 	__name__ = 'ForwardActivityData'
 
+	__slots__ = ('straight_forward_animation', 'left_forward_animation', 'right_forward_animation', 'straight_spot_animation', 'output_prop_through_variable', 'cycled_variable', 'straight_forward_data_streams', 'left_forward_data_streams', 'right_forward_data_streams', 'straight_spot_data_streams', 'forward_flags', 'suppress_resource_data_streams', 'priorities', 'turn_radius', 'turn_radius_value_type', '_pad_0', 'stride_length', 'stride_length_value_type', '_pad_1', 'lead_out_time', 'anticipation_distance', 'unfused_cycles', 'cycle_count', 'repeat_count', 'min_cycles', 'playback_rate')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -11,6 +11,7 @@ class GroupedActivityActivityData(MemStruct):
 
 	__name__ = 'GroupedActivityActivityData'
 
+	__slots__ = ('activities', 'num_activities')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
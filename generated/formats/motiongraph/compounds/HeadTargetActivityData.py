@@ -10,6 +10,8 @@ class HeadTargetActivityData(MemStruct):
 
 	__name__ = 'HeadTargetActivityData'
 
+	__slots__ = ('weight',)
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
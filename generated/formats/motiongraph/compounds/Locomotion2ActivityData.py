@@ -10,6 +10,7 @@ class Locomotion2ActivityData(MemStruct):
 
 	__name__ = 'Locomotion2ActivityData'
 
+	__slots__ = ('animation_count', 'animations', 'flags', 'stopping_distance', 'strafe_turn_blend', 'turn_blend_limit', 'turn_speed_multiplier', 'flex_speed_multiplier', 'blend_space', 'output_prop_through_variable', 'speed_variable', 'orientation_variable', 'data_streams_count', 'data_streams')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
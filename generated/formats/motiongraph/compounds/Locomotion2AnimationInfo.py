@@ -10,6 +10,8 @@ class Locomotion2AnimationInfo(MemStruct):
 
 	__name__ = 'Locomotion2AnimationInfo'
 
+	__slots__ = ('anim_name', 'phase_entry_window', 'priority', 'anim_type', '_pad')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,7 @@ class Locomotion2BlendSpace(MemStruct):
 
 	__name__ = 'Locomotion2BlendSpace'
 
+	__slots__ = ('y_axis', 'x_axis', 'nodes_count', 'nodes')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
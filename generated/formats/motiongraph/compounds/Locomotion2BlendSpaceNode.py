@@ -10,6 +10,8 @@ class Locomotion2BlendSpaceNode(MemStruct):
 
 	__name__ = 'Locomotion2BlendSpaceNode'
 
+	__slots__ = ('anim_name', 'speed', 'orientation')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
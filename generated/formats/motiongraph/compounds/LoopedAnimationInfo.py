@@ -10,6 +10,8 @@ class LoopedAnimationInfo(MemStruct):
 
 	__name__ = 'LoopedAnimationInfo'
 
+	__slots__ = ('activity_name', 'weight')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
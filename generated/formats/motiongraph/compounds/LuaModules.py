@@ -10,6 +10,8 @@ class LuaModules(MemStruct):
 
 	__name__ = 'LuaModules'
 
+	__slots__ = ('motion_graph', 'motion_graph_event_handling', 'motion_graph_actions')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
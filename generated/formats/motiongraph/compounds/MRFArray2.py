@@ -7,6 +7,7 @@ class MRFArray2(MemStruct):
 
 	__name__ = 'MRFArray2'
 
+	__slots__ = ('states',)
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
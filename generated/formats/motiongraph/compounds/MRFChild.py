@@ -10,6 +10,8 @@ class MRFChild(MemStruct):
 
 	__name__ = 'MRFChild'
 
+	__slots__ = ('count_0', 'm_r_f_member', 'ptr_1', 'count_1')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
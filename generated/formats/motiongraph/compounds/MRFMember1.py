@@ -10,6 +10,7 @@ class MRFMember1(MemStruct):
 
 	__name__ = 'MRFMember1'
 
+	__slots__ = ('lua_method', 'count_0', 'ptr_0', 'motiongraph_vars', 'dtype', 'num_children', 'children', 'count_4', 'id')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
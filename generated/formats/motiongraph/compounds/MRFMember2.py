@@ -11,6 +11,8 @@ class MRFMember2(MemStruct):
 
 	__name__ = 'MRFMember2'
 
+	__slots__ = ('transition', 'count_0', 'count_1', 'count_2', 'count_3_a', 'count_3_b', 'count_3_c', 'count_4', 'count_5', 'count_6_a', 'count_6_b', 'count_6_c', 'id')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,8 @@ class MotiongraphHeader(MemStruct):
 
 	__name__ = 'MotiongraphHeader'
 
+	__slots__ = ('root_frag', 'state_output_entries', 'm_g_two', 'm_r_f_member_1', 'count_0', 'count_1', 'lua_modules', 'lua_results', 'first_non_transition_state', 'empty_str')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
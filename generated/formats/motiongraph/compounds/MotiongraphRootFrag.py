@@ -10,6 +10,7 @@ class MotiongraphRootFrag(MemStruct):
 
 	__name__ = 'MotiongraphRootFrag'
 
+	__slots__ = ('num_activities', 'activities', 'count_1', 'ptr_1', 'count_2', 'ptr_2', 'num_xmls', 'ptr_xmls')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
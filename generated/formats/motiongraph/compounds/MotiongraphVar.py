@@ -10,6 +10,8 @@ class MotiongraphVar(MemStruct):
 
 	__name__ = 'MotiongraphVar'
 
+	__slots__ = ('var_name', 'target_name', 'unk')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -11,6 +11,7 @@ class MotiongraphVars(MemStruct):
 
 	__name__ = 'MotiongraphVars'
 
+	__slots__ = ('ptr', 'count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
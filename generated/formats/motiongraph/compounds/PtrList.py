@@ -11,6 +11,7 @@ class PtrList(MemStruct):
 
 	__name__ = 'PtrList'
 
+	__slots__ = ('ptrs',)
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
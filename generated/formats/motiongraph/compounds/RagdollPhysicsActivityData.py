@@ -10,6 +10,8 @@ class RagdollPhysicsActivityData(MemStruct):
 
 	__name__ = 'RagdollPhysicsActivityData'
 
+	__slots__ = ('flag', '_flag_pad', 'root_bone_name', 'collision_exclude_mask', 'collision_exclude_0', 'collision_exclude_1', 'collision_exclude_2', 'collision_exclude_3', 'collision_exclude_4', 'collision_exclude_5', 'collision_exclude_6', 'collision_exclude_7', 'min_motor_driving_force', 'max_motor_driving_force', 'motor_weight_variable', 'pose_match_lin_threshold', 'pose_match_ang_threshold', 'bone_chain_priority', 'data_stream_name', 'data_stream_type')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,8 @@ class RandomActivityActivityInfoData(MemStruct):
 
 	__name__ = 'RandomActivityActivityInfoData'
 
+	__slots__ = ('enum_variable', 'activities', 'activities_count', 'blend_time', 'mode')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
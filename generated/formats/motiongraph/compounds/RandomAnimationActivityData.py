@@ -10,6 +10,7 @@ class RandomAnimationActivityData(MemStruct):
 
 	__name__ = 'RandomAnimationActivityData'
 
+	__slots__ = ('num_animations', 'animations', 'data_streams_count', 'data_streams', 'num_looped_animations', 'looped_animations', 'looped_data_streams_count', 'looped_data_streams', 'duration', 'blend_time', 'min_weight', 'max_weight', 'min_gap', 'max_gap', 'priorities', 'random_animation_flags', 'sync_variable', 'random_number_variable')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
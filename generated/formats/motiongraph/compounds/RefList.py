@@ -11,6 +11,7 @@ class RefList(MemStruct):
 
 	__name__ = 'RefList'
 
+	__slots__ = ('ptrs',)
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,7 @@ class SelectActivityActivityData(MemStruct):
 
 	__name__ = 'SelectActivityActivityData'
 
+	__slots__ = ('enum_variable', 'activities', 'num_activities', 'blend_time', 'mode')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
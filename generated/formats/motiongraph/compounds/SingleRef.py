@@ -10,6 +10,7 @@ class SingleRef(MemStruct):
 
 	__name__ = 'SingleRef'
 
+	__slots__ = ('pointer',)
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
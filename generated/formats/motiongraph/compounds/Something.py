@@ -10,6 +10,8 @@ class Something(MemStruct):
 
 	__name__ = 'Something'
 
+	__slots__ = ('ptr', 'unk')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
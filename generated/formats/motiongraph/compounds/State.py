@@ -11,6 +11,7 @@ class State(MemStruct):
 
 	__name__ = 'State'
 
+	__slots__ = ('unk', 'activities_count', 'activities', 'count_2', 'array_2', 'id')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
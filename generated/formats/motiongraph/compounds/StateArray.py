@@ -10,6 +10,7 @@ class StateArray(MemStruct):
 
 	__name__ = 'StateArray'
 
+	__slots__ = ('count', 'ptr')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -11,6 +11,7 @@ class StateList(MemStruct):
 
 	__name__ = 'StateList'
 
+	__slots__ = ('ptrs',)
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
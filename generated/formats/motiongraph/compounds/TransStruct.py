@@ -10,6 +10,8 @@ class TransStruct(MemStruct):
 
 	__name__ = 'TransStruct'
 
+	__slots__ = ('another_mrfentry_2', 'states')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
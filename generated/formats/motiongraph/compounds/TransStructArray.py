@@ -7,6 +7,7 @@ class TransStructArray(MemStruct):
 
 	__name__ = 'TransStructArray'
 
+	__slots__ = ('array',)
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -11,6 +11,8 @@ class TransStructStop(MemStruct):
 
 	__name__ = 'TransStructStop'
 
+	__slots__ = ('another_mrfentry_2', 'other_states')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
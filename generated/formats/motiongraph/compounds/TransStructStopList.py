@@ -7,6 +7,7 @@ class TransStructStopList(MemStruct):
 
 	__name__ = 'TransStructStopList'
 
+	__slots__ = ('ptrs',)
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
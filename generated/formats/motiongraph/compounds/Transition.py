@@ -11,6 +11,7 @@ class Transition(MemStruct):
 
 	__name__ = 'Transition'
 
+	__slots__ = ('count_0', 'count_1', 'ptr_0', 'count_2', 'ptr_1', 'id')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,8 @@ class TurnActivityData(MemStruct):
 
 	__name__ = 'TurnActivityData'
 
+	__slots__ = ('spot_animation', 'half_animation', 'full_animation', 'output_prop_through_variable', 'spot_data_streams', 'half_data_streams', 'full_data_streams', 'suppress_resource_data_streams', '_pad_0', 'priorities', 'lead_out_time', 'flags', '_pad_1', '_pad_2', 'max_angle', 'min_cycles', 'playback_rate')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,7 @@ class VariableBlendedAnimationActivityData(MemStruct):
 
 	__name__ = 'VariableBlendedAnimationActivityData'
 
+	__slots__ = ('priorities', '_pad', 'weight', 'animations', 'animation_count', 'variable', 'variable_blended_animation_flags')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
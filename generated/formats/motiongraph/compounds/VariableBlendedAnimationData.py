@@ -10,6 +10,8 @@ class VariableBlendedAnimationData(MemStruct):
 
 	__name__ = 'VariableBlendedAnimationData'
 
+	__slots__ = ('animation', 'value', '_pad', 'additional_data_streams')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -7,6 +7,7 @@ class XMLArray(MemStruct):
 
 	__name__ = 'XMLArray'
 
+	__slots__ = ('xmls',)
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
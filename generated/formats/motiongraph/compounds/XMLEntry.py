@@ -10,6 +10,8 @@ class XMLEntry(MemStruct):
 
 	__name__ = 'XMLEntry'
 
+	__slots__ = ('xml_string',)
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -12,7 +12,7 @@ from generated.formats.base.compounds.PadAlign import get_padding
 from generated.formats.ms2.compounds.Ms2InfoHeader import Ms2InfoHeader
 from generated.formats.ms2.versions import *
 from generated.io import IoFile
-from modules.formats.shared import djb2
+from modules.formats.shared import djb2_array
 
 logging.basicConfig(level=logging.DEBUG)
 
@@ -295,7 +295,7 @@ class Ms2File(Ms2InfoHeader, IoFile):
 		self.reset_field("buffer_0")
 		for name_i, name in enumerate(_names):
 			self.buffer_0.names[name_i] = name
-			self.buffer_0.name_hashes[name_i] = djb2(name.lower())
+		self.buffer_0.name_hashes[:] = djb2_array([name.lower() for name in _names])
 
 	def update_buffer_0_bytes(self):
 		with BytesIO() as temp_writer:
@@ -9,6 +9,7 @@ class AbstractPointer(BaseStruct):
 
 	__name__ = 'AbstractPointer'
 
+	_static_layout = True
 
 	@classmethod
 	def _get_attribute_list(cls):
@@ -7,6 +7,7 @@ class BoundingBox(BaseStruct):
 
 	__name__ = 'BoundingBox'
 
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
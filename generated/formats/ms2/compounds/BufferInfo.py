@@ -18,6 +18,7 @@ class BufferInfo(BaseStruct):
 
 	__name__ = 'BufferInfo'
 
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class Capsule(BaseStruct):
 
 	__name__ = 'Capsule'
 
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -22,6 +22,7 @@ class ChunkedMesh(MeshData):
 
 	__name__ = 'ChunkedMesh'
 
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
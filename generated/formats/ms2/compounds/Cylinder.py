@@ -9,6 +9,7 @@ class Cylinder(Capsule):
 
 	__name__ = 'Cylinder'
 
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
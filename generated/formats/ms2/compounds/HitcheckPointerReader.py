@@ -10,6 +10,7 @@ class HitcheckPointerReader(BaseStruct):
 
 	__name__ = 'HitcheckPointerReader'
 
+	_static_layout = True
 
 	@classmethod
 	def _get_attribute_list(cls):
@@ -14,6 +14,7 @@ class HitcheckReader(BaseStruct):
 
 	__name__ = 'HitcheckReader'
 
+	_static_layout = True
 
 	@classmethod
 	def _get_attribute_list(cls):
@@ -10,6 +10,7 @@ class IKTarget(BaseStruct):
 
 	__name__ = 'IKTarget'
 
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
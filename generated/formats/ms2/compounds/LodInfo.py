@@ -12,6 +12,7 @@ class LodInfo(BaseStruct):
 
 	__name__ = 'LodInfo'
 
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
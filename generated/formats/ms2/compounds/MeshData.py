@@ -17,6 +17,7 @@ class MeshData(MemStruct):
 
 	__name__ = 'MeshData'
 
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -23,6 +23,7 @@ class ModelReader(BaseStruct):
 
 	__name__ = 'ModelReader'
 
+	_static_layout = True
 
 	@classmethod
 	def _get_attribute_list(cls):
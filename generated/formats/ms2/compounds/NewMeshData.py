@@ -16,6 +16,7 @@ class NewMeshData(MeshData):
 
 	__name__ = 'NewMeshData'
 
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
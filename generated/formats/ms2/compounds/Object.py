@@ -6,6 +6,7 @@ class Object(BaseStruct):
 
 	__name__ = 'Object'
 
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -15,6 +15,7 @@ class PcMeshData(MeshData):
 
 	__name__ = 'PcMeshData'
 
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -9,6 +9,7 @@ class StreamDebugger(BaseStruct):
 
 	__name__ = 'StreamDebugger'
 
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,7 @@ class VertChunk(BaseStruct):
 
 	__name__ = 'VertChunk'
 
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -18,6 +18,7 @@ class ZtMeshData(MeshData):
 
 	__name__ = 'ZtMeshData'
 
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -11,6 +11,7 @@ class ZtVertBlockInfo(BaseStruct):
 
 	__name__ = 'ZtVertBlockInfo'
 
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -12,6 +12,7 @@ class AssetEntry(BaseStruct):
 	__name__ = 'AssetEntry'
 
 	allow_np = True
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
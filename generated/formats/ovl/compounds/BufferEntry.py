@@ -1,5 +1,6 @@
 
 import logging
+import mmap
 
 from generated.base_struct import BaseStruct
 from generated.formats.ovl.imports import name_type_map
@@ -13,6 +14,7 @@ class BufferEntry(BaseStruct):
 
 	__name__ = 'BufferEntry'
 
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -45,8 +47,39 @@ class BufferEntry(BaseStruct):
 			yield 'file_hash', name_type_map['Uint'], (0, None), (False, None)
 
 	def read_data(self, stream):
-		"""Load data from archive stream into self for modification and io"""
-		self.data = stream.read(self.size)
+		"""Load data from archive stream into self for modification and io, as a view into the archive"""
+		self._data = stream.read_view(self.size)
+
+	@property
+	def data(self):
+		"""Buffer bytes, copied from the archive's memory on first access"""
+		if isinstance(self._data, memoryview):
+			self._data = self._data.tobytes()
+		return self._data
+
+	@data.setter
+	def data(self, data):
+		self._data = data
+
+	@property
+	def view(self):
+		"""Buffer bytes as a read-only view, without copying them from the archive's memory"""
+		return memoryview(self._data).toreadonly()
+
+	@property
+	def is_mapped(self):
+		"""True if the data is still a view into a memory mapped ovs file"""
+		return isinstance(self._data, memoryview) and isinstance(self._data.obj, mmap.mmap)
+
+	def release(self):
+		"""Drop the data, and release the view of the archive's memory right away"""
+		if isinstance(self._data, memoryview):
+			try:
+				self._data.release()
+			except BufferError:
+				# still in use elsewhere, it is released once that lets go of it
+				pass
+		self._data = b""
 
 	def update_data(self, data):
 		"""Set data internal data so it can be written on save and update the size value"""
@@ -13,6 +13,7 @@ class DataEntry(BaseStruct):
 
 	__name__ = 'DataEntry'
 
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -89,6 +90,11 @@ class DataEntry(BaseStruct):
 		"""Get data for each buffer"""
 		return list(buffer.data for buffer in self.sorted_buffers)
 
+	@property
+	def buffer_views(self):
+		"""Get a view of the data of each buffer, for reading or writing it out without copying it"""
+		return list(buffer.view for buffer in self.sorted_buffers)
+
 	def __eq__(self, other):
 		attr_check = ("buffer_count", "size_1", "size_2")
 		same = True
@@ -15,6 +15,7 @@ class StreamEntry(BaseStruct):
 	__name__ = 'StreamEntry'
 
 	allow_np = True
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
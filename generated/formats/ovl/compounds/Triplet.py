@@ -11,6 +11,7 @@ class Triplet(BaseStruct):
 	__name__ = 'Triplet'
 
 	allow_np = True
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -13,6 +13,7 @@ class ArrayPointer(Pointer):
 
 	__name__ = 'ArrayPointer'
 
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -14,6 +14,7 @@ class CondPointer(Pointer):
 
 	__name__ = 'CondPointer'
 
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -9,6 +9,8 @@ class Empty(BaseStruct):
 
 	__name__ = 'Empty'
 
+	__slots__ = ('name', '_context', 'arg', 'template', 'io_size', 'io_start')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
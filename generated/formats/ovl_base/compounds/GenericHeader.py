@@ -10,6 +10,7 @@ class GenericHeader(BaseStruct):
 
 	__name__ = 'GenericHeader'
 
+	__slots__ = ('name', '_context', 'arg', 'template', 'io_size', 'io_start', 'magic', 'version_flag', 'version', 'bitswap', 'seventh_byte', 'user_version')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -20,6 +20,8 @@ class MemStruct(BaseStruct):
 
 	__name__ = 'MemStruct'
 
+	__slots__ = ('name', '_context', 'arg', 'template', 'io_size', 'io_start')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -40,7 +42,7 @@ class MemStruct(BaseStruct):
 		# could work if the order is good
 		pool.offsets.add(self.io_start)
 		pool.size_map[self.io_start] = self.io_size
-		children = loader.stack[(pool, self.io_start)] = {}
+		children = loader.add_to_stack(pool, self.io_start)
 		for ptr, f_name, arguments in MemStruct.get_instances_recursive(self, Pointer):
 			# when an array is entered
 			# locates the read address, attaches the frag entry, and reads the template as ptr.data
@@ -29,6 +29,7 @@ class Pointer(BaseStruct):
 
 	__name__ = 'Pointer'
 
+	_static_layout = True
 
 	@classmethod
 	def _get_attribute_list(cls):
@@ -84,8 +85,8 @@ class Pointer(BaseStruct):
 			self.link = link
 			# we are now (potentially) in a new pool
 			self.pool_type = self.target_pool.type
-			stream = self.target_pool.stream_at(self.target_offset)
-			self.read_template(stream)
+			with self.target_pool.reader_at(self.target_offset) as stream:
+				self.read_template(stream)
 
 	def read_template(self, stream):
 		if self.template:
@@ -24,6 +24,7 @@ class Reference(Pointer):
 
 	__name__ = 'Reference'
 
+	_static_layout = True
 
 	@classmethod
 	def _get_attribute_list(cls):
@@ -14,6 +14,7 @@ class SmartPadding(BaseStruct):
 
 	__name__ = 'SmartPadding'
 
+	_static_layout = True
 
 	@classmethod
 	def _get_attribute_list(cls):
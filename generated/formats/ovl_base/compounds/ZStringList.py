@@ -7,6 +7,7 @@ class ZStringList(MemStruct):
 
 	__name__ = 'ZStringList'
 
+	__slots__ = ('ptrs',)
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
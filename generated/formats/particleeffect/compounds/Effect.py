@@ -5,6 +5,8 @@ class Effect(MemStruct):
 
 	__name__ = 'Effect'
 
+	__slots__ = ()
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
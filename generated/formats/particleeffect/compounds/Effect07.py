@@ -13,6 +13,8 @@ class Effect07(Effect):
 
 	__name__ = 'Effect07'
 
+	__slots__ = ('zero_0', 'a', 'b', 'ints', 'floats', 'c', 'd', 'one')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -11,6 +11,8 @@ class Effect08(Effect):
 
 	__name__ = 'Effect08'
 
+	__slots__ = ('floats', 'minus_1', 'z_2', 'z_3', 'pi', 'floats_2')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
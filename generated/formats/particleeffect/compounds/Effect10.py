@@ -10,6 +10,8 @@ class Effect10(Effect):
 
 	__name__ = 'Effect10'
 
+	__slots__ = ('zero_0', 'u_0', 'u_1', 'zero_1', 'index', 'zero_2', 'count', 'one_f', 'zero_3')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -11,6 +11,8 @@ class Effect12(Effect):
 
 	__name__ = 'Effect12'
 
+	__slots__ = ('zero_0', 'u_0', 'u_1', 'zero_1', 'count_1', 'zero_2', 'count_2', 'zeros', 'floats_1', 'pi_rel', 'floats_2', 'ints', 'floats_3', 'bytes', 'float', 'ints_2')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
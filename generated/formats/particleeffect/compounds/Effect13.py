@@ -11,6 +11,8 @@ class Effect13(Effect):
 
 	__name__ = 'Effect13'
 
+	__slots__ = ('floats',)
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -11,6 +11,8 @@ class Effect14(Effect):
 
 	__name__ = 'Effect14'
 
+	__slots__ = ('offset', 'count')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
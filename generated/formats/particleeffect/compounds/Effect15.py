@@ -11,6 +11,8 @@ class Effect15(Effect):
 
 	__name__ = 'Effect15'
 
+	__slots__ = ('floats_1', 'flags', 'floats_2')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
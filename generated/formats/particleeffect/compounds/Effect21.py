@@ -10,6 +10,8 @@ class Effect21(Effect):
 
 	__name__ = 'Effect21'
 
+	__slots__ = ('a', 'b')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class EffectRef(MemStruct):
 
 	__name__ = 'EffectRef'
 
+	__slots__ = ('count', 'offset')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class LastRow(MemStruct):
 
 	__name__ = 'LastRow'
 
+	__slots__ = ('unk_07', 'unk_08', 'unk_09', 'unk_10', 'unk_11', 'unk_12')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
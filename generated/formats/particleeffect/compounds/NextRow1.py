@@ -6,6 +6,8 @@ class NextRow1(MemStruct):
 
 	__name__ = 'nextRow1'
 
+	__slots__ = ('unk', 'maybe_hash', 'count', 'count_repeat')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class ParticleEffectRoot(MemStruct):
 
 	__name__ = 'ParticleEffectRoot'
 
+	__slots__ = ('unk_64_1', 'unk_64_2', 'unk_64_3', 'unk_64_4', 'unk_64_5', 'unk_64_6', 'unk_32_1', 'unk_32_2_neg', 'unk_32_3', 'unk_32_4', 'a_unk_32_1', 'a_unk_32_2', 'a_unk_32_3_1', 'a_unk_32_4', 'atlasinfo_count', 'name_foreach_textures', 'next_row_1', 'effect_00', 'effect_01', 'effect_02', 'effect_03', 'effect_04', 'effect_05', 'effect_06', 'effect_07', 'effect_08', 'effect_09', 'effect_10', 'effect_11', 'effect_12', 'effect_13', 'effect_14', 'effect_15', 'effect_16', 'effect_17', 'effect_18', 'effect_19', 'effect_20', 'effect_21', 'effect_22', 'effect_23', 'effect_24', 'effect_25', 'effect_26', 'next_row_5')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class BrokeStruct(MemStruct):
 
 	__name__ = 'BrokeStruct'
 
+	__slots__ = ('sup_model', 'fallen_model', 'cap_model', 'unk_vector_1', 'unk_vector_2')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class Connector(MemStruct):
 
 	__name__ = 'Connector'
 
+	__slots__ = ('connector_model', 'joint_model', 'angle_limit', 'direction')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
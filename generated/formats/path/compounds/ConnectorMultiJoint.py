@@ -6,6 +6,7 @@ class ConnectorMultiJoint(MemStruct):
 
 	__name__ = 'ConnectorMultiJoint'
 
+	__slots__ = ('connector_model', 'padding', 'joints', 'num_joints', 'unk_float_1', 'unk_float_2', 'unk_int_1')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -7,6 +7,8 @@ class Footer(MemStruct):
 
 	__name__ = 'Footer'
 
+	__slots__ = ('footer_model', 'ext_model', 'joint_model', 'unk_floats')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
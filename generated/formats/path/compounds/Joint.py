@@ -6,6 +6,8 @@ class Joint(MemStruct):
 
 	__name__ = 'Joint'
 
+	__slots__ = ('joint_model_1', 'joint_model_2', 'joint_model_3', 'joint_model_4', 'unk_float', 'unk_int', 'unk_int_2')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class PathExtrusion(MemStruct):
 
 	__name__ = 'PathExtrusion'
 
+	__slots__ = ('model', 'post_model', 'endcap_model', 'unk_float_1', 'unk_float_2', 'is_kerb', 'is_not_ground', 'post_count', 'has_posts')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
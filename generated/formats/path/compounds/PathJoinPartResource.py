@@ -6,6 +6,7 @@ class PathJoinPartResource(MemStruct):
 
 	__name__ = 'PathJoinPartResource'
 
+	__slots__ = ('unk_points_1', 'unk_points_2', 'unk_vector', 'unk_shorts', 'unk_points_3', 'padding_1', 'pathresource', 'unk_byte_1', 'unk_byte_2', 'unk_byte_3', 'num_points_1', 'num_points_1_copy', 'num_points_2', 'num_points_2_copy', 'num_points_3', 'padding_2')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class PathJoinPartResourceRoot(MemStruct):
 
 	__name__ = 'PathJoinPartResourceRoot'
 
+	__slots__ = ('resources_list', 'num_res')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
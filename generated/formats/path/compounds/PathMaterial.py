@@ -6,6 +6,7 @@ class PathMaterial(MemStruct):
 
 	__name__ = 'PathMaterial'
 
+	__slots__ = ('elevated_mat', 'elevated_mat_valid', 'elevated_mat_invalid', 'terrain_mat', 'terrain_mat_valid', 'terrain_mat_invalid', 'underside_mat_1', 'underside_mat_2', 'stairs_mat_1', 'stairs_mat_2', 'path_sub_type', 'mat_data', 'num_data')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class PathMaterialData(MemStruct):
 
 	__name__ = 'PathMaterialData'
 
+	__slots__ = ('terrain_type', 'opacity', 'padding')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class PathResource(MemStruct):
 
 	__name__ = 'PathResource'
 
+	__slots__ = ('pathmaterial', 'pathextrusion_kerb', 'pathextrusion_railing', 'pathextrusion_ground', 'pathsupport', 'path_type', 'path_sub_type', 'unk_byte_1', 'unk_byte_2')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
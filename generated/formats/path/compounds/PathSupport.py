@@ -6,6 +6,8 @@ class PathSupport(MemStruct):
 
 	__name__ = 'PathSupport'
 
+	__slots__ = ('support', 'distance', '_unk_int_1')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
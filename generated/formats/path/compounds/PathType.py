@@ -7,6 +7,8 @@ class PathType(MemStruct):
 
 	__name__ = 'PathType'
 
+	__slots__ = ('enum_value', '_align', 'min_width', 'max_width', '_unk_int_2')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
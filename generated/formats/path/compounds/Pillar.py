@@ -7,6 +7,8 @@ class Pillar(MemStruct):
 
 	__name__ = 'Pillar'
 
+	__slots__ = ('pillar_model', 'cap_model', 'unk_int', 'unk_floats', 'unk_int_2')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
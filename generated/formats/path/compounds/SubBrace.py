@@ -6,6 +6,8 @@ class SubBrace(MemStruct):
 
 	__name__ = 'SubBrace'
 
+	__slots__ = ('brace_model_1', 'brace_model_2', 'brace_model_3', 'brace_model_4')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class SupportSetData(MemStruct):
 
 	__name__ = 'SupportSetData'
 
+	__slots__ = ('unk_index', 'unk_int_1', 'unk_int_2', 'unk_float_1')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
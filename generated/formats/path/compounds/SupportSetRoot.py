@@ -7,6 +7,7 @@ class SupportSetRoot(MemStruct):
 
 	__name__ = 'SupportSetRoot'
 
+	__slots__ = ('connector_1', 'connector_2', 'pillar', 'footer', 'sub_braces', 'unk_vector_1', 'unk_vector_2', 'unk_vector_3', 'unk_int_1', 'num_connector_1', 'num_connector_2', 'num_pillar', 'num_footer', 'num_sub_brace', 'unk_floats', 'broken_supports', 'data', 'num_data', 'zeros')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
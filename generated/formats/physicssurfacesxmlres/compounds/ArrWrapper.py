@@ -10,6 +10,7 @@ class ArrWrapper(MemStruct):
 
 	__name__ = 'ArrWrapper'
 
+	__slots__ = ('arr', 'count', 'flag', 'unk')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
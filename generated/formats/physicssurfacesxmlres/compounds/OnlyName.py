@@ -10,6 +10,8 @@ class OnlyName(MemStruct):
 
 	__name__ = 'OnlyName'
 
+	__slots__ = ('name_1', 'index')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -15,6 +15,8 @@ class PhysicsSurfaceXMLResRoot(MemStruct):
 
 	__name__ = 'PhysicsSurfaceXMLResRoot'
 
+	__slots__ = ('default_surface', 'unk_64_1', 'name_1', 'name_2', 'nil_ptr', 'only_names_j_w_e_1', 'surfaces', 'arr_2', 'only_names', 'unk_32_2', 'unk_32_3')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
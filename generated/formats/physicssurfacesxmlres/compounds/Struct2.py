@@ -10,6 +10,7 @@ class Struct2(MemStruct):
 
 	__name__ = 'Struct2'
 
+	__slots__ = ('name_1', 'arr', 'count', 'short_2', 'unk_32_2')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
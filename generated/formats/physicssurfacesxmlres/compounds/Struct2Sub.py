@@ -10,6 +10,8 @@ class Struct2Sub(MemStruct):
 
 	__name__ = 'Struct2Sub'
 
+	__slots__ = ('surface', 'c', 'd', 'e', 'f', 'nil', 'flag')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
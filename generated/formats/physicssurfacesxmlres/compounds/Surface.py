@@ -11,6 +11,8 @@ class Surface(MemStruct):
 
 	__name__ = 'Surface'
 
+	__slots__ = ('surface_name', 'float_1', 'float_2', 'float_3', 'float_4')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
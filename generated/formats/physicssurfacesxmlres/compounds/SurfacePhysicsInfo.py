@@ -12,6 +12,8 @@ class SurfacePhysicsInfo(MemStruct):
 
 	__name__ = 'SurfacePhysicsInfo'
 
+	__slots__ = ('surface', 'unk_64_1', 'name_1', 'name_2', 'nil')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -7,6 +7,7 @@ class PhysmatRoot(MemStruct):
 
 	__name__ = 'PhysmatRoot'
 
+	__slots__ = ('all_surfaces_count', 'surface_res_count', 'classnames_count', 'stringbuffer_size', 'pointers', 'all_surfaces_flags', 'surface_res_indices', 'all_surfaces_names', 'surface_res_names', 'classnames_names', 'classnames_indices', 'names')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
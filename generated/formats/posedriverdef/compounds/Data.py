@@ -7,6 +7,8 @@ class Data(MemStruct):
 
 	__name__ = 'Data'
 
+	__slots__ = ('floats',)
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
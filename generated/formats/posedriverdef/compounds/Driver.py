@@ -10,6 +10,8 @@ class Driver(MemStruct):
 
 	__name__ = 'Driver'
 
+	__slots__ = ('joint_name', 'a', 'b', 'c', 'd', 'driven_joint_name', 'unk_1', 'data', 'unk_2')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class PoseDriverDefRoot(MemStruct):
 
 	__name__ = 'PoseDriverDefRoot'
 
+	__slots__ = ('drivers', 'count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
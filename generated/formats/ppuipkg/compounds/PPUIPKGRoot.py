@@ -6,6 +6,7 @@ class PPUIPKGRoot(MemStruct):
 
 	__name__ = 'PPUIPKGRoot'
 
+	__slots__ = ('basic_path', 'file_count', 'files', 'icondata_count', 'types')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
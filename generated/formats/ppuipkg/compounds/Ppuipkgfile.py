@@ -6,6 +6,7 @@ class Ppuipkgfile(MemStruct):
 
 	__name__ = 'ppuipkgfile'
 
+	__slots__ = ('file_name', 'file_size', 'file_content')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class UserInterfaceIconData(MemStruct):
 
 	__name__ = 'UserInterfaceIconData'
 
+	__slots__ = ('image_name', 'asset_package')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class Arg(MemStruct):
 
 	__name__ = 'Arg'
 
+	__slots__ = ('u_0', 'arg_type', 'arg_index', 'u_1', 'u_2', 'arg_name', 'u_4')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class PreparedStatement(MemStruct):
 
 	__name__ = 'PreparedStatement'
 
+	__slots__ = ('args', 'arg_count', 'statement_name', 'sql_query')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
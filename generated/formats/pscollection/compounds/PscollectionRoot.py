@@ -6,6 +6,7 @@ class PscollectionRoot(MemStruct):
 
 	__name__ = 'PscollectionRoot'
 
+	__slots__ = ('prepared_statements', 'count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class RenderFeatureCollectionRoot(MemStruct):
 
 	__name__ = 'RenderFeatureCollectionRoot'
 
+	__slots__ = ('item_list', 'item_count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class RenderFeatureItem(MemStruct):
 
 	__name__ = 'RenderFeatureItem'
 
+	__slots__ = ('item_name', 'item_data', 'item_data_count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
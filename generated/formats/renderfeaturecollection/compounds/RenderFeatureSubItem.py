@@ -6,6 +6,8 @@ class RenderFeatureSubItem(MemStruct):
 
 	__name__ = 'RenderFeatureSubItem'
 
+	__slots__ = ('sub_item_name', 'sub_item_value_or_flags')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
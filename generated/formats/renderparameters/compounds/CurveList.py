@@ -11,6 +11,7 @@ class CurveList(MemStruct):
 
 	__name__ = 'CurveList'
 
+	__slots__ = ('ptrs',)
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class CurveParam(MemStruct):
 
 	__name__ = 'CurveParam'
 
+	__slots__ = ('attribute_name', 'dtype', 'do_interpolation', 'curve_entries', 'count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
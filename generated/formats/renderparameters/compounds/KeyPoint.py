@@ -6,6 +6,8 @@ class KeyPoint(MemStruct):
 
 	__name__ = 'KeyPoint'
 
+	__slots__ = ('time', 'value', 'tangent_before', 'tangent_after')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,7 @@ class Param(MemStruct):
 
 	__name__ = 'Param'
 
+	__slots__ = ('attribute_name', 'dtype', 'data')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
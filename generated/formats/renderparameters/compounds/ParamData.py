@@ -11,6 +11,7 @@ class ParamData(MemStruct):
 
 	__name__ = 'ParamData'
 
+	__slots__ = ('data',)
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
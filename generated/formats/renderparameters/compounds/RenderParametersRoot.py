@@ -10,6 +10,7 @@ class RenderParametersRoot(MemStruct):
 
 	__name__ = 'RenderParametersRoot'
 
+	__slots__ = ('param_name', 'params', 'count', 'unk')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
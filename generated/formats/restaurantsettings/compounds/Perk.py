@@ -6,6 +6,8 @@ class Perk(MemStruct):
 
 	__name__ = 'Perk'
 
+	__slots__ = ('unk_0', 'building_cost', 'running_cost_base', 'running_cost_per_extension', 'unk_4', 'unk_5', 'label', 'desc', 'icon', 'unk_6', 'appeal_adults', 'appeal_families', 'appeal_teenagers')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
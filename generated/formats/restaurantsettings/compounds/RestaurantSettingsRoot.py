@@ -6,6 +6,7 @@ class RestaurantSettingsRoot(MemStruct):
 
 	__name__ = 'RestaurantSettingsRoot'
 
+	__slots__ = ('running_cost_base', 'unk_1', 'unk_2', 'unk_3', 'unk_4', 'unk_5', 'unk_6', 'running_cost_per_extension', 'unk_8', 'unk_9', 'perks', 'count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
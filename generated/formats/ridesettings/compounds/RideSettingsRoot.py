@@ -6,6 +6,7 @@ class RideSettingsRoot(MemStruct):
 
 	__name__ = 'RideSettingsRoot'
 
+	__slots__ = ('unk_0', 'unk_1', 'array_1', 'count', 'pad_0', 'pad_1', 'pad_2')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
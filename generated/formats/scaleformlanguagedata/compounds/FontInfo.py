@@ -10,6 +10,8 @@ class FontInfo(MemStruct):
 
 	__name__ = 'FontInfo'
 
+	__slots__ = ('style_name', 'font_file', 'flag_or_count')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
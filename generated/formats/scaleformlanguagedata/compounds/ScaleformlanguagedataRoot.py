@@ -11,6 +11,7 @@ class ScaleformlanguagedataRoot(MemStruct):
 
 	__name__ = 'ScaleformlanguagedataRoot'
 
+	__slots__ = ('zero_0', 'zero_1', 'fonts', 'count', 'zero_2', 'zero_3')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class SceneryObjectResourceRoot(MemStruct):
 
 	__name__ = 'SceneryObjectResourceRoot'
 
+	__slots__ = ('data_1_list', 'data_1_count', 'data_2_list', 'data_2_count', 'data_3_list', 'data_3_count', 'data_4_list', 'data_4_count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class Colourname(MemStruct):
 
 	__name__ = 'colourname'
 
+	__slots__ = ('colour_name',)
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class SemanticFlexiColoursRoot(MemStruct):
 
 	__name__ = 'SemanticFlexiColoursRoot'
 
+	__slots__ = ('name_list', 'name_count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
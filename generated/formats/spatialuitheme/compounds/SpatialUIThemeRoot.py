@@ -6,6 +6,7 @@ class SpatialUIThemeRoot(MemStruct):
 
 	__name__ = 'SpatialUIThemeRoot'
 
+	__slots__ = ('spatial_u_i_theme_texture_list', 'spatial_u_i_theme_texture_count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class SpatialUIThemeTexture(MemStruct):
 
 	__name__ = 'SpatialUITheme_Texture'
 
+	__slots__ = ('spatial_u_i_theme_texture_id', 'spatial_u_i_theme_texture_name', 'spatial_u_i_theme_colour', 'spatial_u_i_theme_colour_unknown')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,7 @@ class ArrayData(MemStruct):
 
 	__name__ = 'ArrayData'
 
+	__slots__ = ('item', 'dtype', 'unused')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -11,6 +11,8 @@ class BooleanData(MemStruct):
 
 	__name__ = 'BooleanData'
 
+	__slots__ = ('ivalue', 'ioptional', 'unused')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -12,6 +12,8 @@ class ChildSpecData(MemStruct):
 
 	__name__ = 'ChildSpecData'
 
+	__slots__ = ('specdef',)
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -11,6 +11,7 @@ class Data(MemStruct):
 
 	__name__ = 'Data'
 
+	__slots__ = ('dtype',)
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,7 @@ class DataPtr(MemStruct):
 
 	__name__ = 'DataPtr'
 
+	__slots__ = ('data_ptr',)
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,8 @@ class FloatData(MemStruct):
 
 	__name__ = 'FloatData'
 
+	__slots__ = ('imin', 'imax', 'ivalue', 'ioptional')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,8 @@ class Int16Data(MemStruct):
 
 	__name__ = 'Int16Data'
 
+	__slots__ = ('imin', 'imax', 'ivalue', 'ioptional', 'enum')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
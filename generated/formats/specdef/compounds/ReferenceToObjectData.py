@@ -10,6 +10,8 @@ class ReferenceToObjectData(MemStruct):
 
 	__name__ = 'ReferenceToObjectData'
 
+	__slots__ = ('obj_name', 'ioptional')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
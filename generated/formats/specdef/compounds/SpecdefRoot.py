@@ -6,6 +6,7 @@ class SpecdefRoot(MemStruct):
 
 	__name__ = 'SpecdefRoot'
 
+	__slots__ = ('attrib_count', 'flags', 'name_count', 'childspec_count', 'manager_count', 'script_count', 'attribs', 'name_foreach_attribs', 'data_foreach_attribs', 'names', 'childspecs', 'managers', 'scripts')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,8 @@ class StringData(MemStruct):
 
 	__name__ = 'StringData'
 
+	__slots__ = ('str_name', 'ioptional')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
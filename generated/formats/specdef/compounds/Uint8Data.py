@@ -11,6 +11,8 @@ class Uint8Data(MemStruct):
 
 	__name__ = 'Uint8Data'
 
+	__slots__ = ('imin', 'imax', 'ivalue', 'ioptional', 'unused', 'enum')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
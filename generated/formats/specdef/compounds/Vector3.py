@@ -10,6 +10,8 @@ class Vector3(MemStruct):
 
 	__name__ = 'Vector3'
 
+	__slots__ = ('x', 'y', 'z', 'ioptional')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,8 @@ class ShortVector3(MemStruct):
 
 	__name__ = 'ShortVector3'
 
+	__slots__ = ('x', 'y', 'z')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -11,6 +11,7 @@ class SplData(MemStruct):
 
 	__name__ = 'SplData'
 
+	__slots__ = ('offset', 'scale', 'keys')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,7 @@ class SplRoot(MemStruct):
 
 	__name__ = 'SplRoot'
 
+	__slots__ = ('spline_data', 'count', 'sixteen', 'one', 'length')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
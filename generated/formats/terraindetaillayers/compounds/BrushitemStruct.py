@@ -6,6 +6,8 @@ class BrushitemStruct(MemStruct):
 
 	__name__ = 'brushitemStruct'
 
+	__slots__ = ('brush_name', 'brush_type')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
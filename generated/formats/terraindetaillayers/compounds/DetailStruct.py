@@ -6,6 +6,8 @@ class DetailStruct(MemStruct):
 
 	__name__ = 'DetailStruct'
 
+	__slots__ = ('index', 'x', 'y', 'z')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
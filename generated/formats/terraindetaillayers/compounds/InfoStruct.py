@@ -6,6 +6,7 @@ class InfoStruct(MemStruct):
 
 	__name__ = 'InfoStruct'
 
+	__slots__ = ('brush_list', 'brush_count', 'brush_flags', 'scale', 'unk_1')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,7 @@ class TerrainDetailsLayerItem(MemStruct):
 
 	__name__ = 'TerrainDetailsLayerItem'
 
+	__slots__ = ('layer_name', 'info_list', 'info_count', 'float_1', 'float_2', 'float_3', 'float_4', 'float_5', 'float_6', 'unk_2', 'detail_list', 'detail_count', 'floata_1', 'floata_2', 'floata_3', 'floata_4', 'floata_5', 'floata_6', 'floata_7', 'floata_8', 'unk_3_flags', 'unk_count', 'other_names', 'other_names_count', 'second_name', 'floatb_1', 'floatb_2')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
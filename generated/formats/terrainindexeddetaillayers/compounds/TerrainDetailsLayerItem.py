@@ -6,6 +6,7 @@ class TerrainDetailsLayerItem(MemStruct):
 
 	__name__ = 'TerrainDetailsLayerItem'
 
+	__slots__ = ('layer_name', 'info_list', 'info_count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
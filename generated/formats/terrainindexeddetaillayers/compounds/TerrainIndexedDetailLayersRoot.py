@@ -10,6 +10,7 @@ class TerrainIndexedDetailLayersRoot(MemStruct):
 
 	__name__ = 'TerrainIndexedDetailLayersRoot'
 
+	__slots__ = ('layer_list', 'layer_count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,8 @@ class Mipmap(MemStruct):
 
 	__name__ = 'Mipmap'
 
+	__slots__ = ('offset', 'size', 'size_array', 'size_scan', 'size_data')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -7,6 +7,7 @@ class SizeInfo(MemStruct):
 
 	__name__ = 'SizeInfo'
 
+	__slots__ = ('data', 'padding')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
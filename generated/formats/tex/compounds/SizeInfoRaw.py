@@ -11,6 +11,7 @@ class SizeInfoRaw(MemStruct):
 
 	__name__ = 'SizeInfoRaw'
 
+	__slots__ = ('zero', 'data_size', 'width', 'height', 'depth', 'num_tiles', 'num_mips', 'unk_pz', 'mip_maps')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
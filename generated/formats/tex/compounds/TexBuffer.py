@@ -11,6 +11,8 @@ class TexBuffer(MemStruct):
 
 	__name__ = 'TexBuffer'
 
+	__slots__ = ('offset', 'size', 'first_mip', 'mip_count', 'padding_0', 'padding_1')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
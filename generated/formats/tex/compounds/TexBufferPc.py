@@ -10,6 +10,8 @@ class TexBufferPc(MemStruct):
 
 	__name__ = 'TexBufferPc'
 
+	__slots__ = ('width', 'height', 'num_tiles', 'num_mips')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -12,6 +12,7 @@ class TexHeader(MemStruct):
 
 	__name__ = 'TexHeader'
 
+	__slots__ = ('zero_0', 'zero_1', 'buffer_infos', 'size_info', 'compression_type', 'one_0', 'num_mips', 'width', 'height', 'stream_count', 'stream_count_repeat', 'pad', 'pad_dla')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -11,6 +11,8 @@ class TexturestreamHeader(MemStruct):
 
 	__name__ = 'TexturestreamHeader'
 
+	__slots__ = ('zero', 'lod_index')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
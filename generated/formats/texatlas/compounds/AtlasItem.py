@@ -6,6 +6,8 @@ class AtlasItem(MemStruct):
 
 	__name__ = 'AtlasItem'
 
+	__slots__ = ('atlas_name', 'startx', 'starty', 'endx', 'endy', 'layer', 'flags_1', 'flags_2')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class TexAtlasRoot(MemStruct):
 
 	__name__ = 'TexAtlasRoot'
 
+	__slots__ = ('texture_list', 'texture_count', 'atlas_list', 'atlas_count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -11,6 +11,7 @@ class TrackedRideCarRoot(MemStruct):
 
 	__name__ = 'TrackedRideCarRoot'
 
+	__slots__ = ('sub', 'sub_count', 'total_vecs_count', 'vec', 'zero_0', 'some_name', 'zero_1')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
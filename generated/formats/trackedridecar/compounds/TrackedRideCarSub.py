@@ -10,6 +10,7 @@ class TrackedRideCarSub(MemStruct):
 
 	__name__ = 'TrackedRideCarSub'
 
+	__slots__ = ('float', 'u_0', 'vectors', 'vecs_count', 'zero_1')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
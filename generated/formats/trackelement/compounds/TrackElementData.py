@@ -10,6 +10,7 @@ class TrackElementData(MemStruct):
 
 	__name__ = 'TrackElementData'
 
+	__slots__ = ('loop_name', 'ovl_name', 'catwalk', 'unk_0', 'optional_catwalk', 'unk_1', 'unk_2', 'unk_3', 'unk_4', 'unk_5', 'unk_6', 'unk_7', 'pad')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,7 @@ class TrackElementRoot(MemStruct):
 
 	__name__ = 'TrackElementRoot'
 
+	__slots__ = ('track_data', 'count', 'unk_string_1', 'unk_string_2')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,8 @@ class TrackElementSub(MemStruct):
 
 	__name__ = 'TrackElementSub'
 
+	__slots__ = ('catwalk_right_lsm', 'catwalk_left_lsm', 'catwalk_both_lsm', 'unk_0')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
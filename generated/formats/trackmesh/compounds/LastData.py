@@ -10,6 +10,8 @@ class LastData(MemStruct):
 
 	__name__ = 'LastData'
 
+	__slots__ = ('some_name', 'p_1', 'p_1_count', 'b', 'c', 'p_2', 'p_2_count', 'p_3', 'p_3_count', 'f', 'g', 'p_4', 'p_4_count', 'p_5', 'p_5_count')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
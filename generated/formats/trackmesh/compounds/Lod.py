@@ -10,6 +10,8 @@ class Lod(MemStruct):
 
 	__name__ = 'Lod'
 
+	__slots__ = ('a', 'b', 'c', 'distance')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
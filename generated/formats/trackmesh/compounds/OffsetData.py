@@ -10,6 +10,8 @@ class OffsetData(MemStruct):
 
 	__name__ = 'OffsetData'
 
+	__slots__ = ('offset_id', 'z_0', 'z_1', 'relative_offset', 'spacing', 'one', 'z_2', 'z_3', 'count', 'z_4', 'z_5')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,8 @@ class TrackData(MemStruct):
 
 	__name__ = 'TrackData'
 
+	__slots__ = ('place_id', 'file', 'a', 'b', 'c', 'offset_id', 'd')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,7 @@ class TrackMeshRoot(MemStruct):
 
 	__name__ = 'TrackMeshRoot'
 
+	__slots__ = ('a', 'offset_data', 'track_data', 'last', 'count_0', 'next_count', 'last_count', 'lods', 'lod_count', 'heatmap_name', 'g')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
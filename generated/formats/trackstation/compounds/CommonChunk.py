@@ -7,6 +7,8 @@ class CommonChunk(MemStruct):
 
 	__name__ = 'CommonChunk'
 
+	__slots__ = ('float_1', 'float_2', 'piece_name_0', 'piece_name_1', 'piece_name_2', 'unk_flags_0', 'piece_name_3', 'piece_name_4', 'piece_name_5', 'unk_flags_1', 'piece_name_6', 'piece_name_7', 'piece_name_8', 'zero')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,8 @@ class FirstPointersa(MemStruct):
 
 	__name__ = 'FirstPointersa'
 
+	__slots__ = ('pointer_stuff_1', 'pointer_stuff_2', 'pointer_stuff_3', 'zero')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
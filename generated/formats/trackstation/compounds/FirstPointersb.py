@@ -10,6 +10,8 @@ class FirstPointersb(MemStruct):
 
 	__name__ = 'FirstPointersb'
 
+	__slots__ = ('pointer_stuff', 'zero')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
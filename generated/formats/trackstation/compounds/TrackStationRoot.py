@@ -11,6 +11,8 @@ class TrackStationRoot(MemStruct):
 
 	__name__ = 'TrackStationRoot'
 
+	__slots__ = ('unk_floats', 'unk_ints', 'some_dataa', 'some_datab', 'stationpiece_name_0', 'stationpiece_name_1', 'stationpiece_name_2', 'stationpiece_name_3', 'stationpiece_name_4', 'unk_ints_2', 'stationpiece_name_5', 'stationpiece_name_6', 'stationpiece_name_7', 'unk_floats_2', 'unk_ints_3')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
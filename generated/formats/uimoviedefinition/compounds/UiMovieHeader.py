@@ -7,6 +7,7 @@ class UiMovieHeader(MemStruct):
 
 	__name__ = 'UiMovieHeader'
 
+	__slots__ = ('movie_name', 'pkg_name', 'category_name', 'type_name', 'flag_1', 'flag_2', 'flag_3', 'floats', 'u_0', 'num_ui_triggers', 'u_1', 'num_ui_names', 'num_assetpkgs', 'u_2', 'num_list_1', 'num_list_2', 'num_ui_interfaces', 'u_3', 'u_4', 'u_5', 'ptr_0', 'ui_triggers', 'ptr_1', 'ui_names', 'assetpkgs', 'ptr_2', 'list_1', 'list_2', 'ui_interfaces', 'ptr_3')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,8 @@ class WeatherEventData(MemStruct):
 
 	__name__ = 'WeatherEventData'
 
+	__slots__ = ('event_name', 'float_1', 'float_2', 'float_3', 'float_4', 'float_5', 'float_6', 'float_7', 'float_8', 'float_9', 'float_10', 'event_curve_name_from_base', 'unk_1_as_1', 'float_11', 'float_12', 'float_13', 'float_14', 'float_15', 'event_curve_clouds', 'block_1_unk_as_1', 'block_1_float_1', 'block_1_float_2', 'block_1_float_3', 'block_1_float_4', 'block_1_float_5', 'block_1_float_6', 'block_1_float_7', 'block_2_unk_as_1', 'block_2_float_1', 'block_2_float_2', 'block_2_float_3', 'block_2_float_4', 'block_2_float_5', 'block_2_float_6', 'block_2_float_7', 'block_3_unk_as_1', 'block_3_float_1', 'block_3_float_2', 'block_3_float_3', 'block_3_float_4', 'block_3_float_5')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
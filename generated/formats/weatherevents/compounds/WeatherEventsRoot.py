@@ -6,6 +6,7 @@ class WeatherEventsRoot(MemStruct):
 
 	__name__ = 'WeatherEventsRoot'
 
+	__slots__ = ('resource_name', 'default_event_name', 'transition_time', 'unknown_1', 'event_list', 'event_count', 'unknown_2')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -12,6 +12,8 @@ class EventEntry(MemStruct):
 
 	__name__ = 'EventEntry'
 
+	__slots__ = ('hash', 'zero', 'block_name', 'zero_2', 'size', 'flag_0', 'flag_1', 'flag_2', 'zero_3', 'flag_3', 'hash_b', 'hash_c', 'zero_4', 'u_2', 'u_1')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class Jwe2WmetasbMain(MemStruct):
 
 	__name__ = 'JWE2WmetasbMain'
 
+	__slots__ = ('block_name', 'events', 'events_count', 'hash', 'unk_1', 'unk_2')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -10,6 +10,8 @@ class MediaEntry(MemStruct):
 
 	__name__ = 'MediaEntry'
 
+	__slots__ = ('hash', 'zero', 'block_name', 'wav_name', 'wem_name')
+	_static_layout = True
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -12,6 +12,7 @@ class WmetasbMain(MemStruct):
 
 	__name__ = 'WmetasbMain'
 
+	__slots__ = ('hash', 'unk', 'block_name', 'media_name', 'bnk_name', 'events', 'events_count', 'hashes', 'hashes_count', 'media', 'media_count', 'unused_2', 'unused_3', 'unused_4', 'unused_5')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -6,6 +6,7 @@ class WmetasbRoot(MemStruct):
 
 	__name__ = 'WmetasbRoot'
 
+	__slots__ = ('levels', 'count')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
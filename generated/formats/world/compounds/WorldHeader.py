@@ -10,6 +10,7 @@ class WorldHeader(MemStruct):
 
 	__name__ = 'WorldHeader'
 
+	__slots__ = ('world_type', 'asset_pkgs', 'asset_pkg_count', 'lua_name', 'ptr_0', 'ptr_1', 'prefabs', 'ptr_2', 'prefab_count', 'ptr_3')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -7,6 +7,7 @@ class Wsm(GenericHeader):
 
 	__name__ = 'Wsm'
 
+	__slots__ = ('header', 'locs', 'quats')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -11,6 +11,7 @@ class WsmHeader(MemStruct):
 
 	__name__ = 'WsmHeader'
 
+	__slots__ = ('duration', 'frame_count', 'unknowns', 'locs', 'quats')
 
 	def __init__(self, context, arg=0, template=None, set_default=True):
 		super().__init__(context, arg, template, set_default=False)
@@ -20,6 +20,52 @@ Float = Struct("<f")  # float32
 HFloat = Struct("<e")  # float16
 
 
+class ViewStream:
+	"""Read-only stream over a bytes-like object that can return slices of it without copying"""
+
+	__slots__ = ("view", "pos")
+
+	def __init__(self, buffer):
+		self.view = memoryview(buffer)
+		self.pos = 0
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+	def close(self):
+		self.view = None
+
+	def read_view(self, size=-1):
+		"""Return a memoryview of the next size bytes, sharing memory with the underlying buffer"""
+		start = self.pos
+		end = len(self.view) if size < 0 else start + size
+		self.pos = max(start, min(end, len(self.view)))
+		return self.view[start:self.pos]
+
+	def read(self, size=-1):
+		return self.read_view(size).tobytes()
+
+	def readinto(self, b):
+		target = memoryview(b).cast("B")
+		data = self.read_view(len(target))
+		target[:len(data)] = data
+		return len(data)
+
+	def seek(self, offset, whence=0):
+		if whence == 1:
+			offset += self.pos
+		elif whence == 2:
+			offset += len(self.view)
+		self.pos = max(offset, 0)
+		return self.pos
+
+	def tell(self):
+		return self.pos
+
+
 class IoFile:
 
 	def load(self, filepath):
@@ -0,0 +1,224 @@
+import json
+import logging
+import multiprocessing
+import os
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from multiprocessing.connection import wait
+
+from generated.formats.ovl import OvlFile
+from modules.formats.shared import DummyReporter
+
+# rough ratio of peak process memory to the size of an ovl and its ovs archives on disk
+MEMORY_FACTOR = 8
+MANIFEST_VERSION = 2
+
+
+def ovl_disk_size(ovl_path):
+	"""Returns the size of ovl_path and its ovs archives, stored as name.ovs or name.ovs.archive next to it"""
+	folder, ovl_name = os.path.split(ovl_path)
+	ovs_prefix = f"{os.path.splitext(ovl_name)[0]}.ovs".lower()
+	size = os.path.getsize(ovl_path)
+	for name in os.listdir(folder or "."):
+		if name.lower().startswith(ovs_prefix):
+			size += os.path.getsize(os.path.join(folder, name))
+	return size
+
+
+def run_job(conn, func, args):
+	"""Runs on the job's process and sends whether it succeeded and its result or error to the scheduler"""
+	try:
+		result = (True, func(*args))
+	except Exception as ex:
+		logging.exception(f"Job {args} failed")
+		result = (False, "".join(traceback.format_exception_only(type(ex), ex)).strip())
+	conn.send(result)
+	conn.close()
+
+
+def extract_ovl(ovl_path, out_dir, only_types=(), game=None):
+	"""Job that extracts an ovl to out_dir, returns the number of extracted files"""
+	ovl_data = OvlFile()
+	ovl_data.load_hash_table()
+	commands = {"only_types": only_types} if only_types else {}
+	if game:
+		commands["game"] = game
+	ovl_data.load(ovl_path, commands=commands)
+	return len(ovl_data.extract(out_dir, only_types=only_types))
+
+
+def create_ovl(src_dir, ovl_path, game, profile="balanced"):
+	"""Job that creates an ovl from the files in src_dir and saves it with profile, see SAVE_PROFILES"""
+	ovl_data = OvlFile()
+	ovl_data.load_hash_table()
+	ovl_data.game = game
+	ovl_data.create(src_dir)
+	os.makedirs(os.path.dirname(ovl_path), exist_ok=True)
+	ovl_data.save(ovl_path, profile)
+	return len(ovl_data.loaders)
+
+
+def args_record(args):
+	"""Returns args as they are stored in the manifest, to compare them with the args of a later run"""
+	return json.loads(json.dumps(args, default=str))
+
+
+@dataclass
+class BatchJob:
+	key: str
+	args: tuple
+	# estimated peak memory in bytes
+	memory: int = 0
+
+
+@dataclass
+class RunningJob:
+	job: BatchJob
+	process: multiprocessing.Process
+	conn: object
+	start: float
+
+
+@dataclass
+class BatchSummary:
+	done: dict = field(default_factory=dict)
+	failed: dict = field(default_factory=dict)
+	# finished by a previous, interrupted run
+	skipped: list = field(default_factory=list)
+
+	def log(self, operation):
+		logging.info(
+			f"{operation}: {len(self.done)} done, {len(self.skipped)} skipped, {len(self.failed)} failed")
+		for key, error in self.failed.items():
+			logging.error(f"{key}: {error}")
+
+
+class BatchScheduler:
+	"""Runs independent jobs, such as extracting one ovl each, on separate processes
+
+	Jobs are started while they fit in the memory budget, a job that exceeds its timeout is killed.
+	Finished jobs are recorded in a json manifest, so that an interrupted or failed batch resumes where it stopped.
+	"""
+
+	def __init__(self, manifest_path=None, max_workers=None, memory_budget=None, timeout=None, reporter=DummyReporter()):
+		self.manifest_path = manifest_path
+		self.max_workers = max_workers or os.cpu_count() or 1
+		# in bytes, None to only limit the number of processes
+		self.memory_budget = memory_budget
+		# in seconds per job
+		self.timeout = timeout
+		self.reporter = reporter
+
+	def load_manifest(self):
+		if self.manifest_path and os.path.isfile(self.manifest_path):
+			try:
+				with open(self.manifest_path, "r") as f:
+					manifest = json.load(f)
+				if manifest.get("version") == MANIFEST_VERSION:
+					return manifest["jobs"]
+			except:
+				logging.exception(f"Could not read batch manifest {self.manifest_path}, starting over")
+		return {}
+
+	def save_manifest(self, records):
+		if not self.manifest_path:
+			return
+		tmp_path = f"{self.manifest_path}.tmp"
+		with open(tmp_path, "w") as f:
+			json.dump({"version": MANIFEST_VERSION, "jobs": records}, f, indent="\t")
+		# replace in one step, so an interrupted run never leaves a broken manifest
+		os.replace(tmp_path, self.manifest_path)
+
+	def fits(self, running, job):
+		if not running:
+			# always run at least one job, even if it is larger than the budget
+			return True
+		if len(running) >= self.max_workers:
+			return False
+		if self.memory_budget is None:
+			return True
+		return sum(r.job.memory for r in running.values()) + job.memory <= self.memory_budget
+
+	def start(self, ctx, job):
+		parent_conn, child_conn = ctx.Pipe(duplex=False)
+		process = ctx.Process(target=run_job, args=(child_conn, self.func, job.args), daemon=True)
+		process.start()
+		# only the child holds the sending end now, so the parent sees EOF if it dies
+		child_conn.close()
+		return RunningJob(job, process, parent_conn, time.time())
+
+	def run(self, func, jobs, operation="Processing"):
+		"""Run func(*job.args) for all jobs that did not succeed in a previous run, returns a BatchSummary
+
+		func must be importable by the job processes, ie. a module level function
+		"""
+		self.func = func
+		records = self.load_manifest()
+		summary = BatchSummary()
+		queue = deque()
+		for job in jobs:
+			record = records.get(job.key, {})
+			# a job with the same key but other args, eg. other file types, has not been done yet
+			if record.get("status") == "done" and record.get("args") == args_record(job.args):
+				summary.skipped.append(job.key)
+			else:
+				queue.append(job)
+		logging.info(f"{operation} {len(queue)} jobs on up to {self.max_workers} processes")
+		ctx = multiprocessing.get_context()
+		running = {}
+		progress = self.reporter.iter_progress(range(len(queue)), operation)
+
+		def finish(conn, status, result):
+			r = running.pop(conn)
+			r.conn.close()
+			r.process.join()
+			duration = time.time() - r.start
+			records[r.job.key] = {"status": status, "duration": round(duration, 2), "args": args_record(r.job.args)}
+			if status == "done":
+				summary.done[r.job.key] = result
+			else:
+				records[r.job.key]["error"] = result
+				summary.failed[r.job.key] = result
+			self.save_manifest(records)
+			next(progress, None)
+
+		try:
+			while queue or running:
+				while queue and self.fits(running, queue[0]):
+					r = self.start(ctx, queue.popleft())
+					running[r.conn] = r
+				wait_time = None
+				if self.timeout is not None:
+					now = time.time()
+					wait_time = max(0.0, min(r.start + self.timeout - now for r in running.values()))
+				for conn in wait(list(running), wait_time):
+					try:
+						ok, result = conn.recv()
+					except EOFError:
+						process = running[conn].process
+						process.join()
+						finish(conn, "failed", f"Process exited with code {process.exitcode}")
+						continue
+					finish(conn, "done" if ok else "failed", result)
+				if self.timeout is not None:
+					now = time.time()
+					for conn, r in list(running.items()):
+						if now - r.start > self.timeout:
+							r.process.kill()
+							finish(conn, "timeout", f"Timed out after {self.timeout} seconds")
+		finally:
+			for r in running.values():
+				r.process.kill()
+				r.process.join()
+		# exhaust the progress generator to report that the operation finished
+		for _ in progress:
+			pass
+		summary.log(operation)
+		# keep the manifest to retry only the failed jobs, else the next batch starts over
+		if not summary.failed and self.manifest_path and os.path.isfile(self.manifest_path):
+			os.remove(self.manifest_path)
+		with self.reporter.report_error_files(operation) as error_files:
+			error_files.extend(summary.failed)
+		return summary
@@ -16,7 +16,7 @@ class AnimalresearchunlockssettingsLoader(MemStructLoader):
 				level.children.data = None
 
 	def create(self, file_path):
-		self.header = self.target_class.from_xml_file(file_path, self.ovl.context)
+		self.header = self.get_prepared(file_path)
 		print(self.header)
 		# self.prep()
 		self.write_memory_data()
@@ -36,6 +36,7 @@ class BanisLoader(MemStructLoader):
 		self.extra_loaders = []
 		for loader in self.ovl.loaders.values():
 			if loader.ext == ".bani":
+				loader.ensure_collected()
 				if self.root_ptr == loader.header.banis.link:
 					self.extra_loaders.append(loader)
 		self.extra_loaders.sort(key=lambda bani: bani.name)
@@ -59,11 +60,14 @@ class BanisLoader(MemStructLoader):
 			stream.write(buffers[0])
 		return out_paths
 
-	def create(self, file_path):
+	def prepare(self, file_path):
 		with open(file_path, 'rb') as stream:
 			banis = BanisInfoHeader.from_stream(stream, self.context)
-			self.header = banis.data
-			keys = stream.read()
+			return banis, stream.read()
+
+	def create(self, file_path):
+		banis, keys = self.get_prepared(file_path)
+		self.header = banis.data
 		self.write_memory_data()
 		self.extra_loaders = []
 		for bani in banis.anims:
@@ -44,6 +44,12 @@ class BaseFile:
 		self.fragments = set()
 		self.stack = {}
 		self.root_ptr = (None, 0)
+		# False if track_ptrs and collect were deferred by a lazy load
+		self.is_collected = True
+		# False while the loader is unchanged since it was loaded or saved, so its archives can be copied on save
+		self.is_dirty = True
+		# result of prepare, if it ran on a worker process before create
+		self.prepared = None
 
 		self.same = False
 
@@ -104,9 +110,51 @@ class BaseFile:
 	def create(self, file_path):
 		raise NotImplementedError
 
+	def release(self):
+		"""Drop the references to pools, data and other loaders, see OvlFile.close"""
+		self.header = None
+		self.root_ptr = (None, 0)
+		self.data_entries = {}
+		self.dependencies = []
+		self.streams = []
+		self.children = []
+		self.extra_loaders = []
+		self.fragments = set()
+		self.stack = {}
+
+	def prepare(self, file_path):
+		"""Returns what create needs from file_path without touching the ovl's pools, so that it can run on a worker process"""
+		return None
+
+	def get_prepared(self, file_path):
+		"""Returns the result of prepare, unless OvlFile.add_files already ran it on a worker process"""
+		prepared, self.prepared = self.prepared, None
+		if prepared is None:
+			prepared = self.prepare(file_path)
+		return prepared
+
 	def collect(self):
 		pass
 
+	def ensure_collected(self):
+		"""Track pointers and collect this loader, if that was deferred by a lazy load"""
+		if self.is_collected:
+			return
+		# set first, so that loaders that refer to each other don't recurse
+		self.is_collected = True
+		version = self.ovl.version
+		self.track_ptrs()
+		self.collect()
+		# if somebody stores a field called 'version', it overrides (ovl) context version
+		if version != self.ovl.version:
+			raise AttributeError(f"{self.name} changed ovl version from {version} to {self.ovl.version}")
+		for loader in self.streams + self.children:
+			loader.ensure_collected()
+		try:
+			self.validate()
+		except:
+			logging.exception(f"Validating '{self.name}' failed")
+
 	def pack_header(self, fmt_name):
 		ovl = self.ovl
 		return struct.pack(
@@ -126,7 +174,7 @@ class BaseFile:
 		"""Creates a frag on a MemStruct Pointer; needs to have been written so that io_start is set"""
 		# todo - doesn't add struct to list of children of an existing struct in stack
 		l_pool.offset_2_link[l_offset] = (s_pool, s_offset)
-		self.stack[(s_pool, s_offset)] = {}
+		self.add_to_stack(s_pool, s_offset)
 		self.fragments.add(((l_pool, l_offset), (s_pool, s_offset)))
 
 	def get_pool(self, pool_type_key):
@@ -157,7 +205,7 @@ class BaseFile:
 		self.root_ptr = (pool, offset)
 		pool.offsets.add(offset)
 		pool.size_map[offset] = len(data)
-		self.stack[(pool, offset)] = {}
+		self.add_to_stack(pool, offset)
 
 	def get_content(self, filepath):
 		with open(filepath, 'rb') as f:
@@ -230,6 +278,7 @@ class BaseFile:
 
 	def rename(self, name_tuples):
 		"""Rename all entries controlled by this loader"""
+		self.is_dirty = True
 		entries = []
 		for data_entry in self.data_entries.values():
 			entries.extend((data_entry, *data_entry.buffers))
@@ -280,6 +329,9 @@ class BaseFile:
 
 	def remove(self):
 		logging.info(f"Removing {self.name}")
+		self.is_dirty = True
+		# need the stack to know which structs to remove
+		self.ensure_collected()
 		for pool, offset in self.stack.keys():
 			if pool is not None:
 				# different files may have a struct at this offset
@@ -299,12 +351,17 @@ class BaseFile:
 		if pool:
 			self.check_for_ptrs(pool, offset)
 
+	def add_to_stack(self, pool, offset):
+		"""Adds an empty struct to the stack and indexes this loader as its owner on pool, returns the struct's children"""
+		children = self.stack[(pool, offset)] = {}
+		pool.offset_2_loader.setdefault(offset, self)
+		return children
+
 	def check_for_ptrs(self, p_pool, p_offset):
 		"""Recursively assigns pointers to an entry"""
 		# tracking children for each struct adds no detectable overhead for animal ovls
 		# slight slowdown in JWE2 Content0 main.ovl with vectorized search for linked child pointers
-		children = {}
-		self.stack[(p_pool, p_offset)] = children
+		children = self.add_to_stack(p_pool, p_offset)
 		p_size = p_pool.size_map[p_offset]
 		for l_offset, rel_offset, entry in p_pool.get_ptrs_in_struct(p_offset, p_size):
 			# store frag and deps
@@ -355,7 +412,7 @@ class BaseFile:
 	def dump_buffers(self, out_dir):
 		paths = []
 		if self.data_entry:
-			for i, b in enumerate(self.data_entry.buffer_datas):
+			for i, b in enumerate(self.data_entry.buffer_views):
 				name = f"{self.name}_{i}.dmp"
 				out_path = out_dir(name)
 				paths.append(out_path)
@@ -372,6 +429,23 @@ class BaseFile:
 			return [p for p in paths if p not in paths_to_remove]
 		return paths
 
+	def extract_to_memory(self):
+		"""Yields the relative path and bytes of each file that extract writes
+
+		Loaders that can create their files in memory override this, the others extract to a temp dir.
+		"""
+		with tempfile.TemporaryDirectory("-cobra") as temp_dir:
+
+			def out_dir_func(n):
+				"""Helper function to generate temporary output file name"""
+				out_path = os.path.normpath(os.path.join(temp_dir, n))
+				os.makedirs(os.path.dirname(out_path), exist_ok=True)
+				return out_path
+
+			for path in self.handle_paths(self.extract(out_dir_func), self.ovl.do_debug):
+				with open(path, "rb") as f:
+					yield os.path.relpath(path, temp_dir).replace("\\", "/"), f.read()
+
 	def check(self, a, b, s):
 		if a != b:
 			logging.warning(f"{s} does not match - this: {a} vs other: {b}")
@@ -379,6 +453,8 @@ class BaseFile:
 
 	def __eq__(self, other):
 		logging.info(f"Comparing {self.name}")
+		self.ensure_collected()
+		other.ensure_collected()
 		self.same = True
 		self.check(self.mime_version, other.mime_version, "Mime version")
 		self.check(len(self.data_entries), len(other.data_entries), "Amount of data entries")
@@ -444,7 +520,7 @@ class BaseFile:
 		stream, offset = pool.align_write(self)
 		# logging.debug(f"Writing to {pool} at {offset}")
 		self.root_ptr = (pool, offset)
-		self.stack[self.root_ptr] = {}
+		self.add_to_stack(pool, offset)
 		self.target_class.to_stream(self.header, stream, self.context)
 		self.header.write_ptrs(self, pool)
 
@@ -459,25 +535,43 @@ class MemStructLoader(BaseFile):
 		if self.header:
 			out_path = out_dir(self.name)
 			with self.header.to_xml_file(self.header, out_path, debug=self.ovl.do_debug) as xml_root:
-				if self.ovl.do_debug:
-					pool, offset = self.root_ptr
-					xml_root.set("_address", f"{pool.i} | {offset}")
-					xml_root.set("_size", f"{pool.size_map.get(offset, -1)}")
+				self.add_debug_info(xml_root)
 			return out_path,
 		else:
 			logging.warning(f"File '{self.name}' has no header - has the OVL finished loading?")
 			return ()
 
+	def extract_to_memory(self):
+		# subclasses that write more than the xml do so on disk
+		if type(self).extract is not MemStructLoader.extract:
+			yield from super().extract_to_memory()
+		elif self.header:
+			with BytesIO() as stream:
+				with self.header.to_xml_stream(self.header, stream, debug=self.ovl.do_debug) as xml_root:
+					self.add_debug_info(xml_root)
+				yield self.name, stream.getvalue()
+		else:
+			logging.warning(f"File '{self.name}' has no header - has the OVL finished loading?")
+
+	def add_debug_info(self, xml_root):
+		if self.ovl.do_debug:
+			pool, offset = self.root_ptr
+			xml_root.set("_address", f"{pool.i} | {offset}")
+			xml_root.set("_size", f"{pool.size_map.get(offset, -1)}")
+
 	def collect(self):
 		super().collect()
 		pool, offset = self.root_ptr
-		stream = pool.stream_at(offset)
-		self.header = self.target_class.from_stream(stream, self.context)
+		with pool.reader_at(offset) as stream:
+			self.header = self.target_class.from_stream(stream, self.context)
 		# print(self.header)
 		self.header.read_ptrs(pool, debug=self.ovl.do_debug)
 
+	def prepare(self, file_path):
+		return self.target_class.from_xml_file(file_path, self.context)
+
 	def create(self, file_path):
-		self.header = self.target_class.from_xml_file(file_path, self.context)
+		self.header = self.get_prepared(file_path)
 		self.write_memory_data()
 
 
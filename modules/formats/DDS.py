@@ -47,13 +47,17 @@ class DdsLoader(MemStructLoader):
 				buffer_i += 1
 		return buffer_i
 
-	def create(self, file_path):
-		in_dir, name_ext, basename, ext = self.get_names(file_path)
+	def prepare(self, file_path):
 		# don't write header yet, might make changes to it
-		self.header = self.target_class.from_xml_file(file_path, self.context)
-		logging.debug(f"Creating image {name_ext}")
+		self.header = super().prepare(file_path)
 		# create the image before creating the streams
 		buffer_bytes = self.get_image_bytes(file_path)
+		return self.header, buffer_bytes
+
+	def create(self, file_path):
+		in_dir, name_ext, basename, ext = self.get_names(file_path)
+		logging.debug(f"Creating image {name_ext}")
+		self.header, buffer_bytes = self.get_prepared(file_path)
 		# changes may have been made to tex header
 		self.write_memory_data()
 		# print(self.header)
@@ -259,7 +263,7 @@ class DdsLoader(MemStructLoader):
 		logging.info(f"Writing {tex_name}")
 
 		# get joined output buffer
-		buffer_data = b"".join([buffer.data for buffer in self.get_sorted_streams()])
+		buffer_data = b"".join([buffer.view for buffer in self.get_sorted_streams()])
 		size_info = self.get_tex_structs()
 
 		dds_file = DdsFile()
@@ -16,7 +16,7 @@ class FctLoader(MemStructLoader):
 	def extract(self, out_dir):
 		out_files = super().extract(out_dir)
 		paths = [*out_files]
-		buff = b"".join(self.data_entry.buffer_datas)
+		buff = b"".join(self.data_entry.buffer_views)
 
 		# save data from start of buffer
 		offset = self.header.offset
@@ -41,7 +41,7 @@ class FctLoader(MemStructLoader):
 		return paths
 
 	def create(self, file_path):
-		self.header = self.target_class.from_xml_file(file_path, self.ovl.context)
+		self.header = self.get_prepared(file_path)
 		file_dir = os.path.dirname(file_path)
 		with io.BytesIO() as buff_stream:
 			# restore the stuff at the start of the stream
@@ -26,7 +26,7 @@ class FdbLoader(BaseFile):
 
 	def extract(self, out_dir):
 		name = self.name
-		buff = self.data_entry.buffer_datas[1]
+		buff = self.data_entry.buffer_views[1]
 		out_path = out_dir(name)
 		with open(out_path, 'wb') as outfile:
 			outfile.write(buff)
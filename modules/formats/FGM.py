@@ -19,7 +19,7 @@ class FgmLoader(MemStructLoader):
 	extension = ".fgm"
 
 	def create(self, file_path):
-		self.header = self.target_class.from_xml_file(file_path, self.ovl.context)
+		self.header = self.get_prepared(file_path)
 		self.create_data_entry((self.update_names_buffer(),))
 		# need to update before writing ptrs
 		self.write_memory_data()
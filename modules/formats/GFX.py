@@ -17,7 +17,7 @@ class GfxLoader(BaseFile):
         logging.info(f"Writing {name}")
 
         out_path = out_dir(name)
-        buffers = self.data_entry.buffer_datas
+        buffers = self.data_entry.buffer_views
         with open(out_path, 'wb') as outfile:
             for buff in buffers:
                 outfile.write(buff)
@@ -13,7 +13,7 @@ class LuaLoader(MemStructLoader):
 	temp_extensions = ".bin"
 	
 	def create(self, file_path):
-		buffer_0 = self._get_data(file_path)
+		buffer_0 = self.get_prepared(file_path)
 		self.create_data_entry((buffer_0,))
 
 		self.header = LuaRoot(self.ovl.context)
@@ -57,7 +57,7 @@ class LuaLoader(MemStructLoader):
 			out_files.append(out_path)
 		return out_files
 
-	def _get_data(self, file_path):
+	def prepare(self, file_path):
 		"""Loads and returns the data for a LUA"""
 		buffer_0 = self.get_content(file_path)
 		if error_flag in buffer_0:
@@ -78,7 +78,7 @@ class ManisLoader(MemStructLoader):
 		self.header = self.target_class.from_stream(stream, self.context)
 
 	def create(self, file_path):
-		manis_file, root_data, b0, b1, b2 = self._get_data(file_path)
+		manis_file, root_data, b0, b1, b2 = self.get_prepared(file_path)
 		ms2_dir = os.path.dirname(file_path)
 		self.header = manis_file.header
 		# create mani files
@@ -95,7 +95,7 @@ class ManisLoader(MemStructLoader):
 		else:
 			self.create_data_entry((b0, b1, b2))
 
-	def _get_data(self, file_path):
+	def prepare(self, file_path):
 		"""Loads and returns the data for a manis"""
 		manis_file = ManisFile()
 		manis_file.load(file_path)
@@ -13,7 +13,7 @@ class MechanicresearchsettingsLoader(MemStructLoader):
 				research.next_research.data = None
 
 	def create(self, file_path):
-		self.header = self.target_class.from_xml_file(file_path, self.ovl.context)
+		self.header = self.get_prepared(file_path)
 		self.prep()
 		self.write_memory_data()
 
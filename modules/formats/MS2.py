@@ -90,9 +90,13 @@ class Ms2Loader(MemStructLoader):
 					return ptr.target_pool, ptr.target_offset
 		return self.header.model_infos.target_pool, None
 
-	def create(self, file_path):
+	def prepare(self, file_path):
 		ms2_file = Ms2File()
 		ms2_file.load(file_path, read_bytes=True)
+		return ms2_file
+
+	def create(self, file_path):
+		ms2_file = self.get_prepared(file_path)
 		ms2_dir = os.path.dirname(file_path)
 		self.ovl.is_dev = not ms2_file.biosyn
 		self.context = Ms2Context()
@@ -208,7 +212,7 @@ class Ms2Loader(MemStructLoader):
 			stream.write(verts)
 			for loader in self.streams:
 				# logging.debug(f"Writing {loader.name} at {stream.tell()}")
-				stream.write(loader.data_entry.buffer_datas[0])
+				stream.write(loader.data_entry.buffer_views[0])
 				
 		return out_paths
 	
@@ -27,6 +27,6 @@ class ParticleEffetLoader(MimeVersionedLoader):
 		fp = f"{paths[0]}buffer"
 		paths.append(fp)
 		with open(fp, "wb") as f:
-			for i, b in enumerate(self.data_entry.buffer_datas):
+			for i, b in enumerate(self.data_entry.buffer_views):
 				f.write(b)
 		return paths
@@ -23,7 +23,7 @@ class PathMaterialLoader(MemStructLoader):
 			self.header.mat_data.data = None
 
 	def create(self, file_path):
-		self.header = self.target_class.from_xml_file(file_path, self.ovl.context)
+		self.header = self.get_prepared(file_path)
 		self.prep()
 		self.write_memory_data()
 
@@ -48,7 +48,7 @@ class PathJoinPartResourceLoader(MemStructLoader):
 				res.unk_points_3.data = None
 
 	def create(self, file_path):
-		self.header = self.target_class.from_xml_file(file_path, self.ovl.context)
+		self.header = self.get_prepared(file_path)
 		self.prep()
 		self.write_memory_data()
 
@@ -75,6 +75,6 @@ class SupportSetLoader(MemStructLoader):
 			self.header.connector_2.data = None
 
 	def create(self, file_path):
-		self.header = self.target_class.from_xml_file(file_path, self.ovl.context)
+		self.header = self.get_prepared(file_path)
 		self.prep()
 		self.write_memory_data()
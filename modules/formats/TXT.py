@@ -13,20 +13,26 @@ class TxtLoader(BaseFile):
 		pool.num_files += 1
 
 	def extract(self, out_dir):
+		out_path = out_dir(self.name)
+		with open(out_path, "wb") as f:
+			f.write(self._get_text())
+		return out_path,
+
+	def extract_to_memory(self):
+		yield self.name, self._get_text()
+
+	def _get_text(self):
+		"""Returns the bytes of the TXT without its size"""
 		pool, offset = self.root_ptr
 		b = pool.get_data_at(offset)
 		# sized strings
 		if is_dla(self.ovl):
 			# unk = 128, usually
 			size, unk = struct.unpack("<2B", b[:2])
-			data = b[2:2+size*2]
+			return b[2:2+size*2]
 		else:
 			size = struct.unpack("<I", b[:4])[0]
-			data = b[4:4+size]
-		out_path = out_dir(self.name)
-		with open(out_path, "wb") as f:
-			f.write(data)
-		return out_path,
+			return b[4:4+size]
 
 	def _get_data(self, file_path):
 		"""Loads and returns the data for a TXT"""
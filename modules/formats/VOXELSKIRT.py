@@ -29,7 +29,7 @@ class VoxelskirtLoader(MemStructLoader):
 	target_class = VoxelskirtRoot
 
 	def create(self, file_path):
-		self.header = self.target_class.from_xml_file(file_path, self.ovl.context)
+		self.header = self.get_prepared(file_path)
 		stream = io.BytesIO()
 		basepath = os.path.splitext(file_path)[0]
 		names_lut = {name.name: i for i, name in enumerate(self.header.names.data)}
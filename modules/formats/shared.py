@@ -4,6 +4,8 @@ import logging
 import struct
 import time
 
+import numpy as np
+
 
 def get_padding_size(size, alignment=16):
     mod = size % alignment
@@ -28,6 +30,28 @@ def djb2(s):
     return n & 0xFFFFFFFF
 
 
+def djb2_array(strings):
+    # calculates djb2 hashes for a sequence of strings as a uint32 array, same as djb2 for each string
+    # codepoints are read column by column from a UCS4 array, uint32 overflow does the masking
+    codepoints = np.array(strings, dtype=str)
+    hashes = np.full(len(codepoints), 5381, dtype=np.uint32)
+    if not codepoints.size or not codepoints.itemsize:
+        return hashes
+    columns = np.asfortranarray(codepoints.view(np.uint32).reshape(len(codepoints), -1))
+    for i in range(columns.shape[1]):
+        hashes *= np.uint32(33)
+        hashes += columns[:, i]
+    # each trailing 0 of a shorter string multiplied its hash by 33, which is odd and thus invertible mod 2 ** 32
+    max_len = columns.shape[1]
+    inverse_powers = np.empty(max_len + 1, dtype=np.uint32)
+    inverse_powers[0] = 1
+    inverse_powers[1:] = pow(33, -1, 2 ** 32)
+    np.multiply.accumulate(inverse_powers, out=inverse_powers)
+    lengths = np.fromiter(map(len, strings), dtype=np.int64, count=len(codepoints))
+    hashes *= inverse_powers[max_len - lengths]
+    return hashes
+
+
 def fmt_hash(id_hash):
     return "".join([f"{b:02X}" for b in struct.pack("<I", id_hash)])
 
@@ -0,0 +1,160 @@
+import logging
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+
+from generated.formats.ovl import OvlFile
+from modules.formats.shared import djb2, DummyReporter
+from root_path import root_dir
+
+# increment when the tables change, to rebuild an outdated index
+SCHEMA_VERSION = 2
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS ovls (id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL, mtime INTEGER, size INTEGER);
+CREATE TABLE IF NOT EXISTS files (ovl_id INTEGER NOT NULL, name TEXT NOT NULL, ext TEXT NOT NULL, file_hash INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS dependencies (ovl_id INTEGER NOT NULL, file_name TEXT NOT NULL, file_hash INTEGER NOT NULL, ext TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS included_ovls (ovl_id INTEGER NOT NULL, name TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS files_ovl ON files (ovl_id);
+CREATE INDEX IF NOT EXISTS files_hash ON files (file_hash);
+CREATE INDEX IF NOT EXISTS dependencies_ovl ON dependencies (ovl_id);
+CREATE INDEX IF NOT EXISTS dependencies_hash ON dependencies (file_hash, ext);
+CREATE INDEX IF NOT EXISTS included_ovls_ovl ON included_ovls (ovl_id);
+"""
+CONTENT_TABLES = ("files", "dependencies", "included_ovls")
+# sqlite limits the number of parameters per query
+MAX_PARAMS = 900
+
+
+def scan_ovl(ovl_path):
+	"""Returns the indexed contents of ovl_path as plain lists, so it can run in a worker process"""
+	try:
+		scan = OvlFile.scan_header(ovl_path)
+	except:
+		logging.exception(f"Reading {ovl_path} failed")
+		return None
+	files_name = scan.files_name
+	files = [(name, ext, int(h)) for name, ext, h in zip(files_name, scan.files_ext, scan.files["file_hash"])]
+	dependencies = [(files_name[f_i], int(h), ext) for f_i, h, ext in zip(
+		scan.dependencies["file_index"], scan.dependencies["file_hash"], scan.dependencies_ext)]
+	return files, dependencies, scan.included_ovls_name
+
+
+class OvlIndex:
+	"""Persistent index of the files, dependencies and included ovls of every ovl in a game install"""
+
+	def __init__(self, db_path=os.path.join(root_dir, "ovl_index.sqlite")):
+		self.db_path = db_path
+		self.con = sqlite3.connect(db_path)
+		# sqlite's lower() only folds ascii
+		self.con.create_function("casefold", 1, str.casefold, deterministic=True)
+		version, = self.con.execute("PRAGMA user_version").fetchone()
+		if version != SCHEMA_VERSION:
+			logging.info(f"Rebuilding outdated ovl index at {db_path}")
+			for table in ("ovls", *CONTENT_TABLES):
+				self.con.execute(f"DROP TABLE IF EXISTS {table}")
+			self.con.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+		self.con.executescript(SCHEMA)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+	def close(self):
+		self.con.close()
+
+	@staticmethod
+	def path_filter(start_dir):
+		"""Returns a where clause and its parameters that only match ovls inside start_dir, ignoring case"""
+		prefix = os.path.join(os.path.normpath(start_dir), "")
+		return "casefold(substr(ovls.path, 1, ?)) = ?", (len(prefix), prefix.casefold())
+
+	def update(self, start_dir, reporter=DummyReporter(), max_workers=None):
+		"""Scan new and modified ovls in start_dir on several processes and drop deleted ones, returns the scanned paths"""
+		from modules.walker import walk_type
+		where, params = self.path_filter(start_dir)
+		# the same file may have been indexed through a start_dir cased differently
+		indexed = {os.path.normcase(path): (ovl_id, mtime, size) for ovl_id, path, mtime, size in self.con.execute(
+			f"SELECT id, path, mtime, size FROM ovls WHERE {where}", params)}
+		stale = {}
+		for ovl_path in walk_type(start_dir, extension=".ovl"):
+			ovl_path = os.path.normpath(ovl_path)
+			stat = os.stat(ovl_path)
+			# size is stored in an sqlite integer, mtime in nanoseconds fits as well
+			ovl_id, mtime, size = indexed.pop(os.path.normcase(ovl_path), (None, None, None))
+			if (mtime, size) != (stat.st_mtime_ns, stat.st_size):
+				stale[ovl_path] = (ovl_id, stat.st_mtime_ns, stat.st_size)
+		with self.con:
+			# whatever is left was deleted
+			self.delete(ovl_id for ovl_id, mtime, size in indexed.values())
+			if not stale:
+				return []
+			logging.info(f"Indexing {len(stale)} ovls in {start_dir}")
+			paths = list(stale)
+			with ProcessPoolExecutor(max_workers) as executor:
+				for ovl_path, contents in zip(
+						reporter.iter_progress(paths, "Indexing"),
+						executor.map(scan_ovl, paths, chunksize=16)):
+					ovl_id, mtime, size = stale[ovl_path]
+					self.delete((ovl_id, ))
+					# store a failed scan too, so it is only retried once the file changes
+					ovl_id = self.con.execute(
+						"INSERT INTO ovls (path, mtime, size) VALUES (?, ?, ?)", (ovl_path, mtime, size)).lastrowid
+					if contents:
+						files, dependencies, included_ovls = contents
+						self.con.executemany(
+							"INSERT INTO files VALUES (?, ?, ?, ?)", [(ovl_id, *row) for row in files])
+						self.con.executemany(
+							"INSERT INTO dependencies VALUES (?, ?, ?, ?)", [(ovl_id, *row) for row in dependencies])
+						self.con.executemany(
+							"INSERT INTO included_ovls VALUES (?, ?)", [(ovl_id, name) for name in included_ovls])
+		return paths
+
+	def delete(self, ovl_ids):
+		ovl_ids = [(ovl_id, ) for ovl_id in ovl_ids if ovl_id is not None]
+		for table in CONTENT_TABLES:
+			self.con.executemany(f"DELETE FROM {table} WHERE ovl_id = ?", ovl_ids)
+		self.con.executemany("DELETE FROM ovls WHERE id = ?", ovl_ids)
+
+	def is_indexed(self, start_dir):
+		"""Returns whether any ovl in start_dir is indexed"""
+		where, params = self.path_filter(start_dir)
+		return self.con.execute(f"SELECT 1 FROM ovls WHERE {where} LIMIT 1", params).fetchone() is not None
+
+	def search_files(self, start_dir, search_str):
+		"""Yields ovl path, file name and extension for all files in start_dir whose name contains search_str"""
+		where, params = self.path_filter(start_dir)
+		yield from self.con.execute(
+			f"SELECT ovls.path, files.name, files.ext FROM files JOIN ovls ON ovls.id = files.ovl_id "
+			f"WHERE {where} AND instr(files.name, ?) ORDER BY ovls.path", (*params, search_str))
+
+	def lookup(self, start_dir, hashes):
+		"""Returns a dict with the basenames of those hashes that name a file in start_dir"""
+		where, params = self.path_filter(start_dir)
+		hashes = sorted({int(h) for h in hashes})
+		names = {}
+		for i in range(0, len(hashes), MAX_PARAMS):
+			chunk = hashes[i: i + MAX_PARAMS]
+			for h, name in self.con.execute(
+					f"SELECT files.file_hash, files.name FROM files JOIN ovls ON ovls.id = files.ovl_id "
+					f"WHERE {where} AND files.file_hash IN ({', '.join('?' * len(chunk))})", (*params, *chunk)):
+				names[h] = os.path.splitext(name)[0]
+		return names
+
+	def search_dependents(self, start_dir, dep_name):
+		"""Yields ovl path and file name for all files in start_dir that depend on dep_name"""
+		where, params = self.path_filter(start_dir)
+		basename, ext = os.path.splitext(dep_name.lower())
+		yield from self.con.execute(
+			f"SELECT ovls.path, dependencies.file_name FROM dependencies JOIN ovls ON ovls.id = dependencies.ovl_id "
+			f"WHERE {where} AND dependencies.file_hash = ? AND dependencies.ext = ? ORDER BY ovls.path",
+			(*params, djb2(basename), ext))
+
+	def search_included_ovls(self, start_dir, ovl_name):
+		"""Yields the path of all ovls in start_dir that include ovl_name"""
+		where, params = self.path_filter(start_dir)
+		for row in self.con.execute(
+				f"SELECT ovls.path FROM included_ovls JOIN ovls ON ovls.id = included_ovls.ovl_id "
+				f"WHERE {where} AND included_ovls.name = ? ORDER BY ovls.path", (*params, ovl_name)):
+			yield row[0]
@@ -2,8 +2,9 @@ import io
 import os
 import logging
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
-from experimentals.convert_constants import write_mimes_dict, write_hashes_dict
+from experimentals.convert_constants import write_mimes_dict
 from generated.array import Array
 from generated.formats.fgm.compounds.FgmHeader import FgmHeader
 from generated.formats.manis.compounds.ManiInfo import ManiInfo
@@ -13,7 +14,9 @@ from generated.formats.ovl_base import OvlContext
 from generated.formats.ms2 import Ms2File
 from generated.formats.ovl import OvlFile
 from generated.formats.ovl_base.versions import games
-from constants import Mime, Shader
+from modules.batch import BatchJob, BatchScheduler, extract_ovl, MEMORY_FACTOR, ovl_disk_size
+from modules.ovl_index import OvlIndex
+from constants import HashStore, Mime, Shader
 from root_path import root_dir
 
 # get this huge dict from fgm walker, use in ms2 walker
@@ -47,75 +50,111 @@ def filter_accept_all(ovl_path):
 def search_for_files_in_ovls(gui, start_dir, search_str):
 	if start_dir:
 		with gui.reporter.log_duration(f"Searching"):
-			ovl_data = OvlFile()
-			ovl_files = walk_type(start_dir, extension=".ovl")
-			for of_index, ovl_path in enumerate(gui.reporter.iter_progress(ovl_files, "Searching")):
-				file_names = ovl_data.load(ovl_path, commands={"generate_names": True})
-				for file_name in file_names:
-					if search_str in file_name:
-						yield ovl_path, file_name, os.path.splitext(file_name)[1]
+			# only ovls that changed since the last search are read again
+			with OvlIndex() as index:
+				index.update(start_dir, gui.reporter)
+				yield from index.search_files(start_dir, search_str)
 
 
-def generate_hash_table(gui, start_dir):
+def search_for_dependents_in_ovls(gui, start_dir, dep_name):
+	"""Yields ovl path and file name of the files that depend on dep_name"""
+	if start_dir:
+		with gui.reporter.log_duration(f"Searching"):
+			with OvlIndex() as index:
+				index.update(start_dir, gui.reporter)
+				yield from index.search_dependents(start_dir, dep_name)
+
+
+# plain arrays without fields, np vectorized arrays with tuple of field names
+MIME_LISTS = {"mimes_name": (), "mimes_triplets": (), "mimes": ("mime_hash", "mime_version"), "files": ("pool_type", "set_pool_type")}
+
+
+def set_mime_value(mimes, ext, list_name, short_var, v, errors):
+	"""Store v for ext in mimes, adds an error if a different value was stored before"""
+	values = mimes.setdefault(ext, {})
+	# if the value already exists, make sure it is indeed constant (for this version)
+	if short_var in values:
+		v_old = values[short_var][1]
+		if v != v_old and v_old:
+			errors.append(f"{list_name}.{short_var} is not constant for {ext}! ({v} vs. {v_old})")
+	values[short_var] = (list_name, v)
+
+
+def scan_ovl_constants(ovl_path, hash_exts):
+	"""Map step of generate_hash_table, returns the partial hash and mime tables of one ovl"""
+	# read ovl header, without using internal data
+	ovl_scan = OvlFile.scan_header(ovl_path)
+	hashes = {int(h): basename for h, basename, ext in zip(
+		ovl_scan.files["file_hash"], ovl_scan.files_basename, ovl_scan.files_ext) if ext in hash_exts}
+	mimes = {}
+	errors = []
+	for list_id, attribs in MIME_LISTS.items():
+		array = getattr(ovl_scan, list_id)
+		if attribs:
+			arrays = {att: array[att] for att in attribs}
+		else:
+			arrays = {list_id: array}
+		exts = [f".{ext}" for ext in ovl_scan.mimes_ext] if "mimes" in list_id else ovl_scan.files_ext
+		for list_name, subarray in arrays.items():
+			for ext, v in zip(exts, subarray):
+				short_var = list_name.replace("mime_", "").replace("mimes_", "").replace("files_", "").replace("_type", "")
+				if short_var == "triplets":
+					v = [(int(t.a), int(t.b), int(t.c)) for t in v]
+				elif not isinstance(v, str):
+					v = int(v)
+				set_mime_value(mimes, ext, list_name, short_var, v, errors)
+	return hashes, set(ovl_scan.dependencies_ext), mimes, errors
+
+
+def generate_hash_table(gui, start_dir, max_workers=None):
 	hashes = {}
 	if start_dir:
 		with gui.reporter.log_duration(f"Reading hashes"):
-			# don't use internal data
-			ovl_data = OvlFile()
 			all_deps_exts = set()
 			# these are the input for which hashes should be stored
 			hash_exts = {'.enumnamer', '.lua', '.model2stream', '.particleatlas', '.prefab', '.specdef', '.tex'}
 			# when specdef and prefab are left out of the hash table, jwe2 hashtable shrinks from 25 MB down to 0.8MB
 			# but that would need to make sure the respective files don't raise warnings on opening
 			# hash_exts = {'.enumnamer', '.lua', '.model2stream', '.particleatlas', '.tex'}
-			# plain arrays without fields, np vectorized arrays with tuple of field names
-			lists = {"mimes_name": (), "mimes_triplets": (), "mimes": ("mime_hash", "mime_version"), "files": ("pool_type", "set_pool_type")}
 
 			mimes = {}
 			error_files = []
-			ovl_files = walk_type(start_dir, extension=".ovl")
-			for of_index, ovl_path in enumerate(gui.reporter.iter_progress(ovl_files, "Hashing")):
-				if not filter_accept_official(ovl_path):
-					continue
-				try:
-					# read ovl file
-					new_hashes, new_exts = ovl_data.load(ovl_path, commands={"generate_hash_table": hash_exts})
+			ovl_files = [ovl_path for ovl_path in walk_type(start_dir, extension=".ovl") if filter_accept_official(ovl_path)]
+			# map each ovl on a worker process, reduce in the order of ovl_files so that the checks are deterministic
+			with ProcessPoolExecutor(max_workers) as executor:
+				futures = [executor.submit(scan_ovl_constants, ovl_path, hash_exts) for ovl_path in ovl_files]
+				for ovl_path, future in zip(gui.reporter.iter_progress(ovl_files, "Hashing"), futures):
+					try:
+						new_hashes, new_exts, new_mimes, errors = future.result()
+					except:
+						logging.exception(f"Reading {ovl_path} failed")
+						error_files.append(ovl_path)
+						continue
 					all_deps_exts.update(new_exts)
-					for list_id, attribs in lists.items():
-						array = getattr(ovl_data, list_id)
-						if attribs:
-							arrays = {att: array[att] for att in attribs}
-						else:
-							arrays = {list_id: array}
-						exts = [f".{ext}" for ext in ovl_data.mimes_ext] if "mimes" in list_id else ovl_data.files_ext
-						for list_name, subarray in arrays.items():
-							for ext, v in zip(exts, subarray):
-
-								short_var = list_name.replace("mime_", "").replace("mimes_", "").replace("files_", "").replace("_type", "")
-								if short_var == "triplets":
-									v = [(t.a, t.b, t.c) for t in v]
-								# if the value already exists, make sure it is indeed constant (for this version)
-								if ext in mimes:
-									v_old = getattr(mimes[ext], short_var)
-									if v != v_old and v_old:
-										logging.error(f"{list_name}.{short_var} is not constant for {ext}! ({v} vs. {v_old})")
-								else:
-									mimes[ext] = Mime("", 0, 0, [], 0, 0)
-								setattr(mimes[ext], short_var, v)
+					for ext, values in new_mimes.items():
+						for short_var, (list_name, v) in values.items():
+							set_mime_value(mimes, ext, list_name, short_var, v, errors)
+					for error in errors:
+						logging.error(error)
 					hashes.update(new_hashes)
-				except:
-					logging.exception(f"Reading {ovl_path} failed")
-					error_files.append(ovl_path)
 			if error_files:
 				logging.error(f"{error_files} caused errors!")
 			out_dir = get_output_dir(start_dir)
 			# with open(os.path.join(out_dir, "hashes.json"), "w") as json_writer:
 			# 	json.dump(hashes, json_writer, indent="\t", sort_keys=True)
-			write_hashes_dict(os.path.join(out_dir, "hashes.py"), hashes)
-			write_mimes_dict(os.path.join(out_dir, "mimes.py"), mimes)
+			HashStore.write(os.path.join(out_dir, "hashes.bin"), hashes)
+			write_mimes_dict(os.path.join(out_dir, "mimes.py"), {ext: as_mime(values) for ext, values in mimes.items()})
 		logging.info(f"Formats used in dependencies: {[s.replace(':', '.') for s in sorted(all_deps_exts)]}")
 
 
+def as_mime(values):
+	"""Create a Mime from the values collected by generate_hash_table"""
+	mime = Mime("", 0, 0, [], 0, 0)
+	for short_var, (list_name, v) in values.items():
+		setattr(mime, short_var, v)
+	return mime
+
+
 def get_output_dir(start_dir):
 	# try to find a matching game
 	for game in reversed(games):
@@ -292,6 +331,8 @@ def ovls_in_path(gui, start_dir, only_types):
 	ovl_files = walk_type(start_dir, extension=".ovl")
 	for of_index, ovl_path in enumerate(gui.reporter.iter_progress(ovl_files, "Walking OVL files")):
 		try:
+			# free the previous ovl before reading the next one into the same instance
+			ovl_data.close()
 			# read ovl file
 			ovl_data.load(ovl_path, commands={"only_types": only_types})
 			yield ovl_data, ovl_path
@@ -300,17 +341,22 @@ def ovls_in_path(gui, start_dir, only_types):
 			# errors.append((ovl_path, ex))
 
 
-def bulk_extract_ovls(errors, export_dir, gui, start_dir, only_types):
-	for ovl_data, ovl_path in ovls_in_path(gui, start_dir, only_types):
-		try:
-			# create an output folder for it
-			rel_p = os.path.relpath(ovl_path, start=start_dir)
-			rel_d = os.path.splitext(rel_p)[0]
-			out_dir = os.path.join(export_dir, rel_d)
-			ovl_data.extract(out_dir, only_types=only_types)
-		except Exception as ex:
-			logging.exception(f"Extracting OVL failed: {ovl_path}")
-			errors.append((ovl_path, ex))
+def bulk_extract_ovls(errors, export_dir, gui, start_dir, only_types, max_workers=None, memory_budget=None, timeout=None):
+	"""Extract the ovls in start_dir on several processes, resumes an interrupted or failed run from its manifest"""
+	jobs = []
+	for ovl_path in walk_type(start_dir, extension=".ovl"):
+		# create an output folder for it
+		rel_p = os.path.relpath(ovl_path, start=start_dir)
+		rel_d = os.path.splitext(rel_p)[0]
+		out_dir = os.path.join(export_dir, rel_d)
+		jobs.append(BatchJob(ovl_path, (ovl_path, out_dir, only_types), ovl_disk_size(ovl_path) * MEMORY_FACTOR))
+	os.makedirs(export_dir, exist_ok=True)
+	# walkers for other file types share the export_dir, so each gets its own manifest
+	types_suffix = "_".join(ext.lstrip(".") for ext in only_types) or "all"
+	scheduler = BatchScheduler(
+		os.path.join(export_dir, f"extract_manifest_{types_suffix}.json"), max_workers, memory_budget, timeout, gui.reporter)
+	summary = scheduler.run(extract_ovl, jobs, "Extracting OVLs")
+	errors.extend(summary.failed.items())
 
 
 def get_fgm_values(gui, start_dir, walk_ovls=True, walk_fgms=True):
@@ -10,7 +10,7 @@ from ovl_util.logs import HtmlFormatter, AnsiFormatter, get_stdout_handler
 from gui.widgets import Reporter
 from modules import walker
 from root_path import root_dir
-from generated.formats.ovl import games, OvlFile
+from generated.formats.ovl import games, OvlFile, SAVE_PROFILES
 from generated.formats.ovl_base.enums.Compression import Compression
 from PyQt5 import QtWidgets, QtGui, QtCore
 from typing import Any, Optional
@@ -35,6 +35,11 @@ class MainWindow(widgets.MainWindow):
 		self.ovl_game_choice = widgets.LabelCombo("Game", [g.value for g in games], editable=False, changed_fn=self.game_changed)
 
 		self.compression_choice = widgets.LabelCombo("Compression", [c.name for c in Compression], editable=False, changed_fn=self.compression_changed)
+		self.profile_choice = widgets.LabelCombo("Save Profile", list(SAVE_PROFILES), editable=False, changed_fn=self.profile_changed)
+		if self.cfg.get("save_profile") in SAVE_PROFILES:
+			self.profile_choice.entry.setText(self.cfg["save_profile"])
+		else:
+			self.profile_choice.entry.setText("balanced")
 
 		if "games" not in self.cfg:
 			self.cfg["games"] = {}
@@ -129,6 +134,7 @@ class MainWindow(widgets.MainWindow):
 		grid.addWidget(self.ovl_game_choice, 0, 3)
 		grid.addWidget(self.compression_choice, 1, 3)
 		grid.addWidget(self.extract_types_combo, 2, 3)
+		grid.addWidget(self.profile_choice, 3, 3)
 
 		self.stdout_handler = get_stdout_handler("ovl_tool_gui")  # self.log_name not set until after init
 
@@ -181,6 +187,7 @@ class MainWindow(widgets.MainWindow):
 			(util_menu, "Open Tools Dir", self.open_tools_dir, "", "home"),
 			(util_menu, "Export File List", self.save_file_list, "", ""),
 			(util_menu, "Compare with other OVL", self.compare_ovls, "", ""),
+			(util_menu, "Find Dependents", self.search_dependents, "", ""),
 			(help_menu, "Report Bug", self.report_bug, "", "report"),
 			(help_menu, "Documentation", self.online_support, "", "manual"))
 		self.add_to_menu(button_data)
@@ -249,13 +256,42 @@ class MainWindow(widgets.MainWindow):
 
 	def search_ovl_contents(self, search_str):
 		start_dir = self.installed_games.get_root()
-		results = [(filename, ext, ovl.replace(start_dir, '')) for ovl, filename, ext in walker.search_for_files_in_ovls(self, start_dir, search_str)]
-		self.results_container = widgets.SortableTable(["Name", "File Type", "OVL"], self.ovl_data.formats_dict.ignore_types,
-												  ignore_drop_type="OVL", opt_hide=True)
-		self.results_container.set_data(results)
+		self.run_search(["Name", "File Type", "OVL"], self.collect_ovl_contents, start_dir, search_str, opt_hide=True)
+		# f"Found {len(results)} occurences of '{search_str}' in '{start_dir}'. Click 'Show Details' below to see the results."
+
+	def collect_ovl_contents(self, start_dir, search_str):
+		# the index stores normalized paths
+		return [(filename, ext, ovl.replace(os.path.normpath(start_dir), '')) for ovl, filename, ext in walker.search_for_files_in_ovls(self, start_dir, search_str)]
+
+	def search_dependents(self):
+		selected_file_names = self.files_container.table.get_selected_files()
+		if not selected_file_names:
+			self.showwarning("Please select files to find their dependents first")
+			return
+		start_dir = self.installed_games.get_root()
+		self.run_search(["Name", "Dependency", "OVL"], self.collect_dependents, start_dir, selected_file_names)
+
+	def collect_dependents(self, start_dir, dep_names):
+		results = []
+		for dep_name in dep_names:
+			results.extend((file_name, dep_name, ovl.replace(os.path.normpath(start_dir), '')) for ovl, file_name in walker.search_for_dependents_in_ovls(self, start_dir, dep_name))
+		return results
+
+	def run_search(self, header_names, collect_func, *args, opt_hide=False):
+		"""Collect the results of a search on the worker thread, as updating the index may take a while"""
+		self.search_results = []
+		self.search_table_args = (header_names, opt_hide)
+		self.run_threaded(lambda: self.search_results.extend(collect_func(*args)))
+		# the table must be created on the gui thread, once the search is done
+		self.thread.finished.connect(self.show_search_results)
+
+	def show_search_results(self):
+		header_names, opt_hide = self.search_table_args
+		self.results_container = widgets.SortableTable(header_names, self.ovl_data.formats_dict.ignore_types,
+													   ignore_drop_type="OVL", opt_hide=opt_hide)
+		self.results_container.set_data(self.search_results)
 		self.results_container.setGeometry(QtCore.QRect(100, 100, 1000, 600))
 		self.results_container.show()
-		# f"Found {len(results)} occurences of '{search_str}' in '{start_dir}'. Click 'Show Details' below to see the results."
 
 	def notify_user(self, msg_list):
 		msg = msg_list[0]
@@ -271,6 +307,7 @@ class MainWindow(widgets.MainWindow):
 		self.t_mesh_ovl.setEnabled(enable)
 		self.t_walk_ovl.setEnabled(enable)
 		self.compression_choice.setEnabled(enable)
+		self.profile_choice.setEnabled(enable)
 		self.ovl_game_choice.setEnabled(enable)
 		# just disable all actions
 		for action_name in self.actions.keys():
@@ -392,13 +429,27 @@ class MainWindow(widgets.MainWindow):
 		compression_value = Compression[compression]
 		self.ovl_data.user_version.compression = compression_value
 
+	def profile_changed(self, profile: str):
+		self.cfg["save_profile"] = profile
+
 	def show_dependencies(self, file_index):
 		# just an example of what can be done when something is selected
 		file_entry = self.ovl_data.files[file_index]
 
+	def get_dep_commands(self, filepath):
+		"""Resolve unknown dependency hashes with the other installed games and the index of the ovl's game"""
+		game = self.ovl_game_choice.entry.currentText()
+		commands = {"dep_fallback_games": [other_game for other_game in self.cfg["games"] if other_game != game]}
+		ovl_path = os.path.normcase(os.path.abspath(filepath))
+		for game_dir in self.cfg["games"].values():
+			if game_dir and ovl_path.startswith(os.path.join(os.path.normcase(os.path.abspath(game_dir)), "")):
+				commands["dep_index_dir"] = game_dir
+		return commands
+
 	def open(self, filepath, threaded=True):
 		if filepath:
 			commands = {"game": self.ovl_game_choice.entry.currentText()}
+			commands.update(self.get_dep_commands(filepath))
 			self.set_file_modified(False)
 			logging.debug(f"Loading threaded {threaded}")
 			if threaded:
@@ -445,7 +496,7 @@ class MainWindow(widgets.MainWindow):
 	def save(self, filepath):
 		"""Saves ovl to file_widget.filepath, clears dirty flag"""
 		try:
-			self.ovl_data.save(filepath)
+			self.ovl_data.save(filepath, self.profile_choice.entry.currentText())
 			self.set_file_modified(False)
 			self.set_msg_temporarily(f"Saved {self.ovl_data.basename}")
 		except:
@@ -468,7 +519,7 @@ class MainWindow(widgets.MainWindow):
 			if self.t_in_folder.isChecked():
 				rel_p = os.path.relpath(ovl.path_no_ext, start=selected_dir)
 				out_dir = os.path.join(_out_dir, rel_p)
-			ovl.extract(out_dir, only_types=only_types)
+			ovl.extract(out_dir, only_types=only_types, parallel=True)
 
 	def inject_ask(self):
 		files = QtWidgets.QFileDialog.getOpenFileNames(
@@ -479,10 +530,16 @@ class MainWindow(widgets.MainWindow):
 		"""Tries to inject files into self.ovl_data"""
 		if files:
 			self.cfg["dir_inject"] = os.path.dirname(files[0])
+			# planning is quick, so ask before the heavy work starts
+			plan = self.ovl_data.plan_injection(files)
+			if plan.errors and not self.showconfirmation(
+					f"{len(plan.errors)} of the selected files can not be injected, inject the other {len(plan.loaders)} files?",
+					details="\n".join(f"{error} for {file_path}" for file_path, error in plan.errors.items())):
+				return
 			self.set_file_modified(True)
 			# threaded injection seems to be fine now
 			# self.ovl_data.add_files(files)
-			self.run_threaded(self.ovl_data.add_files, files)
+			self.run_threaded(self.ovl_data.add_planned, plan, parallel=True)
 		# the gui is updated from the signal ovl.files_list emitted from add_files
 
 	def get_replace_strings(self):
@@ -1,12 +1,14 @@
 from __future__ import annotations
 import logging
+import multiprocessing
 import os
 import platform
 import sys
 import tempfile
+from contextlib import contextmanager
 from functools import partialmethod, partial
 from logging import StreamHandler
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import TextIO
 
 from ovl_util.config import load_config
@@ -259,6 +261,41 @@ def get_stdout_handler(name: str) -> StreamHandler | None:
 	return None
 
 
+class ForwardHandler(logging.Handler):
+	"""Hands records from worker processes to the logger of the same name on this process"""
+
+	def handle(self, record):
+		logger = logging.getLogger(record.name)
+		if logger.isEnabledFor(record.levelno):
+			logger.handle(record)
+		return record
+
+
+@contextmanager
+def worker_log_queue():
+	"""Yields a queue for init_worker_logging, the records put in it are logged on this process"""
+	queue = multiprocessing.Queue()
+	listener = QueueListener(queue, ForwardHandler())
+	listener.start()
+	try:
+		yield queue
+	finally:
+		# handles the records that are still queued
+		listener.stop()
+		queue.close()
+
+
+def init_worker_logging(queue, level):
+	"""Send all records of a worker process to queue, as spawned workers do not share the handlers of the main process"""
+	addLoggingLevel('SUCCESS', logging.INFO + 5)
+	logger = logging.getLogger()
+	# forked workers inherit the handlers, which would write the records twice
+	for handler in logger.handlers[:]:
+		logger.removeHandler(handler)
+	logger.addHandler(QueueHandler(queue))
+	logger.setLevel(level)
+
+
 def get_version():
 	init_path = f'{os.path.join(root_dir, "__init__")}.py'
 	with open(init_path, "r") as f:
@@ -15,26 +15,24 @@ from ovl_util.logs import logging_setup
 
 logging_setup("pack_tool_cmd")
 
-from generated.formats.ovl import games, OvlFile
+from generated.formats.ovl import games, SAVE_PROFILES
+from modules.batch import BatchJob, BatchScheduler, create_ovl, extract_ovl, MEMORY_FACTOR, ovl_disk_size
 print(games)
 __version__ = '0.1'
 __author__ = 'Open-Naja'
 
 def unpack_ovl(file, gamestr, pathsrc, pathdst):
+	"""Returns a job that extracts file from pathdst to the matching folder in pathsrc"""
 	srcbasepath = pathsrc
 	dstbasepath = pathdst
 	dstfolder = os.path.relpath(file, dstbasepath)
-	logging.info(f"Unpacking {dstfolder}")
 	filename = os.path.splitext(os.path.basename(dstfolder))[0]
 	srcfolder = os.path.join(srcbasepath, os.path.dirname(dstfolder), filename)
 
 	if not os.path.exists(srcfolder):
 		logging.info(srcfolder)
 		os.makedirs(srcfolder)
-
-	ovl_data = OvlFile()
-	ovl_data.load(file)
-	out_paths, error_files = ovl_data.extract(srcfolder, show_temp_files=False)
+	return BatchJob(dstfolder, (file, srcfolder, (), gamestr), ovl_disk_size(file) * MEMORY_FACTOR)
 
 
 def get_dst_file_list(basepath=''):
@@ -45,7 +43,7 @@ def get_dst_file_list(basepath=''):
 
 	return file_list
 
-def unpack_mod(gamestr, pathsrc, pathdst):
+def unpack_mod(gamestr, pathsrc, pathdst, scheduler=None):
 	srcbasepath = pathsrc
 	dstbasepath = pathdst
 	if not srcbasepath or not dstbasepath:
@@ -53,45 +51,28 @@ def unpack_mod(gamestr, pathsrc, pathdst):
 
 	logging.info("Unpacking mod")
 	dstfiles = get_dst_file_list(dstbasepath)
-	for file in dstfiles:
-		# ignore all other files, unpack ovl files only.
-		if file.lower().endswith(".ovl"):
-			unpack_ovl(file, gamestr, pathsrc, pathdst)
-			continue
+	# ignore all other files, unpack ovl files only.
+	jobs = [unpack_ovl(file, gamestr, pathsrc, pathdst) for file in dstfiles if file.lower().endswith(".ovl")]
+	if scheduler is None:
+		scheduler = BatchScheduler()
+	scheduler.manifest_path = os.path.join(srcbasepath, "unpack_manifest.json")
+	scheduler.run(extract_ovl, jobs, "Unpacking")
 
 	# The previous loop will not copy Manifest.xml and Readme.md files if any
 	copy_file(dstbasepath, srcbasepath, "Manifest.xml")
 	copy_file(dstbasepath, srcbasepath, "Readme.md")
 	copy_file(dstbasepath, srcbasepath, "License")
 
-def create_ovl(gamestr, ovl_dir, dst_file):
-	# clear the ovl
-	ovl_data.clear()
-	ovl_data.game = gamestr
-	try:
-		ovl_data.create(ovl_dir)
-		ovl_data.save(dst_file)
-		return True
-	except:
-		logging.exception(f"Could not create OVL from {ovl_dir}")
-		return False
-
 # relative path
-def pack_folder(folder, gamestr, pathsrc, pathdst):
-	logging.info(f"Packing {folder}")
+def pack_folder(folder, gamestr, pathsrc, pathdst, profile="balanced"):
+	"""Returns a job that creates the ovl for folder in pathsrc in pathdst"""
 	srcbasepath = pathsrc
 	dstbasepath = pathdst
 
-	if not srcbasepath:
-		logging.warning(f"Source must be set")
-		return
 	src_path = os.path.join(srcbasepath, folder)
 	dst_file = os.path.join(dstbasepath, folder) + ".ovl"
-	dst_path = os.path.dirname(dst_file)
-	if not os.path.exists(dst_path):
-		os.makedirs(dst_path)
-
-	create_ovl(gamestr, src_path, dst_file)
+	src_size = sum(f.stat().st_size for f in pathlib.Path(src_path).rglob('*') if f.is_file())
+	return BatchJob(folder, (src_path, dst_file, gamestr, profile), src_size * MEMORY_FACTOR)
 
 
 def get_src_folder_list(basepath=''):
@@ -108,16 +89,18 @@ def copy_file(srcpath, dstpath, fname):
 		logging.info(f"error copying: {fname}")
 
 
-def pack_mod(gamestr, pathsrc, pathdst):
+def pack_mod(gamestr, pathsrc, pathdst, scheduler=None, profile="balanced"):
 	logging.info("Packing mod")
+	if not pathsrc:
+		logging.warning(f"Source must be set")
+		return
 	subfolders = get_src_folder_list(pathsrc)
-	for folder in subfolders:
-		# ignore the project root for packing
-		if folder == '.':
-			# logging.info(f"Skipping {folder}: root")
-			continue
-		print(f"processing: {folder}")			
-		pack_folder(folder, gamestr, pathsrc, pathdst)
+	# ignore the project root for packing
+	jobs = [pack_folder(folder, gamestr, pathsrc, pathdst, profile) for folder in sorted(subfolders) if folder != '.']
+	if scheduler is None:
+		scheduler = BatchScheduler()
+	scheduler.manifest_path = os.path.join(pathdst, "pack_manifest.json")
+	scheduler.run(create_ovl, jobs, "Packing")
 
 	# Also copy Manifest.xml and Readme.md files if any
 	srcbasepath = pathsrc
@@ -145,10 +128,42 @@ def usage(msg):
 	print("")
 	print("Alternatively, you can use a .mptconfig file:")
 	print("Usage: pack_tool_cmd.py path/to/.mptconfig ACTION\n")
+	print("Options, to add after the arguments:")
+	print("  --workers N  number of ovls processed at once, defaults to the cpu count")
+	print("  --memory GB  start no more ovls than fit in this estimated memory")
+	print("  --timeout S  give up on an ovl after this many seconds")
+	print(f"  --profile P  compression of packed ovls, one of {', '.join(SAVE_PROFILES)}, defaults to balanced")
+	print("An interrupted or failed run resumes from the manifest it leaves in the output folder.")
 	exit()
 
+
+def pop_option(name, convert):
+	"""Removes --name value from the command line arguments and returns the converted value, or None"""
+	if name not in sys.argv:
+		return None
+	i = sys.argv.index(name)
+	try:
+		value = convert(sys.argv[i + 1])
+	except (IndexError, ValueError):
+		usage(f"Wrong value for {name}")
+	del sys.argv[i:i + 2]
+	return value
+
+
+def profile_name(name):
+	if name not in SAVE_PROFILES:
+		raise ValueError(f"Unknown save profile {name}")
+	return name
+
 if __name__ == '__main__':
 
+	max_workers = pop_option("--workers", int)
+	memory_budget = pop_option("--memory", float)
+	if memory_budget is not None:
+		memory_budget = int(memory_budget * 1024 ** 3)
+	scheduler = BatchScheduler(max_workers=max_workers, memory_budget=memory_budget, timeout=pop_option("--timeout", float))
+	profile = pop_option("--profile", profile_name) or "balanced"
+
 	if len( sys.argv ) < 3:
 		usage("Wrong number of arguments.")
 
@@ -168,13 +183,6 @@ if __name__ == '__main__':
 	if gamestr not in games._value2member_map_:
 		usage("Wrong game string")
 
-	# update gamestr to usable value after games refactor
-	for g in games:
-		if g.value == gamestr:
-			ovl_data = OvlFile()
-			ovl_data.load_hash_table()
-			ovl_data.game = gamestr
-
 	if action.lower() not in ['pack', 'unpack']:
 		usage("Wrong action")
 
@@ -185,9 +193,9 @@ if __name__ == '__main__':
 		usage("Wrong destination path")
 
 	if action.lower() == 'pack':
-		pack_mod(gamestr, pathsrc, pathdst)
+		pack_mod(gamestr, pathsrc, pathdst, scheduler, profile)
 
 	if action.lower() == 'unpack':
-		unpack_mod(gamestr, pathsrc, pathdst)
+		unpack_mod(gamestr, pathsrc, pathdst, scheduler)
 
 	print("done.\n\n")
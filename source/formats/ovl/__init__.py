@@ -1,26 +1,138 @@
+import hashlib
 import itertools
 import logging
+import mmap
 import os
+import pickle
 import re
 import struct
+import tempfile
 import zlib
-from collections import Counter
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import contextmanager
+from dataclasses import dataclass, field
 from io import BytesIO
 
-from constants import ConstantsProvider
+import numpy as np
+
+from constants import ConstantsProvider, HashStore
 from generated.formats.ovl.compounds.ArchiveEntry import ArchiveEntry
 from generated.formats.ovl.compounds.BufferGroup import BufferGroup
 from generated.formats.ovl.compounds.Header import Header
 from generated.formats.ovl.compounds.OvsHeader import OvsHeader
 from generated.formats.ovl.versions import *
 from generated.formats.ovl_base.enums.Compression import Compression
+from generated.io import ViewStream
 from modules.formats.formats_dict import FormatDict
-from modules.formats.shared import djb2, DummyReporter
+from modules.formats.shared import djb2, djb2_array, DummyReporter
+from ovl_util.logs import init_worker_logging, worker_log_queue
 from ovl_util.oodle.oodle import OodleDecompressEnum, oodle_compressor
 
 UNK_HASH = "UnknownHash"
 OODLE_MAGIC = (b'\x8c', b'\xcc')
+# bytes read at once when copying an unchanged archive
+COPY_CHUNK_SIZE = 1 << 20
+# archives (de)compressed ahead of the main thread at most, as each one holds its bytes in memory until it is used
+MAX_PENDING_ARCHIVES = 4
+# suffixes of the images that make up a tex
+CHANNEL_RE = re.compile(r"_[rgba]+$")
+ARRAY_RE = re.compile(r"_\[[0-9]+\]$")
+
+
+@dataclass
+class SaveProfile:
+	"""Settings for compressing the archives when saving an ovl"""
+	# zlib level, 1 is fastest and 9 is smallest
+	level: int = zlib.Z_DEFAULT_COMPRESSION
+	strategy: int = zlib.Z_DEFAULT_STRATEGY
+	# store the archives without compression, for quick local testing
+	uncompressed: bool = False
+
+
+@dataclass
+class ArchiveSource:
+	"""Where the compressed bytes of an archive are stored on disk"""
+	ovs_path: str
+	read_start: int
+	compressed_size: int
+	# as stored on the archive entry
+	uncompressed_size: int
+	compression: Compression
+	# of the decompressed bytes
+	checksum: bytes = b""
+
+
+@dataclass
+class InjectPlan:
+	"""How add_files handles each of the files it is given, by file path"""
+	# file name relative to the common root, for the files that get a loader
+	loaders: dict = field(default_factory=dict)
+	# reason, for the files that are read by the loader of another file, such as the pngs of a tex
+	companions: dict = field(default_factory=dict)
+	# reason, for the files that are not injected
+	ignored: dict = field(default_factory=dict)
+	# error, for the files that can not be injected without another file
+	errors: dict = field(default_factory=dict)
+
+
+SAVE_PROFILES = {
+	"fastest": SaveProfile(level=1),
+	"balanced": SaveProfile(),
+	"smallest": SaveProfile(level=9),
+	"uncompressed": SaveProfile(uncompressed=True),
+}
+
+
+@dataclass
+class OvlScan:
+	"""Names and entries from the header of an ovl, see OvlFile.scan_header"""
+	filepath: str
+	game: str
+	# structured arrays as stored in the header
+	mimes: np.ndarray
+	files: np.ndarray
+	dependencies: np.ndarray
+	mimes_name: list
+	mimes_triplets: list
+	files_basename: list
+	files_ext: list
+	dependencies_ext: list
+	included_ovls_name: list
+
+	@property
+	def mimes_ext(self):
+		# without leading . to avoid collisions on cases like JWE island.island
+		return [name.split(':')[-1] for name in self.mimes_name]
+
+	@property
+	def files_name(self):
+		return [f"{b}{e}" for b, e in zip(self.files_basename, self.files_ext)]
+
+
+def check_magic(stream, name):
+	"""Raise if stream does not start with the magic of a readable ovl"""
+	magic = stream.read(4)
+	stream.seek(0)
+	if magic == b"FRES":
+		pass
+	elif magic == b"FREA":
+		raise AttributeError(f"{name} is encrypted and cannot be read")
+	else:
+		raise AttributeError(f"Unknown OVL magic for {name}, cannot be read")
+
+
+def copy_range(source, stream):
+	"""Copy the compressed bytes of the archive at source to stream, one chunk at a time"""
+	with open(source.ovs_path, "rb") as source_stream:
+		source_stream.seek(source.read_start)
+		remaining = source.compressed_size
+		while remaining:
+			chunk = source_stream.read(min(remaining, COPY_CHUNK_SIZE))
+			if not chunk:
+				raise EOFError(f"{source.ovs_path} ends before the archive at {source.read_start}")
+			stream.write(chunk)
+			remaining -= len(chunk)
 
 
 def pairwise(iterable):
@@ -30,6 +142,67 @@ def pairwise(iterable):
 	return zip(a, b)
 
 
+# the ovl of a worker process, see OvlFile.extract and OvlFile.prepare_files
+_worker_ovl = None
+
+
+def init_extract_worker(filepath, commands, log_queue, log_level):
+	global _worker_ovl
+	init_worker_logging(log_queue, log_level)
+	_worker_ovl = OvlFile()
+	_worker_ovl.load_hash_table()
+	_worker_ovl.load(filepath, commands)
+
+
+def extract_worker(out_dir, names, do_debug):
+	"""Extract a shard of the worker's ovl, returns the extracted paths and failed names for each file"""
+	_worker_ovl.do_debug = do_debug
+	return [_worker_ovl.extract_loaders((_worker_ovl.loaders[name], ), out_dir) for name in names]
+
+
+def init_prepare_worker(game, is_dev, log_queue, log_level):
+	global _worker_ovl
+	init_worker_logging(log_queue, log_level)
+	_worker_ovl = OvlFile()
+	_worker_ovl.load_hash_table()
+	_worker_ovl.game = game
+	_worker_ovl.is_dev = is_dev
+
+
+def prepare_worker(file_path, file_name):
+	"""Returns the pickled result of the loader's prepare, or None if that failed"""
+	try:
+		_, ext = os.path.splitext(file_name)
+		loader = _worker_ovl.init_loader(file_name, ext)
+		with BytesIO() as stream:
+			OvlPickler(stream).dump(loader.prepare(file_path))
+			return stream.getvalue()
+	except:
+		logging.exception(f"Preparing {file_name} failed")
+		return None
+
+
+class OvlPickler(pickle.Pickler):
+	"""Pickles references to the ovl, so that structs prepared on a worker process use the ovl they are loaded for"""
+
+	def persistent_id(self, obj):
+		if isinstance(obj, OvlFile):
+			return "ovl"
+		return None
+
+
+class OvlUnpickler(pickle.Unpickler):
+
+	def __init__(self, file, ovl):
+		super().__init__(file)
+		self.ovl = ovl
+
+	def persistent_load(self, pid):
+		if pid == "ovl":
+			return self.ovl
+		raise pickle.UnpicklingError(f"Unsupported persistent id {pid}")
+
+
 class OvsFile(OvsHeader):
 
 	def __init__(self, context, ovl_inst, archive_entry):
@@ -39,6 +212,17 @@ class OvsFile(OvsHeader):
 		self.ovl = ovl_inst
 		# set arg later to avoid initializing huge arrays with default data
 		self.arg = archive_entry
+		# ArchiveSource if this archive was loaded or saved, to copy it on save if it did not change
+		self.source = None
+
+	def release(self):
+		"""Release the memory of the pools and buffers"""
+		for pool in self.pools:
+			pool.release()
+		for buffer in self.buffer_entries:
+			buffer.release()
+		self.pools.clear()
+		self.clear_ovs_arrays()
 
 	def clear_ovs_arrays(self):
 		self.arg.num_datas = self.arg.num_buffers = self.arg.num_buffer_groups = 0
@@ -48,7 +232,12 @@ class OvsFile(OvsHeader):
 
 	@contextmanager
 	def unzipper(self, compressed_bytes, uncompressed_size):
-		self.compression_header = compressed_bytes[:2]
+		with BytesIO(self.decompress(compressed_bytes, uncompressed_size)) as stream:
+			yield stream
+
+	def decompress(self, compressed_bytes, uncompressed_size):
+		"""decompress data with method according to ovl settings"""
+		self.compression_header = bytes(compressed_bytes[:2])
 		logging.debug(f"Compression magic bytes: {self.compression_header}, {len(compressed_bytes)} bytes total")
 		if self.ovl.user_version.compression == Compression.OODLE:
 			logging.debug(f"Oodle compression")
@@ -62,16 +251,45 @@ class OvsFile(OvsHeader):
 		else:
 			logging.debug("No compression")
 			decompressed = compressed_bytes
-		with BytesIO(decompressed) as stream:
-			yield stream
-
-	def compress(self, uncompressed_bytes):
+		return decompressed
+
+	def read_source(self, source, mapped=None):
+		"""Read the archive at source and decompress it, slicing it from mapped if that maps its file"""
+		if mapped is None:
+			with open(source.ovs_path, "rb") as stream:
+				stream.seek(source.read_start)
+				compressed_bytes = stream.read(source.compressed_size)
+		else:
+			compressed_bytes = mapped[source.read_start: source.read_start + source.compressed_size]
+		if len(compressed_bytes) != source.compressed_size:
+			raise EOFError(f"{source.ovs_path} ends before the end of archive {self.arg.name}")
+		return self.decompress_source(compressed_bytes, source)
+
+	def decompress_source(self, compressed_bytes, source):
+		"""Decompress the archive read from source and keep source with the checksum of the result"""
+		decompressed = self.decompress(compressed_bytes, source.uncompressed_size)
+		source.checksum = hashlib.sha1(decompressed).digest()
+		self.source = source
+		return decompressed
+
+	def compress_with_checksum(self, uncompressed_bytes, profile, source=None):
+		"""Returns the result of compress and the checksum of uncompressed_bytes
+
+		If the checksum matches that of source, the compressed bytes are None instead, to copy them from source
+		"""
+		checksum = hashlib.sha1(uncompressed_bytes).digest()
+		if source and checksum == source.checksum:
+			return source.uncompressed_size, source.compressed_size, None, checksum
+		return (*self.compress(uncompressed_bytes, profile), checksum)
+
+	def read_compressed(self):
+		"""Read the compressed bytes of this archive from its source"""
+		with open(self.source.ovs_path, "rb") as stream:
+			stream.seek(self.source.read_start)
+			return stream.read(self.source.compressed_size)
+
+	def compress(self, uncompressed_bytes, profile=SAVE_PROFILES["balanced"]):
 		"""compress data with method according to ovl settings"""
-		# change to zipped format for saving of oodled ovls
-		if self.ovl.user_version.compression == Compression.OODLE:
-			# as of 2023-07-30, ovls saved with oodle compression load fine in the tools but crash the game
-			logging.debug("Setting compression to zlib")
-			self.ovl.user_version.compression = Compression.ZLIB
 		if self.ovl.user_version.compression == Compression.OODLE:
 			assert self.compression_header.startswith(OODLE_MAGIC)
 			a, raw_algo = struct.unpack("BB", self.compression_header)
@@ -79,7 +297,8 @@ class OvsFile(OvsHeader):
 			logging.debug(f"Oodle compression {a} {raw_algo} {algo.name}")
 			compressed = oodle_compressor.compress(bytes(uncompressed_bytes), algo.name)
 		elif self.ovl.user_version.compression == Compression.ZLIB:
-			compressed = zlib.compress(uncompressed_bytes)
+			compressor = zlib.compressobj(profile.level, zlib.DEFLATED, zlib.MAX_WBITS, 8, profile.strategy)
+			compressed = compressor.compress(uncompressed_bytes) + compressor.flush()
 		else:
 			# uncompressed only stores the raw length, 0 for decompressed size
 			return 0, len(uncompressed_bytes), uncompressed_bytes
@@ -110,13 +329,12 @@ class OvsFile(OvsHeader):
 					entry.file_hash = loader.file_index
 				entry.ext_hash = loader.ext_hash
 
-	def load(self, archive_entry, stream):
+	def load_decompressed(self, archive_entry, decompressed):
+		"""Parse the decompressed archive"""
 		logging.info(
 			f"Loading archive {archive_entry.name}")
-		logging.debug(
-			f"Compressed stream {archive_entry.name} in {os.path.basename(archive_entry.ovs_path)} starts at {stream.tell()}")
-		compressed_bytes = stream.read(archive_entry.compressed_size)
-		with self.unzipper(compressed_bytes, archive_entry.uncompressed_size) as stream:
+		# buffers keep views into decompressed instead of copies
+		with ViewStream(decompressed) as stream:
 			super().read_fields(stream, self)
 			# print(self)
 			pool_index = 0
@@ -280,11 +498,8 @@ class OvsFile(OvsHeader):
 				# try to get a name for the pool
 				logging.debug(f"Pool[{pool_index}]: {len(pool.offsets)} structs")
 				first_offset = pool.get_first_offset()
-				ptr = (pool, first_offset)
-				for loader in self.ovl.loaders.values():
-					if ptr in loader.stack:
-						break
-				else:
+				loader = self.get_owner(pool, first_offset)
+				if not loader:
 					logging.warning(f"Could not find loader to get name for Pool[{pool_index}] type {pool.type} at offset {first_offset}")
 					continue
 				logging.debug(f"Pool[{pool_index}]: '{pool.name}' -> '{loader.name}'")
@@ -308,6 +523,17 @@ class OvsFile(OvsHeader):
 			self.pools.extend(pools)
 		self.arg.num_pools = len(self.pools)
 
+	def get_owner(self, pool, offset):
+		"""Returns the loader that has the struct at pool, offset on its stack, or None"""
+		ptr = (pool, offset)
+		loader = pool.offset_2_loader.get(offset)
+		# the index is not cleaned up when loaders are removed or structs deleted
+		if loader and self.ovl.loaders.get(loader.name) is loader and ptr in loader.stack:
+			return loader
+		for loader in self.ovl.loaders.values():
+			if ptr in loader.stack:
+				return loader
+
 	def map_buffers(self):
 		"""Map buffers to data entries"""
 		logging.debug("Mapping buffers")
@@ -490,10 +716,19 @@ class OvsFile(OvsHeader):
 			stream.write(self.pools_data)
 			# write buffer data
 			for b in self.buffers_io_order:
-				stream.write(b.data)
+				stream.write(b.view)
 			return stream.getvalue()
 
 
+class OvlHeader(Header):
+	"""Only the header of an ovl, without loaders or archives"""
+
+	def __init__(self):
+		# pass self as context
+		super().__init__(self)
+		self.is_dev = 0
+
+
 class OvlFile(Header):
 
 	def __init__(self):
@@ -506,9 +741,14 @@ class OvlFile(Header):
 		self.do_debug = False
 
 		self.formats_dict = FormatDict()
-		self.constants = {}
+		# only lists the game folders, their constants are loaded on first access
+		self.constants = ConstantsProvider()
+		# memory maps of the files that uncompressed archives are read from, see map_file
+		self.mapped_files = []
 		self.loaders = {}
 		self.included_ovl_names = []
+		# number of threads for (de)compressing archives, None uses the cpu count
+		self.max_workers = None
 		# set a default reporter here
 		self.reporter = DummyReporter()
 
@@ -533,6 +773,49 @@ class OvlFile(Header):
 		self.reset_field("archives")
 		self.loaders = {}
 
+	def close(self):
+		"""Release the loaders and archives now, instead of when the garbage collector gets to them
+
+		Loaders and pools refer to each other, so without this the memory of every loaded ovl lingers
+		until the next full collection. Call this before loading another ovl into the same instance.
+		"""
+		for loader in self.loaders.values():
+			loader.release()
+		for archive in self.archives:
+			if isinstance(archive.content, OvsFile):
+				archive.content.release()
+				# the archive and its content refer to each other
+				archive.content = None
+		self.pools = []
+		self.clear()
+		# the buffers viewing them are released now
+		self.close_mapped_files()
+		# unmap the hash stores, they are mapped again when needed
+		self.constants.close()
+
+	def map_file(self, stream):
+		"""Returns a view of the memory mapped file, which is unmapped by close_mapped_files"""
+		mapped = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+		self.mapped_files.append(mapped)
+		return memoryview(mapped)
+
+	def close_mapped_files(self):
+		"""Unmap the files that nothing views any more, so they can be overwritten or deleted, even on Windows"""
+		still_mapped = []
+		for mapped in self.mapped_files:
+			try:
+				mapped.close()
+			except BufferError:
+				# still viewed elsewhere, try again on the next close
+				still_mapped.append(mapped)
+		self.mapped_files = still_mapped
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
 	def init_loader(self, filename, ext):
 		# fall back to BaseFile loader, but only for collecting, not creating
 		from modules.formats.BaseFormat import BaseFile
@@ -546,6 +829,7 @@ class OvlFile(Header):
 		:return:
 		"""
 		logging.info(f"Removing files for {filenames}")
+		self.collect_loaders([self.loaders[filename] for filename in filenames])
 		for filename in filenames:
 			self.loaders[filename].remove()
 		self.send_files()
@@ -561,6 +845,7 @@ class OvlFile(Header):
 			if mesh_mode and loader.ext not in (".ms2", ".mdl2", ".motiongraph", ".motiongraphvars"):
 				continue
 			loaders_to_rename.append(loader)
+		self.collect_loaders(loaders_to_rename)
 		# get new names for all loaders, unchanged name is None
 		new_names = [loader.rename_check(name_tups) for loader in loaders_to_rename if loader.rename_check(name_tups)]
 		# check the new names don't collide
@@ -584,24 +869,53 @@ class OvlFile(Header):
 		if not only_files:
 			only_files = list(self.loaders.keys())
 		logging.info(f"Renaming contents for {name_tups} for {len(only_files)} selected files")
+		self.collect_loaders([self.loaders[file_name] for file_name in only_files])
 		for file_name in only_files:
+			# loaders may override rename_content, so flag them here
+			self.loaders[file_name].is_dirty = True
 			self.loaders[file_name].rename_content(name_tups)
 		logging.info("Finished renaming contents!")
 
-	def extract(self, out_dir, only_names=(), only_types=()):
-		"""Extract the files, after all archives have been read"""
+	def extract(self, out_dir, only_names=(), only_types=(), parallel=False):
+		"""Extract the files, after all archives have been read
 
-		def out_dir_func(n):
-			"""Helper function to generate temporary output file name"""
-			out_path = os.path.normpath(os.path.join(out_dir, n))
-			# create output dir
-			os.makedirs(os.path.dirname(out_path), exist_ok=True)
-			return out_path
+		parallel: extract on num_workers processes, which share the archives decompressed once by this process
+		"""
+		loaders_for_extract = self.get_loaders_for_extract(only_names, only_types)
+		if parallel and (
+				any(loader.is_dirty for loader in loaders_for_extract) or
+				any(archive.content.source is None for archive in self.archives)):
+			# the workers read the archives as stored on disk, so they would not see the changes
+			logging.info(f"Extracting modified files from {self.name} on a single process")
+			parallel = False
+		with self.reporter.report_error_files("Extracting") as error_files:
+			if parallel and len(loaders_for_extract) > 1:
+				out_paths = self.extract_parallel(out_dir, loaders_for_extract, error_files)
+			else:
+				out_paths, errors = self.extract_loaders(
+					self.reporter.iter_progress(loaders_for_extract, "Extracting"), out_dir)
+				error_files.extend(errors)
+		return out_paths
 
-		out_paths = []
+	def iter_extract(self, only_names=(), only_types=()):
+		"""Yields the relative path and bytes of each extracted file, without writing them to disk"""
+		with self.reporter.report_error_files("Extracting") as error_files:
+			for loader in self.reporter.iter_progress(self.get_loaders_for_extract(only_names, only_types), "Extracting"):
+				try:
+					loader.ensure_collected()
+					# get all files of a loader before yielding any, so a loader that fails yields none
+					files = list(loader.extract_to_memory())
+				except:
+					logging.exception(f"An exception occurred while extracting {loader.name}")
+					error_files.append(loader.name)
+					continue
+				yield from files
+
+	def get_loaders_for_extract(self, only_names=(), only_types=()):
 		loaders_for_extract = []
 		_only_types = [s.lower() for s in only_types]
 		_only_names = [s.lower() for s in only_names]
+		ignore_types = set(self.formats_dict.ignore_types)
 		for loader in self.loaders.values():
 			# for batch operations, only export those that we need
 			if _only_types and loader.ext not in _only_types:
@@ -609,23 +923,82 @@ class OvlFile(Header):
 			if _only_names and loader.name not in _only_names:
 				continue
 			# ignore types in the count that we export from inside other type exporters
-			if loader.ext in self.formats_dict.ignore_types:
+			if loader.ext in ignore_types:
 				continue
 			loaders_for_extract.append(loader)
 		logging.info(f"Extracting {len(loaders_for_extract)} / {len(self.files)} files")
-		with self.reporter.report_error_files("Extracting") as error_files:
-			for loader in self.reporter.iter_progress(loaders_for_extract, "Extracting"):
-				try:
-					ret_paths = loader.extract(out_dir_func)
-					ret_paths = loader.handle_paths(ret_paths, self.do_debug)
-					out_paths.extend(ret_paths)
-				except:
-					logging.exception(f"An exception occurred while extracting {loader.name}")
-					error_files.append(loader.name)
+		return loaders_for_extract
+
+	def extract_loaders(self, loaders, out_dir):
+		"""Extract loaders to out_dir, returns the extracted paths and the names of the files that failed"""
+
+		def out_dir_func(n):
+			"""Helper function to generate temporary output file name"""
+			out_path = os.path.normpath(os.path.join(out_dir, n))
+			# create output dir
+			os.makedirs(os.path.dirname(out_path), exist_ok=True)
+			return out_path
+
+		out_paths = []
+		error_files = []
+		for loader in loaders:
+			try:
+				loader.ensure_collected()
+				ret_paths = loader.extract(out_dir_func)
+				ret_paths = loader.handle_paths(ret_paths, self.do_debug)
+				out_paths.extend(ret_paths)
+			except:
+				logging.exception(f"An exception occurred while extracting {loader.name}")
+				error_files.append(loader.name)
+		return out_paths, error_files
+
+	def extract_parallel(self, out_dir, loaders, error_files):
+		"""Shard loaders across a process pool, returns the extracted paths in the order of loaders"""
+		names = [loader.name for loader in loaders]
+		num_workers = min(self.num_workers, len(names))
+		# several shards per worker to balance the load, interleaved to mix small and large files of one type
+		num_shards = min(num_workers * 4, len(names))
+		shards = [names[i::num_shards] for i in range(num_shards)]
+		paths_by_name = {}
+		with tempfile.TemporaryDirectory() as tmp_dir, worker_log_queue() as log_queue:
+			# the workers map the decompressed archives instead of each decompressing them again
+			decompressed_path = os.path.join(tmp_dir, "archives.bin")
+			spans = self.write_decompressed(decompressed_path)
+			# each worker process reads the ovl header once and collects only the loaders it extracts
+			commands = {"game": self.game, "lazy": True, "decompressed": (decompressed_path, spans)}
+			with ProcessPoolExecutor(
+					num_workers, initializer=init_extract_worker,
+					initargs=(self.filepath, commands, log_queue, logging.getLogger().level)) as executor:
+				futures = [executor.submit(extract_worker, out_dir, shard, self.do_debug) for shard in shards]
+				for shard, future in zip(self.reporter.iter_progress(shards, "Extracting"), futures):
+					try:
+						results = future.result()
+					except:
+						logging.exception(f"Extracting {len(shard)} files on a worker process failed")
+						error_files.extend(shard)
+						continue
+					for name, (paths, errors) in zip(shard, results):
+						paths_by_name[name] = paths
+						error_files.extend(errors)
+		# restore the serial order, so callers get the same paths either way
+		out_paths = []
+		for name in names:
+			out_paths.extend(paths_by_name.get(name, ()))
 		return out_paths
 
-	def create_file(self, file_path, file_name, ovs_name="STATIC"):
-		"""Create a loader from a file path"""
+	def write_decompressed(self, filepath):
+		"""Decompress the archives from their sources into one file, returns the offset and size of each archive in it"""
+		spans = []
+		with open(filepath, "wb") as stream:
+			for archive in self.archives:
+				ovs = archive.content
+				decompressed = ovs.decompress(ovs.read_compressed(), ovs.source.uncompressed_size)
+				spans.append((stream.tell(), len(decompressed)))
+				stream.write(decompressed)
+		return spans
+
+	def create_file(self, file_path, file_name, ovs_name="STATIC", prepared=None):
+		"""Create a loader from a file path, optionally with the result of its prepare"""
 		file_path = os.path.normpath(file_path)
 		file_name = file_name.lower()
 		_, ext = os.path.splitext(file_name)
@@ -634,6 +1007,7 @@ class OvlFile(Header):
 			loader = self.init_loader(file_name, ext, )
 			loader.get_constants_entry()
 			loader.set_ovs(ovs_name)
+			loader.prepared = prepared
 			loader.create(file_path)
 			return loader
 		except NotImplementedError:
@@ -652,10 +1026,20 @@ class OvlFile(Header):
 		self.add_files(file_paths)
 		self.load_included_ovls(os.path.join(ovl_dir, "ovls.include"))
 
-	def add_files(self, file_paths):
-		logging.info(f"Adding {len(file_paths)} files to OVL [{self.game}]")
+	def add_files(self, file_paths, parallel=False):
+		"""Create loaders for file_paths and any files in the folders among them
+
+		parallel: run the pool independent part of creating the loaders on num_workers processes, see prepare_files
+		"""
 		if not file_paths:
 			return
+		self.add_planned(self.plan_injection(file_paths), parallel)
+
+	def plan_injection(self, file_paths):
+		"""Sort file_paths and the files in the folders among them into an InjectPlan, without reading them"""
+		plan = InjectPlan()
+		if not file_paths:
+			return plan
 		# file_paths must be direct children of the same folder
 		common_root = os.path.dirname(file_paths[0])
 		file_paths = {os.path.normpath(file_path) for file_path in file_paths}
@@ -670,54 +1054,92 @@ class OvlFile(Header):
 				for root, dirs, files in os.walk(fp, topdown=False):
 					for name in files:
 						inject_paths.add(os.path.join(root, name))
-		with self.reporter.report_error_files("Adding") as error_files:
-			for file_path in self.reporter.iter_progress(inject_paths, "Adding files"):
-				# ensure lowercase, especially for file extension checks
-				bare_path, ext = os.path.splitext(file_path.lower())
-				# ignore dirs, links etc.
-				if not os.path.isfile(file_path):
-					continue
-				if ext in self.formats_dict.ignore_types:
-					logging.debug(f"Ignoring {file_path}")
-					continue
-				elif "stream" in ext:
-					logging.debug(f"Ignoring {file_path} as it will be created from its streamer")
-					continue
-				elif ext in (".include", ):
-					# not for a loader, will be dealt with separately by create
-					continue
-				elif ext in (".png", ".dds"):
-					# find and remove any suffices in png basepath
-					channel_re = re.compile(r"_[rgba]+$")
-					array_re = re.compile(r"_\[[0-9]+\]$")
-					bare_path_no_suffices = f"{array_re.sub('', channel_re.sub('', bare_path, count=1), count=1)}.tex"
-					lower_tex_paths = {fp.lower() for fp in inject_paths if fp.lower().endswith(".tex")}
-					# compare this reconstructed tex path to the other file paths (case insensitive)
-					if bare_path_no_suffices in lower_tex_paths:
-						logging.info(f"Ignoring {file_path} as matching .tex file is also selected")
-						continue
-					else:
-						logging.error(f"Inject the corresponding .tex file for {file_path}")
-						error_files.append(file_path)
-						continue
+		# look up what the loop needs once, instead of for each file
+		lower_tex_paths = {fp.lower() for fp in inject_paths if fp.lower().endswith(".tex")}
+		ignore_types = set(self.formats_dict.ignore_types)
+		cobra_exts = {}
+		for file_path in sorted(inject_paths):
+			# ensure lowercase, especially for file extension checks
+			bare_path, ext = os.path.splitext(file_path.lower())
+			# ignore dirs, links etc.
+			if not os.path.isfile(file_path):
+				plan.ignored[file_path] = "not a file"
+			elif ext in ignore_types:
+				plan.companions[file_path] = "created by the loader of another file"
+			elif "stream" in ext:
+				plan.companions[file_path] = "created from its streamer"
+			elif ext in (".include", ):
+				# not for a loader, will be dealt with separately by create
+				plan.companions[file_path] = "read when creating an ovl"
+			elif ext in (".png", ".dds"):
+				# find and remove any suffices in png basepath
+				tex_path = f"{ARRAY_RE.sub('', CHANNEL_RE.sub('', bare_path, count=1), count=1)}.tex"
+				# compare this reconstructed tex path to the other file paths (case insensitive)
+				if tex_path in lower_tex_paths:
+					plan.companions[file_path] = "read by the matching .tex file"
+				else:
+					plan.errors[file_path] = "Inject the corresponding .tex file"
+			else:
 				# no loader exists, check if it should warn about missing loader or just ignore it
-				elif ext not in self.formats_dict:
+				if ext not in self.formats_dict and ext not in cobra_exts:
 					# test if this ext is a cobra file format by querying its mime version
 					try:
 						self.get_mime(ext, "version")
+						cobra_exts[ext] = True
 					except:
-						logging.debug(f"Ignoring {file_path} - not a cobra format")
-						continue
-				# make relative to the common root, use forward slash as separator
-				file_name = os.path.relpath(file_path, common_root).replace("\\", "/")
+						cobra_exts[ext] = False
+				if cobra_exts.get(ext, True):
+					# make relative to the common root, use forward slash as separator
+					plan.loaders[file_path] = os.path.relpath(file_path, common_root).replace("\\", "/")
+				else:
+					plan.ignored[file_path] = "not a cobra format"
+		return plan
+
+	def add_planned(self, plan, parallel=False):
+		"""Create the loaders of an InjectPlan, see add_files"""
+		logging.info(f"Adding {len(plan.loaders)} files to OVL [{self.game}]")
+		for file_path, reason in itertools.chain(plan.companions.items(), plan.ignored.items()):
+			logging.debug(f"Ignoring {file_path} - {reason}")
+		with self.reporter.report_error_files("Adding") as error_files:
+			for file_path, error in plan.errors.items():
+				logging.error(f"{error} for {file_path}")
+				error_files.append(file_path)
+			create_paths = list(plan.loaders.items())
+			prepared = self.prepare_files(create_paths) if parallel else {}
+			for file_path, file_name in self.reporter.iter_progress(create_paths, "Adding files"):
 				try:
-					loader = self.create_file(file_path, file_name)
+					loader = self.create_file(file_path, file_name, prepared=prepared.pop(file_path, None))
 					self.register_loader(loader)
 				except:
 					error_files.append(file_path)
 			self.validate_loaders()
 		self.send_files()
 
+	def prepare_files(self, create_paths):
+		"""Run prepare for the loaders of create_paths on a process pool, returns the results by file path
+
+		Loaders whose prepare fails here are prepared again by create, so that its error is reported as usual.
+		"""
+		from modules.formats.BaseFormat import BaseFile
+		jobs = [(file_path, file_name) for file_path, file_name in create_paths
+				if self.formats_dict.get(os.path.splitext(file_name.lower())[1], BaseFile).prepare is not BaseFile.prepare]
+		prepared = {}
+		if len(jobs) < 2:
+			return prepared
+		with worker_log_queue() as log_queue, ProcessPoolExecutor(
+				min(self.num_workers, len(jobs)), initializer=init_prepare_worker,
+				initargs=(self.game, self.is_dev, log_queue, logging.getLogger().level)) as executor:
+			futures = [executor.submit(prepare_worker, file_path, file_name.lower()) for file_path, file_name in jobs]
+			for (file_path, file_name), future in zip(self.reporter.iter_progress(jobs, "Preparing files"), futures):
+				try:
+					data = future.result()
+					if data is not None:
+						with BytesIO(data) as stream:
+							prepared[file_path] = OvlUnpickler(stream, self).load()
+				except:
+					logging.exception(f"Preparing {file_name} on a worker process failed")
+		return prepared
+
 	def send_files(self):
 		f_list = [[loader.name, loader.ext] for loader in self.loaders.values()]
 		f_list.sort(key=lambda t: (t[1], t[0]))
@@ -786,36 +1208,79 @@ class OvlFile(Header):
 		else:
 			raise NotImplementedError(f"Unsupported game {game}")
 
-	def get_hash(self, h, ext, using_file):
+	@staticmethod
+	def lookup_hashes(table, hashes):
+		"""Returns a dict with the names of those hashes that are in table"""
+		if isinstance(table, HashStore):
+			return table.lookup(list(hashes))
+		return {h: table[h] for h in hashes if h in table}
+
+	def iter_hash_tables(self):
+		"""Yields the tables to resolve dependency hashes with, in order of priority"""
+		yield self.hash_table_local
 		game = self.game
-		fallback = f"{UNK_HASH}_{h}"
 		if game in self.constants:
-			game_lut = self.constants[game]
-			if h in game_lut["hashes"]:
-				return game_lut["hashes"][h]
-		logging.warning(f"{using_file} can't find the original name of {fallback}{ext}", extra={"details":
-							f"""
-							An unknown hash means the tools cannot ascertain the original filename.
-							This means {using_file} likely will not work correctly without editing 
-							it to fix the unknown hash.
-							"""
-						})
-		return fallback
+			yield self.constants[game]["hashes"]
+		for other_game in self.commands.get("dep_fallback_games", ()):
+			if other_game != game and other_game in self.constants.game_dirs:
+				yield self.constants[other_game]["hashes"]
+
+	def resolve_dep_names(self):
+		"""Returns the basenames for all dependencies, looking up each unique hash once"""
+		hashes = self.dependencies["file_hash"].tolist()
+		pending = set(hashes)
+		resolved = {}
+		for table in self.iter_hash_tables():
+			if not pending:
+				break
+			found = self.lookup_hashes(table, pending)
+			resolved.update(found)
+			pending.difference_update(found)
+		if pending and "dep_index_dir" in self.commands:
+			# avoid circular import
+			from modules.ovl_index import OvlIndex
+			index_dir = self.commands["dep_index_dir"]
+			with OvlIndex() as index:
+				# updating the index would scan the whole game, so that is left to the searches that use it
+				if not index.is_indexed(index_dir):
+					logging.warning(f"No ovls are indexed for {index_dir}, search its contents to index them")
+				found = index.lookup(index_dir, pending)
+			resolved.update(found)
+			pending.difference_update(found)
+		basenames = [resolved.get(h, f"{UNK_HASH}_{h}") for h in hashes]
+		if pending:
+			missing = [f"{self.files_name[f_i]}: {basename}{ext}" for basename, ext, f_i, h in zip(
+				basenames, self.dependencies_ext, self.dependencies["file_index"], hashes) if h in pending]
+			missing_str = "\n".join(missing)
+			logging.warning(f"Can't find the original names of {len(missing)} dependencies", extra={"details":
+								f"""
+								An unknown hash means the tools cannot ascertain the original filename.
+								This means the files using them likely will not work correctly without editing 
+								them to fix the unknown hashes.
+								{missing_str}
+								"""
+							})
+		return basenames
 
 	def load(self, filepath, commands={}):
+		"""Load an ovl and its ovs archives
+
+		supported commands:
+		game: preset game name, used if the ovl's version matches several games
+		only_types: only load loaders with these extensions
+		generate_hash_table: return the file hashes for these extensions and the dependency extensions
+		generate_names: return the file names
+		lazy: defer track_ptrs and collect for each loader until it is used, see BaseFile.ensure_collected
+		dep_fallback_games: names of other games whose hash tables resolve the dependency hashes, in order of priority
+		dep_index_dir: resolve dependency hashes with the files of the ovls indexed for this game dir, see OvlIndex
+		decompressed: path and spans of a file with the decompressed archives, see write_decompressed
+		"""
 		# store commands
 		self.commands = commands
 		self.store_filepath(filepath)
 		with self.reporter.log_duration(f"Loading {self.name}"):
 			with open(filepath, "rb") as stream:
-				magic = stream.read(4)
-				stream.seek(0)
-				if magic == b"FRES":
-					pass
-				elif magic == b"FREA":
-					raise AttributeError(f"{self.name} is encrypted and cannot be read")
-				else:
-					raise AttributeError(f"Unknown OVL magic for {self.name}, cannot be read")
+				check_magic(stream, self.name)
 				self.read_fields(stream, self)
 				self.eof = stream.tell()
 
@@ -876,6 +1341,7 @@ class OvlFile(Header):
 					loader.mime_version = version
 					loader.pool_type = pt
 					loader.set_pool_type = set_pt
+					loader.is_dirty = False
 					self.loaders[filename] = loader
 				self.send_files()
 
@@ -883,8 +1349,7 @@ class OvlFile(Header):
 			self.included_ovl_names = [self.names.get_str_at(i) for i in self.included_ovls["basename"]]
 			self.reporter.included_ovls_list.emit(self.included_ovl_names)
 
-			self.dependencies_basename = [self.get_dep_name(h, ext, self.files_name[f_i]) for h, ext, f_i in zip(
-				self.dependencies["file_hash"], self.dependencies_ext, self.dependencies["file_index"])]
+			self.dependencies_basename = self.resolve_dep_names()
 			self.dependencies_name = [b+e for b, e in zip(self.dependencies_basename, self.dependencies_ext)]
 
 			self.aux_entries_names = [self.names.get_str_at(i) for i in self.aux_entries["basename"]]
@@ -893,27 +1358,48 @@ class OvlFile(Header):
 				self.loaders[file_name].aux_entries.append(aux_name)
 			self.load_archives()
 
-	def get_dep_name(self, h, ext, using_file):
-		if h in self.hash_table_local:
-			return self.hash_table_local[h]
+	@staticmethod
+	def scan_header(filepath):
+		"""Returns an OvlScan of the ovl at filepath, reading only its header and no archives or constants"""
+		header = OvlHeader()
+		with open(filepath, "rb") as stream:
+			check_magic(stream, os.path.basename(filepath))
+			header.read_fields(stream, header)
+		header.is_dev = 1 if "Jurassic World Evolution 2 1.3.1.0" in filepath else 0
+		mimes_name = [header.names.get_str_at(i) for i in header.mimes["name"]]
+		mimes_ext = [name.split(':')[-1] for name in mimes_name]
+		if "triplet_offset" in header.mimes.dtype.fields:
+			mimes_triplets = [header.triplets[o: o+c] for o, c in zip(
+				header.mimes["triplet_offset"], header.mimes["triplet_count"])]
 		else:
-			return self.get_hash(h, ext, using_file)
+			mimes_triplets = []
+		return OvlScan(
+			filepath,
+			get_game(header)[0].value,
+			header.mimes,
+			header.files,
+			header.dependencies,
+			mimes_name,
+			mimes_triplets,
+			[header.names.get_str_at(i) for i in header.files["basename"]],
+			[f".{mimes_ext[i]}" for i in header.files["extension"]],
+			[header.names.get_str_at(i).replace(":", ".") for i in header.dependencies["ext_raw"]],
+			[header.names.get_str_at(i) for i in header.included_ovls["basename"]],
+		)
 
 	def load_archives(self):
 		with self.reporter.log_duration("Loading archives"):
 			with self.reporter.report_error_files("Reading") as error_files:
-				with self.open_streams(mode="rb") as streams:
-					for archive_entry in self.reporter.iter_progress(self.archives, "Reading archives"):
-						# those point to external ovs archives
-						if archive_entry.name == "STATIC":
-							read_start = self.eof
-						else:
-							read_start = archive_entry.read_start
-						stream = streams[archive_entry.ovs_path]
-						stream.seek(read_start)
-						archive_entry.content = OvsFile(self.context, self, archive_entry)
+				# zlib and oodle release the GIL, so decompress on worker threads while the main thread parses
+				with ThreadPoolExecutor(self.num_workers) as executor:
+					if "decompressed" in self.commands:
+						decompressed_archives = self.iter_mapped_archives(*self.commands["decompressed"])
+					else:
+						decompressed_archives = self.iter_decompressed_archives(executor)
+					for archive_entry, decompressed in zip(
+							self.reporter.iter_progress(self.archives, "Reading archives"), decompressed_archives):
 						try:
-							archive_entry.content.load(archive_entry, stream)
+							archive_entry.content.load_decompressed(archive_entry, decompressed.result())
 						except:
 							error_files.append(archive_entry.name)
 							logging.exception(f"Loading {archive_entry.name} from {archive_entry.ovs_path} failed: {archive_entry}")
@@ -924,6 +1410,63 @@ class OvlFile(Header):
 			self.load_flattened_pools()
 			self.load_pointers()
 
+	@property
+	def num_workers(self):
+		return self.max_workers or os.cpu_count() or 1
+
+	def iter_decompressed_archives(self, executor):
+		"""Yields a future for the decompressed bytes of each archive, in the order of ovl.archives
+
+		The archives are read on the workers, so a missing or truncated ovs only fails the future of its archives
+		"""
+		pending = deque()
+		# uncompressed archives are sliced from a memory map of their file instead of being read
+		mapped = {}
+		for archive_entry in self.archives:
+			self.get_ovs_path(archive_entry)
+			archive_entry.content = OvsFile(self.context, self, archive_entry)
+			# those point to external ovs archives
+			if archive_entry.name == "STATIC":
+				read_start = self.eof
+			else:
+				read_start = archive_entry.read_start
+			logging.debug(
+				f"Compressed stream {archive_entry.name} in {os.path.basename(archive_entry.ovs_path)} starts at {read_start}")
+			source = ArchiveSource(
+				archive_entry.ovs_path, read_start, archive_entry.compressed_size, archive_entry.uncompressed_size,
+				self.user_version.compression)
+			if self.user_version.compression == Compression.NONE and archive_entry.ovs_path not in mapped:
+				try:
+					with open(archive_entry.ovs_path, "rb") as stream:
+						mapped[archive_entry.ovs_path] = self.map_file(stream) if os.path.getsize(archive_entry.ovs_path) else None
+				except OSError as err:
+					mapped[archive_entry.ovs_path] = err
+			file_map = mapped.get(archive_entry.ovs_path)
+			if isinstance(file_map, OSError):
+				decompressed = Future()
+				decompressed.set_exception(file_map)
+				pending.append(decompressed)
+			else:
+				pending.append(executor.submit(archive_entry.content.read_source, source, file_map))
+			# only decompress a few archives ahead to limit memory usage
+			if len(pending) > min(self.num_workers, MAX_PENDING_ARCHIVES):
+				yield pending.popleft()
+		while pending:
+			yield pending.popleft()
+
+	def iter_mapped_archives(self, filepath, spans):
+		"""Yields a done future for the view of each archive in a file written by write_decompressed"""
+		if os.path.getsize(filepath):
+			with open(filepath, "rb") as stream:
+				mapped = self.map_file(stream)
+		else:
+			mapped = memoryview(b"")
+		for archive_entry, (offset, size) in zip(self.archives, spans):
+			archive_entry.content = OvsFile(self.context, self, archive_entry)
+			decompressed = Future()
+			decompressed.set_result(mapped[offset: offset + size])
+			yield decompressed
+
 	def load_flattened_pools(self):
 		"""Create flattened list of ovl.pools from all ovs.pools"""
 		self.pools = [None for _ in range(self.num_pools)]
@@ -991,6 +1534,12 @@ class OvlFile(Header):
 				only_types = self.commands['only_types']
 				logging.info(f"Loading only {only_types}")
 				self.loaders = {loader.name: loader for loader in self.loaders.values() if loader.ext in only_types}
+			if "lazy" in self.commands:
+				logging.info(f"Deferring collection of {len(self.loaders)} files")
+				for loader in self.loaders.values():
+					loader.is_collected = False
+					loader.link_streams()
+				return
 			with self.reporter.report_error_files("Collecting") as error_files:
 				for loader in self.reporter.iter_progress(self.loaders.values(), "Mapping files"):
 					loader.track_ptrs()
@@ -1006,6 +1555,19 @@ class OvlFile(Header):
 						raise AttributeError(f"{loader.name} changed ovl version from {version} to {self.version}")
 				self.validate_loaders()
 
+	def collect_loaders(self, loaders):
+		"""Collect loaders whose collection was deferred by a lazy load"""
+		loaders = [loader for loader in loaders if not loader.is_collected]
+		if not loaders:
+			return
+		with self.reporter.report_error_files("Collecting") as error_files:
+			for loader in self.reporter.iter_progress(loaders, "Mapping files"):
+				try:
+					loader.ensure_collected()
+				except:
+					logging.exception(f"Collecting {loader.name} errored")
+					error_files.append(loader.name)
+
 	def validate_loaders(self):
 		with self.reporter.report_error_files("Validating") as error_files:
 			for loader in self.loaders.values():
@@ -1033,8 +1595,19 @@ class OvlFile(Header):
 			return int(name.replace(f"{UNK_HASH}_", ""))
 		return djb2(name)
 
+	@staticmethod
+	def get_dep_hashes(names):
+		"""Returns get_dep_hash for all names as a uint32 array"""
+		hashes = djb2_array(names)
+		for i, name in enumerate(names):
+			if UNK_HASH in name:
+				hashes[i] = OvlFile.get_dep_hash(name)
+		return hashes
+
 	def rebuild_ovl_arrays(self):
 		"""Call this if any file names have changed and hashes or indices have to be recomputed"""
+		# fragments and pool names are rebuilt from the stack of every loader
+		self.collect_loaders(self.loaders.values())
 
 		# update file hashes and extend entries per loader
 		# self.files.sort(key=lambda x: (x.ext, x.file_hash))
@@ -1133,7 +1706,7 @@ class OvlFile(Header):
 		ext_lut = {ext: i for i, ext in enumerate(mimes_ext)}
 
 		# self.dependencies.sort(key=lambda x: x.file_hash)
-		self.dependencies["file_hash"] = [self.get_dep_hash(name) for name in deps_basename]
+		self.dependencies["file_hash"] = self.get_dep_hashes(deps_basename)
 		self.dependencies["ext_raw"] = [self.names.offset_dic[name] for name in deps_ext]
 		self.dependencies["file_index"] = [loader.file_index for (dep, ptr), loader in loaders_and_deps]
 		ptrs = [ptr for (dep, ptr), loader in loaders_and_deps]
@@ -1284,8 +1857,14 @@ class OvlFile(Header):
 
 	@contextmanager
 	def open_streams(self, mode="wb"):
+		"""Yields the streams of the ovl and its ovs files, by path
+
+		For writing, each file is written to a temporary file next to it, which only replaces it once all streams were
+		written without errors. So the files can still be read while writing and are kept if writing fails.
+		"""
 		logging.debug("Opening OVS streams")
 		streams = {}
+		tmp_paths = {}
 		for archive_entry in self.archives:
 			# gotta update it here
 			self.get_ovs_path(archive_entry)
@@ -1294,16 +1873,29 @@ class OvlFile(Header):
 				# make sure that the ovs exists
 				if mode == "rb" and not os.path.exists(archive_entry.ovs_path):
 					raise FileNotFoundError(f"OVS file not found. Make sure it is here: {archive_entry.ovs_path}")
+				if mode == "wb":
+					tmp_paths[archive_entry.ovs_path] = f"{archive_entry.ovs_path}.tmp"
 				# open file in desired mode
-				streams[archive_entry.ovs_path] = open(archive_entry.ovs_path, mode)
+				streams[archive_entry.ovs_path] = open(tmp_paths.get(archive_entry.ovs_path, archive_entry.ovs_path), mode)
 		# for simplicity, tests don't always have an ovs, so allow for pure ovl files
 		if self.filepath not in streams:
-			streams[self.filepath] = open(self.filepath, mode)
-		yield streams
-		logging.debug("Closing OVS streams")
-		# we don't use context manager so gotta close them
-		for ovs_file in streams.values():
-			ovs_file.close()
+			if mode == "wb":
+				tmp_paths[self.filepath] = f"{self.filepath}.tmp"
+			streams[self.filepath] = open(tmp_paths.get(self.filepath, self.filepath), mode)
+		written = False
+		try:
+			yield streams
+			written = True
+		finally:
+			logging.debug("Closing OVS streams")
+			# we don't use context manager so gotta close them
+			for ovs_file in streams.values():
+				ovs_file.close()
+			for path, tmp_path in tmp_paths.items():
+				if written:
+					os.replace(tmp_path, path)
+				else:
+					os.remove(tmp_path)
 
 	def update_stream_files(self):
 		logging.info("Updating stream file memory links")
@@ -1333,6 +1925,7 @@ class OvlFile(Header):
 		out_dir = os.path.join(self.dir, f"{self.basename}_dump")
 		logging.info(f"Dumping debug data to {self.dir}")
 		os.makedirs(out_dir, exist_ok=True)
+		self.collect_loaders(self.loaders.values())
 		# todo - ensure every pool has valid pool.i in ovl.pools, in all cases; loading is good
 		for archive_entry in self.archives:
 			fp = os.path.join(out_dir, f"{self.name}_{archive_entry.name}")
@@ -1363,7 +1956,72 @@ class OvlFile(Header):
 		for loader in self.sorted_loaders:
 			loader.dump_buffers(out_dir_func)
 
-	def save(self, filepath):
+	def get_unchanged_archives(self):
+		"""Returns the archives that may be identical to their source, mapped to the source to copy them from
+
+		Whether they are is only known from the checksum once they are written
+		"""
+		dirty_archives = set()
+		for loader in self.loaders.values():
+			if loader.is_dirty:
+				dirty_archives.add(loader.ovs_name)
+				dirty_archives.update(loader.data_entries)
+		unchanged = {}
+		for archive in self.archives:
+			source = archive.content.source
+			if source and archive.name not in dirty_archives and source.compression == self.user_version.compression:
+				unchanged[archive.name] = source
+		return unchanged
+
+	def iter_compressed_archives(self, executor, profile, unchanged):
+		"""Yields a future for the sizes, compressed bytes and checksum of each archive, in the order of ovl.archives"""
+		pending = deque()
+		for archive in self.archives:
+			# write archive into bytes IO stream; the worker drops the uncompressed bytes once it is done
+			# indices into the ovl's arrays may have changed for unchanged loaders, so only trust the checksum
+			pending.append(executor.submit(
+				archive.content.compress_with_checksum, archive.content.write_archive(), profile,
+				unchanged.get(archive.name)))
+			# only compress a few archives ahead to limit memory usage
+			if len(pending) > min(self.num_workers, MAX_PENDING_ARCHIVES):
+				yield pending.popleft()
+		while pending:
+			yield pending.popleft()
+
+	def copy_mapped_buffers(self):
+		"""Copy buffers that are views into memory mapped ovs files, so that those files can be overwritten"""
+		for archive in self.archives:
+			for buffer in archive.content.buffer_entries:
+				if buffer.is_mapped:
+					buffer.data = buffer.data
+
+	@contextmanager
+	def save_compression(self, profile):
+		"""Sets the compression used for saving with profile, restores the ovl's compression afterwards"""
+		compression = self.user_version.compression
+		if compression == Compression.OODLE:
+			# as of 2023-07-30, ovls saved with oodle compression load fine in the tools but crash the game
+			logging.warning("Saving with zlib compression, as OVLs saved with oodle compression crash the game")
+			compression = self.user_version.compression = Compression.ZLIB
+		if profile.uncompressed:
+			logging.warning("Saving uncompressed OVL, only use this for testing")
+			self.user_version.compression = Compression.NONE
+		try:
+			yield
+		finally:
+			self.user_version.compression = compression
+
+	def save(self, filepath, profile="balanced"):
+		"""Save the ovl and its ovs archives
+
+		profile: name of a SAVE_PROFILES entry or a SaveProfile, trading compression time for file size
+		Archives without dirty loaders whose data did not change are copied from their source without compressing
+		them again, regardless of the profile's level
+		"""
+		if isinstance(profile, str):
+			if profile not in SAVE_PROFILES:
+				raise KeyError(f"Unknown save profile '{profile}', expected one of {list(SAVE_PROFILES)}")
+			profile = SAVE_PROFILES[profile]
 		self.store_filepath(filepath)
 		with self.reporter.log_duration(f"Writing {self.name}"):
 			# do this last so we also catch the assets & sets
@@ -1373,34 +2031,63 @@ class OvlFile(Header):
 			ovs_types = {archive.name for archive in self.archives if "Textures_L" not in archive.name}
 			ovs_types.discard("STATIC")
 			self.num_ovs_types = len(ovs_types)
-			ovl_compressed = b""
 			self.reset_field("archives_meta")
+			# the ovs files may be overwritten
+			self.copy_mapped_buffers()
+			self.close_mapped_files()
 			# print(self)
-			# compress data stream
-			with self.open_streams() as streams:
-				for archive, meta in zip(self.reporter.iter_progress(self.archives, "Saving archives"), self.archives_meta):
-					# write archive into bytes IO stream
-					uncompressed = archive.content.write_archive()
-					archive.uncompressed_size, archive.compressed_size, compressed = archive.content.compress(
-						uncompressed)
-					# update set data size
-					archive.set_data_size = archive.content.set_header.io_size
-					if archive.name == "STATIC":
-						ovl_compressed = compressed
-						archive.read_start = 0
+			with self.save_compression(profile):
+				unchanged = self.get_unchanged_archives()
+				self.write_archives(profile, unchanged)
+			for loader in self.loaders.values():
+				loader.is_dirty = False
+
+	def write_archives(self, profile, unchanged):
+		"""Write the ovl and its ovs archives, copying the unchanged archives from their source"""
+		ovl_compressed = b""
+		ovl_source = None
+		# compress data stream on worker threads, zlib and oodle release the GIL
+		with self.open_streams() as streams, ThreadPoolExecutor(self.num_workers) as executor:
+			for archive, meta, compressed in zip(
+					self.reporter.iter_progress(self.archives, "Saving archives"),
+					self.archives_meta,
+					self.iter_compressed_archives(executor, profile, unchanged)):
+				archive.uncompressed_size, archive.compressed_size, compressed, checksum = compressed.result()
+				if compressed is None:
+					logging.debug(f"Copying unchanged archive {archive.name}")
+				# update set data size
+				archive.set_data_size = archive.content.set_header.io_size
+				if archive.name == "STATIC":
+					ovl_compressed = compressed
+					ovl_source = unchanged.get(archive.name)
+					archive.read_start = 0
+				else:
+					ovs_stream = streams[archive.ovs_path]
+					archive.read_start = ovs_stream.tell()
+					if compressed is None:
+						copy_range(unchanged[archive.name], ovs_stream)
 					else:
-						ovs_stream = streams[archive.ovs_path]
-						archive.read_start = ovs_stream.tell()
 						ovs_stream.write(compressed)
-					# size of the archive entry = 68
-					# this is true for jwe2 tylo, but not for jwe2 rex 93 and many others
-					meta.unk_0 = 68 + archive.uncompressed_size
-					# this is fairly good, doesn't work for tylo static but all others, all of jwe2 rex 93, JWE parrot, pz fallow deer
-					meta.unk_1 = sum([data.size_2 for data in archive.content.data_entries])
-				# write ovl + static
-				stream = streams[self.filepath]
-				self.write_fields(stream, self)
+				# size of the archive entry = 68
+				# this is true for jwe2 tylo, but not for jwe2 rex 93 and many others
+				meta.unk_0 = 68 + archive.uncompressed_size
+				# this is fairly good, doesn't work for tylo static but all others, all of jwe2 rex 93, JWE parrot, pz fallow deer
+				meta.unk_1 = sum([data.size_2 for data in archive.content.data_entries])
+				archive.content.source = ArchiveSource(
+					archive.ovs_path, archive.read_start, archive.compressed_size, archive.uncompressed_size,
+					self.user_version.compression, checksum)
+			# write ovl + static
+			stream = streams[self.filepath]
+			self.write_fields(stream, self)
+			self.eof = stream.tell()
+			if ovl_compressed is None:
+				copy_range(ovl_source, stream)
+			else:
 				stream.write(ovl_compressed)
+		# STATIC is stored after the ovl's header
+		for archive in self.archives:
+			if archive.name == "STATIC":
+				archive.content.source.read_start = self.eof
 
 
 if __name__ == "__main__":
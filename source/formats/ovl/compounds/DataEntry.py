@@ -36,6 +36,11 @@ class DataEntry:
 		"""Get data for each buffer"""
 		return list(buffer.data for buffer in self.sorted_buffers)
 
+	@property
+	def buffer_views(self):
+		"""Get a view of the data of each buffer, for reading or writing it out without copying it"""
+		return list(buffer.view for buffer in self.sorted_buffers)
+
 	def __eq__(self, other):
 		attr_check = ("buffer_count", "size_1", "size_2")
 		same = True
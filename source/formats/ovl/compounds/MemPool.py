@@ -3,6 +3,7 @@ import logging
 import numpy as np
 
 from generated.formats.base.compounds.PadAlign import get_padding
+from generated.io import ViewStream
 
 
 # END_GLOBALS
@@ -16,21 +17,34 @@ class MemPool:
 		self.new = False
 		# lookup by offset
 		self.offset_2_link = {}  # link_ptrs are unique
+		self.offset_2_loader = {}  # first loader that added the struct at offset to its stack
 		self.size_map = {}
 		self.offsets = set()
 		self.link_offsets = None
 
+	def release(self):
+		"""Drop the data and the lookups into it"""
+		data = getattr(self, "data", None)
+		if data is not None:
+			try:
+				data.close()
+			except BufferError:
+				# still in use elsewhere, it is freed once that lets go of it
+				pass
+		self.clear_data()
+
 	def get_ptrs_in_struct(self, p_offset, p_size):
-		"""find all link offsets that are within the parent struct using a boolean mask"""
+		"""find all link offsets that are within the parent struct using a binary search on the sorted link offsets"""
 		k = self.link_offsets
-		for l_offset in k[(p_offset <= k) * (k < p_offset + p_size)]:
+		start, stop = k.searchsorted((p_offset, p_offset + p_size))
+		for l_offset in k[start:stop].tolist():
 			entry = self.offset_2_link[l_offset]
 			yield l_offset, l_offset - p_offset, entry
 
 	def get_first_offset(self):
 		# usually 0, but be safe
 		if self.offsets:
-			first_offset = sorted(self.offsets)[0]
+			first_offset = min(self.offsets)
 			return first_offset
 
 	def calc_size_map(self):
@@ -45,8 +59,9 @@ class MemPool:
 			# get the offset of the next pointer, substract this offset
 			data_size = sorted_offsets[i + 1] - offset
 			self.size_map[offset] = data_size
-		# store array of link offsets for check_for_ptrs
-		self.link_offsets = np.array(list(self.offset_2_link.keys()))
+		# store sorted array of link offsets for check_for_ptrs
+		self.link_offsets = np.fromiter(self.offset_2_link.keys(), dtype=np.int64, count=len(self.offset_2_link))
+		self.link_offsets.sort()
 
 	def replace_bytes_at(self, offset, byte_name_tups):
 		"""Replaces the bytes tuples in byte_name_tups"""
@@ -63,6 +78,13 @@ class MemPool:
 		self.data.seek(offset)
 		return self.data
 
+	def reader_at(self, offset):
+		"""Returns a read-only stream at offset that parses the data in place, close it before writing to the pool"""
+		stream = ViewStream(self.data.getbuffer())
+		# emulate empty pointers to 'read' the end of a pool
+		stream.seek(len(stream.view) if offset is None else offset)
+		return stream
+
 	def get_at(self, offset, size=-1):
 		self.data.seek(offset)
 		return self.data.read(size)
@@ -2,7 +2,7 @@ import logging
 from struct import Struct
 
 from generated.array import Array
-from generated.formats.base.basic import class_from_struct, ZString, r_zstr, w_zstr, Int
+from generated.formats.base.basic import class_from_struct, ZString, read_zstr, w_zstr, Int
 
 Bool = class_from_struct(Struct("<?"), bool)
 
@@ -10,8 +10,8 @@ Bool = class_from_struct(Struct("<?"), bool)
 separator = "::"
 
 
-def r_zstr_obfuscated(r_func):
-    _hash, _name = r_zstr(r_func).split(separator)
+def r_zstr_obfuscated(stream):
+    _hash, _name = read_zstr(stream).split(separator)
     name_str = _obfuscate(_name, delta=-1)
     return f"{_hash}{separator}{name_str}"
 
@@ -22,19 +22,24 @@ def w_zstr_obfuscated(w_func, s):
     w_zstr(w_func, f"{_hash}{separator}{name_str}")
 
 
+# byte translation tables for _obfuscate, by delta
+_obfuscate_tables = {}
+
+
 def _obfuscate(s, delta=1):
-    b = bytearray(s.encode())
+    table = _obfuscate_tables.get(delta)
+    if table is None:
+        # shift each byte, clamped to the byte range
+        table = _obfuscate_tables[delta] = bytes(min(255, max(0, i + delta)) for i in range(256))
     # decode the names
-    for i in range(len(b)):
-        b[i] = max(0, b[i] + delta)
-    return b.decode()
+    return s.encode().translate(table).decode()
 
 
 class ZStringObfuscated(ZString):
 
     @staticmethod
     def from_stream(stream, context=None, arg=0, template=None):
-        return r_zstr_obfuscated(stream.read)
+        return r_zstr_obfuscated(stream)
 
     @staticmethod
     def to_stream(instance, stream, context=None, arg=0, template=None):
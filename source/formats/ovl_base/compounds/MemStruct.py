@@ -22,7 +22,7 @@ class MemStruct:
 		# could work if the order is good
 		pool.offsets.add(self.io_start)
 		pool.size_map[self.io_start] = self.io_size
-		children = loader.stack[(pool, self.io_start)] = {}
+		children = loader.add_to_stack(pool, self.io_start)
 		for ptr, f_name, arguments in MemStruct.get_instances_recursive(self, Pointer):
 			# when an array is entered
 			# locates the read address, attaches the frag entry, and reads the template as ptr.data
@@ -0,0 +1,37 @@
+import shutil
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from pytest import TempPathFactory
+
+from generated.formats.ovl import OvlFile
+
+TEXT_FILE = "tests/Files/textfile.txt"
+# a real format, its structs, arrays and strings are spread over the pools
+PSCOLLECTION_FILE = "tests/ovldata/Formats/statements.pscollection"
+
+
+def create_ovl(src_dir: Path, files: dict, game: str = "Planet Zoo") -> OvlFile:
+	"""create an ovl from src_dir, after copying the files into it, given as {file name: source path}"""
+	src_dir.mkdir(parents=True, exist_ok=True)
+	for file_name, file_path in files.items():
+		shutil.copy(file_path, src_dir / file_name)
+	ovl = OvlFile()
+	ovl.load_hash_table()
+	ovl.game = game
+	ovl.create(str(src_dir))
+	return ovl
+
+
+@pytest.fixture(scope="module")
+def make_ovl(tmp_path_factory: TempPathFactory) -> Callable[..., str]:
+	"""returns a function that creates and saves an ovl from the files, by default the text file, and returns its path"""
+	tmp = tmp_path_factory.mktemp("ovls")
+
+	def make(name: str, files: dict = None, game: str = "Planet Zoo") -> str:
+		ovl = create_ovl(tmp / name, files or {"textfile.txt": TEXT_FILE}, game)
+		filepath = str(tmp / f"{name}.ovl")
+		ovl.save(filepath)
+		return filepath
+	return make
@@ -0,0 +1,100 @@
+import filecmp
+import json
+import shutil
+import time
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from pytest import TempPathFactory
+
+from generated.formats.ovl import OvlFile
+from generated.formats.ovl_base.enums.Compression import Compression
+from modules.batch import BatchJob, BatchScheduler, create_ovl, extract_ovl, ovl_disk_size
+
+
+@pytest.fixture(scope="module")
+def tmp(tmp_path_factory: TempPathFactory):
+	path = tmp_path_factory.mktemp("batch")
+	return path
+
+
+@pytest.fixture(scope="module")
+def ovl_paths(make_ovl: Callable[..., str]) -> list:
+	return [make_ovl(f"batch_{i}") for i in range(3)]
+
+
+def extract_jobs(ovl_paths: list, out_dir: Path) -> list:
+	return [BatchJob(p, (p, str(out_dir / Path(p).stem))) for p in ovl_paths]
+
+
+class TestBatch:
+
+	def test_batch_extract(self, ovl_paths: list, tmp: Path) -> None:
+		manifest_path = str(tmp / "manifest.json")
+		summary = BatchScheduler(manifest_path, max_workers=2).run(extract_ovl, extract_jobs(ovl_paths, tmp / "out"))
+		assert summary.done == {p: 1 for p in ovl_paths}
+		assert not summary.failed
+		for p in ovl_paths:
+			assert filecmp.cmp(tmp / "out" / Path(p).stem / "textfile.txt", "tests/Files/textfile.txt", shallow=False)
+		# a successful batch starts over next time
+		assert not Path(manifest_path).exists()
+
+	def test_batch_create_profile(self, tmp: Path) -> None:
+		"""packing jobs save with the given profile"""
+		src_dir = tmp / "profile_src"
+		src_dir.mkdir()
+		shutil.copy("tests/Files/textfile.txt", src_dir)
+		ovl_path = str(tmp / "profile" / "uncompressed.ovl")
+		assert create_ovl(str(src_dir), ovl_path, "Planet Zoo", "uncompressed") == 1
+		ovl = OvlFile()
+		ovl.load(ovl_path)
+		assert ovl.user_version.compression == Compression.NONE
+		ovl.close()
+
+	def test_batch_resume(self, ovl_paths: list, tmp: Path) -> None:
+		manifest_path = str(tmp / "resume.json")
+		missing = str(tmp / "missing.ovl")
+		jobs = extract_jobs(ovl_paths + [missing], tmp / "resume")
+		summary = BatchScheduler(manifest_path, max_workers=2).run(extract_ovl, jobs)
+		assert list(summary.failed) == [missing]
+		with open(manifest_path) as f:
+			records = json.load(f)["jobs"]
+		assert records[missing]["status"] == "failed"
+		assert "FileNotFoundError" in records[missing]["error"]
+		# only the failed job runs again
+		summary = BatchScheduler(manifest_path, max_workers=2).run(extract_ovl, jobs)
+		assert sorted(summary.skipped) == sorted(ovl_paths)
+		assert list(summary.failed) == [missing]
+		assert not summary.done
+
+	def test_batch_resume_other_args(self, ovl_paths: list, tmp: Path) -> None:
+		"""jobs that were done with other args, eg. for other file types, run again"""
+		manifest_path = str(tmp / "args.json")
+		missing = str(tmp / "missing.ovl")
+		jobs = extract_jobs(ovl_paths + [missing], tmp / "txt")
+		summary = BatchScheduler(manifest_path, max_workers=2).run(extract_ovl, jobs)
+		assert list(summary.failed) == [missing]
+		other_jobs = [BatchJob(job.key, (*job.args, (".fgm", ))) for job in jobs]
+		summary = BatchScheduler(manifest_path, max_workers=2).run(extract_ovl, other_jobs)
+		assert not summary.skipped
+		assert sorted(summary.done) == sorted(ovl_paths)
+
+	def test_batch_timeout(self, tmp: Path) -> None:
+		jobs = [BatchJob("slow", (30, )), BatchJob("quick", (0, ))]
+		start = time.time()
+		summary = BatchScheduler(max_workers=2, timeout=1).run(time.sleep, jobs)
+		assert time.time() - start < 10
+		assert list(summary.done) == ["quick"]
+		assert "Timed out" in summary.failed["slow"]
+
+	def test_batch_memory_budget(self, ovl_paths: list, tmp: Path) -> None:
+		size = ovl_disk_size(ovl_paths[0])
+		assert size > 0
+		# jobs that exceed the budget still run, one at a time
+		jobs = [BatchJob(str(i), (0.2, ), memory=2) for i in range(3)]
+		scheduler = BatchScheduler(max_workers=3, memory_budget=1)
+		start = time.time()
+		summary = scheduler.run(time.sleep, jobs)
+		assert len(summary.done) == 3
+		assert time.time() - start >= 0.6
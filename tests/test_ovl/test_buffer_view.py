@@ -0,0 +1,81 @@
+import io
+import mmap
+from pathlib import Path
+
+import pytest
+
+from generated.formats.base.basic import Ushort, Float, ZString
+from generated.formats.ovl import OvlFile
+from generated.formats.ovl.compounds.BufferEntry import BufferEntry
+from generated.formats.ovl.compounds.MemPool import MemPool
+from generated.formats.ovl_base import OvlContext
+from generated.io import ViewStream
+import generated.formats.ovl.imports
+
+
+class TestBufferView:
+
+	def test_view_stream(self) -> None:
+		with ViewStream(b"0123456789") as stream:
+			assert stream.read(2) == b"01"
+			view = stream.read_view(3)
+			assert isinstance(view, memoryview) and view == b"234"
+			stream.seek(-2, 2)
+			assert stream.read() == b"89"
+			assert stream.read(4) == b""
+			stream.seek(1)
+			target = bytearray(4)
+			assert stream.readinto(target) == 4
+			assert target == b"1234"
+			assert stream.tell() == 5
+
+	def test_mapped_buffer(self, tmp_path: Path) -> None:
+		filepath = tmp_path / "buffer.bin"
+		filepath.write_bytes(b"headerbufferdata")
+		with open(filepath, "rb") as f:
+			mapped = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+		buffer = BufferEntry(OvlFile())
+		buffer.size = 10
+		with ViewStream(mapped) as stream:
+			stream.seek(6)
+			buffer.read_data(stream)
+		del mapped
+		assert buffer.is_mapped
+		# reading the view does not copy the data
+		view = buffer.view
+		assert view == b"bufferdata" and view.readonly
+		view.release()
+		assert buffer.is_mapped
+		# first access copies the data out of the map
+		assert buffer.data == b"bufferdata"
+		assert isinstance(buffer.data, bytes)
+		assert not buffer.is_mapped
+
+	def test_read_in_place(self) -> None:
+		"""basics and zstrings read from a ViewStream match the stream reads and leave the cursor behind them"""
+		data = Ushort.np_dtype.type(7).tobytes() + Float.np_dtype.type(1.5).tobytes() + b"name\x00" + b"x" * 100 + b"\x00"
+		for stream in (io.BytesIO(data), ViewStream(data)):
+			assert Ushort.from_stream(stream) == 7
+			assert Float.from_stream(stream) == 1.5
+			assert ZString.from_stream(stream) == "name"
+			assert ZString.from_stream(stream) == "x" * 100
+			assert stream.tell() == len(data)
+		with pytest.raises(ValueError):
+			ZString.from_stream(ViewStream(b"no terminator"))
+
+	def test_pool_reader(self) -> None:
+		"""structs are parsed in place from the pool, which can be written again once the reader is closed"""
+		context = OvlContext()
+		context.version = 20
+		pool = MemPool(context)
+		pool.size = 1234
+		pool.offset = 5678
+		stored = MemPool(context)
+		stored.data = io.BytesIO()
+		stored.data.write(b"\x00" * 4)
+		MemPool.to_stream(pool, stored.data, context)
+		with stored.reader_at(4) as stream:
+			read = MemPool.from_stream(stream, context)
+			assert stream.tell() == stored.data.tell()
+		assert (read.size, read.offset, read.io_start) == (1234, 5678, 4)
+		stored.data.write(b"more")
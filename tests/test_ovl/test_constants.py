@@ -0,0 +1,82 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+import constants as constants_package
+from constants import ConstantsProvider, HashStore
+
+
+class TestConstants:
+
+	def test_lazy_constants(self) -> None:
+		constants = ConstantsProvider()
+		assert "Planet Zoo" in constants
+		assert "Unknown Game" not in constants
+		# nothing is imported until a game is accessed
+		assert not constants.loaded
+		assert ".txt" in constants["Planet Zoo"]["mimes"]
+		assert list(constants.loaded) == ["Planet Zoo"]
+		assert list(constants["Planet Zoo"].loaded) == ["mimes"]
+		with pytest.raises(KeyError):
+			constants["Unknown Game"]
+		# all games and tables are listed, loaded or not
+		assert sorted(constants) == sorted(constants.game_dirs)
+		assert len(constants) == len(constants.game_dirs)
+		assert "Planet Coaster" in constants.keys()
+		assert list(constants["Planet Zoo"].keys()) == ["hashes", "mimes", "shaders"]
+
+	def test_hash_store(self, tmp_path: Path) -> None:
+		hashes = {4294967295: "last", 0: "first", 1234: "ünicode", 56: ""}
+		filepath = str(tmp_path / "hashes.bin")
+		HashStore.write(filepath, hashes)
+		store = HashStore(filepath)
+		assert len(store) == len(hashes)
+		for h, name in hashes.items():
+			assert h in store
+			assert store[h] == name
+		for h in (1, 1235, -1, 2 ** 32):
+			assert h not in store
+			assert store.get(h) is None
+		with pytest.raises(KeyError):
+			store[1]
+		store.close()
+		assert store.data is None
+		with HashStore(filepath) as store:
+			assert store[0] == "first"
+		assert store.data is None
+
+	def test_close(self, tmp_path: Path) -> None:
+		"""closing the provider unmaps the hash stores, which are mapped again on the next access"""
+		game_dir = tmp_path / "Planet Zoo"
+		game_dir.mkdir()
+		HashStore.write(str(game_dir / "hashes.bin"), {0: "first"})
+		with ConstantsProvider(str(tmp_path)) as constants:
+			store = constants["Planet Zoo"]["hashes"]
+			assert store[0] == "first"
+		assert store.data is None
+		assert not constants.loaded
+		assert constants["Planet Zoo"]["hashes"][0] == "first"
+		constants.close()
+
+	def test_hash_store_extra(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+		"""custom additions from other hashes modules take priority over the store"""
+		game_dir = tmp_path / "Custom Game"
+		game_dir.mkdir()
+		HashStore.write(str(game_dir / "hashes.bin"), {0: "first", 1: "stored"})
+		(game_dir / "hashes_extra.py").write_text('hashes = {1: "custom", 2: "extra"}\n')
+		# the game modules are imported from the constants package
+		monkeypatch.setattr(constants_package, "__path__", [*constants_package.__path__, str(tmp_path)])
+		monkeypatch.delitem(sys.modules, "constants.Custom Game", raising=False)
+		monkeypatch.delitem(sys.modules, "constants.Custom Game.hashes_extra", raising=False)
+		with ConstantsProvider(str(tmp_path)) as constants:
+			hashes = constants["Custom Game"]["hashes"]
+			assert isinstance(hashes, HashStore)
+			assert hashes[0] == "first"
+			assert hashes[1] == "custom"
+			assert hashes[2] == "extra"
+			assert 2 in hashes
+			assert len(hashes) == 3
+			assert hashes.lookup([0, 1, 2, 3]) == {0: "first", 1: "custom", 2: "extra"}
+		sys.modules.pop("constants.Custom Game", None)
+		sys.modules.pop("constants.Custom Game.hashes_extra", None)
@@ -0,0 +1,68 @@
+import logging
+from pathlib import Path
+
+import numpy as np
+from pytest import LogCaptureFixture, MonkeyPatch
+
+from constants import ConstantsProvider, HashStore
+from generated.formats.ovl import OvlFile, UNK_HASH
+from modules.formats.shared import djb2
+from modules.ovl_index import OvlIndex
+
+
+def constants_with_hashes(tmp_path: Path, games: dict) -> ConstantsProvider:
+	"""a constants folder with a hash store for each game"""
+	for game, names in games.items():
+		game_dir = tmp_path / game
+		game_dir.mkdir()
+		HashStore.write(str(game_dir / "hashes.bin"), {djb2(name): name for name in names})
+	return ConstantsProvider(str(tmp_path))
+
+
+def ovl_with_deps(dep_names, commands) -> OvlFile:
+	"""set up the parts of an ovl that are used to resolve its dependencies"""
+	ovl = OvlFile()
+	ovl.game = "Planet Zoo"
+	ovl.commands = commands
+	ovl.files_name = ["local.txt"]
+	ovl.hash_table_local = {djb2("local"): "local"}
+	ovl.dependencies = np.zeros(len(dep_names), dtype=[("file_hash", np.uint32), ("file_index", np.uint32)])
+	ovl.dependencies["file_hash"] = [djb2(name) for name in dep_names]
+	ovl.dependencies_ext = [".tex"] * len(dep_names)
+	return ovl
+
+
+class TestDepNames:
+
+	def test_resolve_dep_names(self, tmp_path: Path, caplog: LogCaptureFixture) -> None:
+		ovl = ovl_with_deps(["local", "from_store", "missing", "missing"], {})
+		ovl.constants = constants_with_hashes(tmp_path, {"Planet Zoo": ["from_store"]})
+		with caplog.at_level(logging.WARNING):
+			names = ovl.resolve_dep_names()
+		missing = f"{UNK_HASH}_{djb2('missing')}"
+		assert names == ["local", "from_store", missing, missing]
+		# one report for all missing hashes
+		warnings = [record for record in caplog.records if record.levelno == logging.WARNING]
+		assert len(warnings) == 1
+		assert "2 dependencies" in warnings[0].message
+
+	def test_resolve_dep_names_fallback(self, tmp_path: Path) -> None:
+		ovl = ovl_with_deps(["other_game", "unlisted_game"], {"dep_fallback_games": ("Planet Coaster", "Unknown Game")})
+		ovl.constants = constants_with_hashes(tmp_path, {
+			"Planet Zoo": [],
+			"Planet Coaster": ["other_game"],
+			"Jurassic World Evolution": ["unlisted_game"]})
+		assert ovl.resolve_dep_names() == ["other_game", f"{UNK_HASH}_{djb2('unlisted_game')}"]
+		# only the configured games are loaded
+		assert sorted(ovl.constants.loaded) == ["Planet Coaster", "Planet Zoo"]
+		ovl.commands = {}
+		assert ovl.resolve_dep_names()[0] == f"{UNK_HASH}_{djb2('other_game')}"
+
+	def test_resolve_dep_names_index(self, tmp_path: Path, caplog: LogCaptureFixture, monkeypatch: MonkeyPatch) -> None:
+		"""a game dir without any indexed ovls is reported"""
+		monkeypatch.setattr(OvlIndex.__init__, "__defaults__", (str(tmp_path / "index.sqlite"), ))
+		ovl = ovl_with_deps(["missing"], {"dep_index_dir": str(tmp_path)})
+		ovl.constants = constants_with_hashes(tmp_path, {"Planet Zoo": []})
+		with caplog.at_level(logging.WARNING):
+			assert ovl.resolve_dep_names() == [f"{UNK_HASH}_{djb2('missing')}"]
+		assert "No ovls are indexed" in caplog.text
@@ -0,0 +1,19 @@
+import numpy as np
+
+from generated.formats.ovl import OvlFile, UNK_HASH
+from modules.formats.shared import djb2, djb2_array
+
+
+class TestDjb2:
+
+	def test_djb2_array(self) -> None:
+		names = ["", "a", "textfile", "very_long_name_of_a_dependency_that_overflows_32bit", "ünïcode_€", "x" * 300]
+		hashes = djb2_array(names)
+		assert hashes.dtype == np.uint32
+		assert hashes.tolist() == [djb2(name) for name in names]
+		assert djb2_array([]).tolist() == []
+		assert djb2_array([""]).tolist() == [djb2("")]
+
+	def test_dep_hashes(self) -> None:
+		names = ["textfile", f"{UNK_HASH}_1234"]
+		assert OvlFile.get_dep_hashes(names).tolist() == [OvlFile.get_dep_hash(name) for name in names] == [djb2("textfile"), 1234]
@@ -0,0 +1,57 @@
+import io
+
+import pytest
+
+from generated.base_struct import FieldPlan
+from generated.formats.ovl.compounds.Header import Header
+from generated.formats.ovl.compounds.MemPool import MemPool
+from generated.formats.ovl_base import OvlContext
+
+
+def context_for(version: int) -> OvlContext:
+	context = OvlContext()
+	context.version = version
+	return context
+
+
+def write_generic(pool: MemPool) -> bytes:
+	"""write pool field by field, without a plan"""
+	stream = io.BytesIO()
+	for f_name, f_type, arguments, _ in MemPool._get_filtered_attribute_list(pool, include_abstract=False):
+		f_type.to_stream(getattr(pool, f_name), stream, pool.context, *arguments)
+	return stream.getvalue()
+
+
+class TestFieldPlan:
+
+	def test_static_layout(self) -> None:
+		assert MemPool.has_static_layout()
+		# reading the version changes the layout of the following fields
+		assert not Header.has_static_layout()
+
+	@pytest.mark.parametrize("version", (15, 17, 19, 20))
+	def test_round_trip(self, version: int) -> None:
+		"""the fused reader and writer match the per field layout for each version"""
+		context = context_for(version)
+		pool = MemPool(context)
+		pool.size = 1234
+		pool.offset = 5678
+		pool.file_hash = 0xDEADBEEF
+		pool.num_files = 3
+		plan = MemPool.get_field_plan(pool)
+		assert isinstance(plan, FieldPlan)
+		# the plan is cached for this version
+		assert MemPool.get_field_plan(pool) is plan
+		data = write_generic(pool)
+		stream = io.BytesIO()
+		MemPool.to_stream(pool, stream, context)
+		assert stream.getvalue() == data
+		stream.seek(0)
+		read = MemPool.from_stream(stream, context)
+		assert read.io_size == len(data)
+		for f_name in ("size", "offset", "file_hash"):
+			assert getattr(read, f_name) == getattr(pool, f_name)
+
+	def test_short_read(self) -> None:
+		with pytest.raises(BufferError):
+			MemPool.from_stream(io.BytesIO(b"\x00" * 4), context_for(20))
@@ -0,0 +1,90 @@
+from generated.formats.ovl import OvlFile
+from generated.formats.ovl.compounds.MemPool import MemPool
+from modules.formats.BaseFormat import BaseFile
+
+LINK_SIZE = 8
+LINKS_PER_STRUCT = 8
+
+
+def synthetic_pool(num_links: int) -> MemPool:
+	"""create a pool with num_links dependency links, evenly spread over structs"""
+	pool = MemPool(OvlFile())
+	pool.clear_data()
+	struct_size = LINK_SIZE * LINKS_PER_STRUCT
+	pool.size = num_links * LINK_SIZE
+	pool.offsets.update(range(0, pool.size, struct_size))
+	# insert out of order to make sure lookup does not rely on dict order
+	for l_offset in reversed(range(0, pool.size, LINK_SIZE)):
+		pool.offset_2_link[l_offset] = f"dep_{l_offset}"
+	pool.calc_size_map()
+	return pool
+
+
+def scan_pool(pool: MemPool) -> int:
+	"""visit every struct like BaseFile.check_for_ptrs does and count the links that were found"""
+	found = 0
+	for p_offset, p_size in pool.size_map.items():
+		for l_offset, rel_offset, entry in pool.get_ptrs_in_struct(p_offset, p_size):
+			assert p_offset <= l_offset < p_offset + p_size
+			assert entry == f"dep_{l_offset}"
+			found += 1
+	return found
+
+
+class SortedOffsets:
+	"""the sorted link offsets, but only supporting what a binary search needs, to fail on a scan of all links"""
+
+	def __init__(self, offsets) -> None:
+		self.offsets = offsets
+		self.searches = 0
+
+	def searchsorted(self, values):
+		self.searches += 1
+		return self.offsets.searchsorted(values)
+
+	def __getitem__(self, key: slice):
+		assert isinstance(key, slice)
+		return self.offsets[key]
+
+
+class TestMemPool:
+
+	def test_ptrs_in_struct(self) -> None:
+		pool = synthetic_pool(64)
+		ptrs = list(pool.get_ptrs_in_struct(64, 64))
+		assert [rel_offset for l_offset, rel_offset, entry in ptrs] == list(range(0, 64, LINK_SIZE))
+		assert [l_offset for l_offset, rel_offset, entry in ptrs] == list(range(64, 128, LINK_SIZE))
+		# struct past the last link
+		assert list(pool.get_ptrs_in_struct(pool.size, 16)) == []
+
+	def test_ptrs_in_struct_search(self) -> None:
+		"""each struct is looked up with a binary search, with the same results as checking every link"""
+		pool = synthetic_pool(1000)
+		# structs of uneven sizes, some without links
+		pool.offsets = {0, 8, 100, 104, 1000, 4000, 4004, 7990}
+		pool.calc_size_map()
+		link_offsets = SortedOffsets(pool.link_offsets)
+		pool.link_offsets = link_offsets
+		for p_offset, p_size in pool.size_map.items():
+			reference = [(l_offset, l_offset - p_offset, entry) for l_offset, entry in sorted(pool.offset_2_link.items())
+				if p_offset <= l_offset < p_offset + p_size]
+			assert list(pool.get_ptrs_in_struct(p_offset, p_size)) == reference
+		assert link_offsets.searches == len(pool.size_map)
+		assert scan_pool(pool) == 1000
+
+	def test_pool_owner(self) -> None:
+		ovl = OvlFile()
+		ovs = ovl.create_archive()
+		pool = synthetic_pool(64)
+		first = ovl.loaders["first.txt"] = BaseFile(ovl, "first.txt")
+		second = ovl.loaders["second.txt"] = BaseFile(ovl, "second.txt")
+		first.add_to_stack(pool, 0)
+		second.add_to_stack(pool, 0)
+		second.add_to_stack(pool, 64)
+		# the first loader to claim a struct owns it, like the order of ovl.loaders
+		assert ovs.get_owner(pool, 0) is first
+		assert ovs.get_owner(pool, 64) is second
+		assert ovs.get_owner(pool, 128) is None
+		# outdated index entries are skipped
+		ovl.loaders.pop("first.txt")
+		assert ovs.get_owner(pool, 0) is second
@@ -0,0 +1,44 @@
+import io
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+from generated.array import Array
+from generated.formats.base.compounds.Vector4 import Vector4
+from generated.formats.ovl.compounds.PoolGroup import PoolGroup
+from generated.formats.voxelskirt.compounds.Area import Area
+import generated.formats.ovl.imports
+import generated.formats.voxelskirt.imports
+
+
+class TestNpArrays:
+
+	def test_fixed_layout(self) -> None:
+		"""only compounds with allow_np="auto" and a fixed layout get structured arrays"""
+		assert Vector4.allow_np
+		# fixed layout, but not opted in
+		assert not PoolGroup.allow_np
+		# voxelskirt attaches names to its areas
+		assert not Area.allow_np
+
+	def test_read_write(self) -> None:
+		data = np.arange(12, dtype="<f4").tobytes()
+		array = Array.from_stream(io.BytesIO(data), None, 0, None, (3,), Vector4)
+		assert isinstance(array, np.ndarray)
+		assert array[1].x == 4.0
+		array[2].w = 20.0
+		stream = io.BytesIO()
+		Array.to_stream(array, stream, None, 0, None, (3,), Vector4)
+		assert stream.getvalue()[-4:] == np.float32(20.0).tobytes()
+		assert stream.getvalue()[:-4] == data[:-4]
+
+	def test_xml(self) -> None:
+		"""records are stored like python structs on the xml and come back as a structured array"""
+		array = Array(None, 0, None, (2,), Vector4)
+		array[1].y = 2.5
+		elem = ET.Element("root")
+		Array.to_xml(elem, "quats", array, 0, None, (2,), Vector4, False)
+		assert len(elem.find("quats")) == 2
+		loaded = Array.from_xml(None, elem, "quats", 0, None, (2,), Vector4)
+		assert isinstance(loaded, np.ndarray)
+		assert loaded.tobytes() == array.tobytes()
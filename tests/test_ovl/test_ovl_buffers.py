@@ -0,0 +1,35 @@
+from pathlib import Path
+
+import pytest
+
+from generated.formats.ovl import OvlFile
+
+# precompiled lua is stored as is, without a syntax check
+LUA_BYTES = b"\x1bLua" + bytes(range(60))
+
+
+class TestOVLBuffers:
+	"""create and save OVLs whose loaders have buffers, which are grouped per extension from version 20 on"""
+
+	@pytest.mark.parametrize("game", ("Planet Zoo", "Jurassic World Evolution 2"))
+	def test_ovl_save_buffers(self, game: str, tmp_path: Path) -> None:
+		src_dir = tmp_path / "Buffers"
+		src_dir.mkdir()
+		for name in ("a.lua", "b.lua"):
+			(src_dir / name).write_bytes(LUA_BYTES)
+		ovl = OvlFile()
+		ovl.load_hash_table()
+		ovl.game = game
+		ovl.create(str(src_dir))
+		filepath = str(tmp_path / "buffers.ovl")
+		ovl.save(filepath)
+		ovl.load(filepath)
+		assert ovl.game == game
+		for name in ("a.lua", "b.lua"):
+			assert ovl.loaders[name].data_entry.buffer_datas[0] == LUA_BYTES
+		if ovl.context.version >= 20:
+			buffer_groups = ovl.archives[0].content.buffer_groups
+			assert sum(group.buffer_count for group in buffer_groups) == 2
+		# saving again rebuilds the buffer groups
+		ovl.save(filepath)
+		ovl.close()
@@ -0,0 +1,65 @@
+import filecmp
+import gc
+import weakref
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from pytest import TempPathFactory
+
+from generated.formats.ovl import OvlFile
+
+
+@pytest.fixture(scope="module")
+def tmp(tmp_path_factory: TempPathFactory):
+	path = tmp_path_factory.mktemp("close")
+	return path
+
+
+@pytest.fixture(scope="module")
+def ovl_path(make_ovl: Callable[..., str]) -> str:
+	return make_ovl("close")
+
+
+def load(filepath: str) -> OvlFile:
+	ovl = OvlFile()
+	ovl.load_hash_table()
+	ovl.load(filepath)
+	return ovl
+
+
+class TestOVLClose:
+
+	def test_ovl_close(self, ovl_path: str) -> None:
+		"""the loaders and pools of an ovl are freed on close, without the garbage collector"""
+		ovl = load(ovl_path)
+		loader = weakref.ref(ovl.loaders["textfile.txt"])
+		pool = weakref.ref(ovl.pools[0])
+		ovs = weakref.ref(ovl.archives[0].content)
+		gc.disable()
+		try:
+			ovl.close()
+			assert not ovl.loaders
+			assert not ovl.archives
+			assert loader() is None
+			assert pool() is None
+			assert ovs() is None
+			# the hash stores are unmapped too
+			assert not ovl.constants.loaded
+		finally:
+			gc.enable()
+
+	def test_ovl_reuse(self, ovl_path: str, tmp: Path) -> None:
+		with load(ovl_path) as ovl:
+			ovl.close()
+			ovl.load(ovl_path)
+			out_paths = ovl.extract(str(tmp / "reuse"))
+			assert filecmp.cmp(out_paths[0], "tests/Files/textfile.txt", shallow=False)
+		assert not ovl.loaders
+
+	def test_ovl_record_types(self, ovl_path: str) -> None:
+		"""structured arrays of the same struct share their record type across loads"""
+		ovl = load(ovl_path)
+		record = ovl.files.dtype.type
+		ovl.load(ovl_path)
+		assert ovl.files.dtype.type is record
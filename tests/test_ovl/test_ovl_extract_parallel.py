@@ -0,0 +1,68 @@
+import filecmp
+import logging
+import os
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from pytest import LogCaptureFixture, TempPathFactory
+
+from generated.formats.ovl import OvlFile
+from tests.test_ovl.conftest import PSCOLLECTION_FILE, TEXT_FILE
+
+
+@pytest.fixture(scope="module")
+def tmp(tmp_path_factory: TempPathFactory):
+	path = tmp_path_factory.mktemp("parallel")
+	return path
+
+
+@pytest.fixture(scope="module")
+def ovl_path(make_ovl: Callable[..., str]) -> str:
+	files = {f"textfile_{i}.txt": TEXT_FILE for i in range(6)}
+	files["statements.pscollection"] = PSCOLLECTION_FILE
+	return make_ovl("parallel", files)
+
+
+def load(filepath: str) -> OvlFile:
+	ovl = OvlFile()
+	ovl.load_hash_table()
+	ovl.max_workers = 2
+	ovl.load(filepath)
+	return ovl
+
+
+class TestOVLExtractParallel:
+
+	def test_ovl_extract_parallel(self, ovl_path: str, tmp: Path) -> None:
+		ovl = load(ovl_path)
+		serial_paths = ovl.extract(str(tmp / "serial"))
+		parallel_paths = ovl.extract(str(tmp / "parallel"), parallel=True)
+		# same files, in the same order
+		assert [os.path.basename(p) for p in parallel_paths] == [os.path.basename(p) for p in serial_paths]
+		assert len(parallel_paths) == 7
+		for serial_path, parallel_path in zip(serial_paths, parallel_paths):
+			assert filecmp.cmp(serial_path, parallel_path, shallow=False)
+			if parallel_path.endswith(".txt"):
+				assert filecmp.cmp(parallel_path, TEXT_FILE, shallow=False)
+
+	def test_ovl_extract_parallel_only_names(self, ovl_path: str, tmp: Path) -> None:
+		ovl = load(ovl_path)
+		out_paths = ovl.extract(str(tmp / "only_names"), only_names=("textfile_1.txt", "textfile_4.txt"), parallel=True)
+		assert [os.path.basename(p) for p in out_paths] == ["textfile_1.txt", "textfile_4.txt"]
+
+	def test_ovl_extract_parallel_modified(self, ovl_path: str, tmp: Path) -> None:
+		"""renamed files only exist in memory, so they must not be extracted from the file on disk"""
+		ovl = load(ovl_path)
+		ovl.rename_contents([("textfile", "renamed")], None)
+		out_paths = ovl.extract(str(tmp / "modified"), parallel=True)
+		assert len(out_paths) == 7
+
+	def test_ovl_extract_parallel_logs(self, ovl_path: str, tmp: Path, caplog: LogCaptureFixture) -> None:
+		"""the workers log on the main process and map the archives it decompressed instead of decompressing them"""
+		ovl = load(ovl_path)
+		caplog.set_level(logging.DEBUG)
+		ovl.extract(str(tmp / "logs"), parallel=True)
+		worker_records = [record for record in caplog.records if record.process != os.getpid()]
+		assert any(record.getMessage().startswith("Loading archive") for record in worker_records)
+		assert not any(record.getMessage().startswith("Compression magic bytes") for record in worker_records)
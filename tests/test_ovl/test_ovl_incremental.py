@@ -0,0 +1,140 @@
+import filecmp
+import shutil
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from pytest import TempPathFactory, MonkeyPatch
+
+import generated.formats.ovl as ovl_module
+from generated.formats.ovl import OvlFile, OvsFile
+from tests.test_ovl.conftest import PSCOLLECTION_FILE, TEXT_FILE
+
+
+@pytest.fixture(scope="module")
+def tmp(tmp_path_factory: TempPathFactory):
+	path = tmp_path_factory.mktemp("incremental")
+	return path
+
+
+@pytest.fixture(scope="module")
+def ovl_path(make_ovl: Callable[..., str]) -> str:
+	return make_ovl("Incremental", {"textfile.txt": TEXT_FILE, "statements.pscollection": PSCOLLECTION_FILE})
+
+
+def load(ovl_path: str) -> OvlFile:
+	ovl = OvlFile()
+	ovl.load_hash_table()
+	ovl.load(ovl_path)
+	return ovl
+
+
+@pytest.fixture
+def no_compress(monkeypatch: MonkeyPatch) -> None:
+	def compress(*args):
+		raise AssertionError("Unchanged archive was compressed again")
+	monkeypatch.setattr(OvsFile, "compress", compress)
+
+
+class TestOVLIncremental:
+
+	def test_ovl_save_unchanged(self, ovl_path: str, tmp: Path, no_compress: None) -> None:
+		ovl = load(ovl_path)
+		assert not any(loader.is_dirty for loader in ovl.loaders.values())
+		out = str(tmp / "unchanged.ovl")
+		# the copied archive keeps its original compression level
+		ovl.save(out, "smallest")
+		assert filecmp.cmp(ovl_path, out, shallow=False)
+
+	def test_ovl_save_in_place(self, ovl_path: str, tmp: Path, no_compress: None) -> None:
+		in_place = str(tmp / "in_place.ovl")
+		shutil.copy(ovl_path, in_place)
+		ovl = load(in_place)
+		ovl.save(in_place)
+		# source is updated after saving
+		ovl.save(in_place)
+		assert filecmp.cmp(ovl_path, in_place, shallow=False)
+
+	def test_ovl_save_dirty(self, ovl_path: str, tmp: Path, monkeypatch: MonkeyPatch) -> None:
+		compressed = []
+		compress = OvsFile.compress
+
+		def spy(ovs, *args):
+			compressed.append(ovs.arg.name)
+			return compress(ovs, *args)
+		monkeypatch.setattr(OvsFile, "compress", spy)
+		ovl = load(ovl_path)
+		ovl.rename_contents([("a", "b")], ["textfile.txt"])
+		out = str(tmp / "dirty.ovl")
+		ovl.save(out)
+		assert compressed == ["STATIC"]
+		assert not ovl.loaders["textfile.txt"].is_dirty
+		out_paths = load(out).extract(str(tmp / "dirty"))
+		assert filecmp.cmp(out_paths[1], TEXT_FILE, shallow=False)
+
+	def test_ovl_save_dirty_structs(self, ovl_path: str, tmp: Path) -> None:
+		"""the archive of a dirty loader with structs in its pools is written and compressed again, to the same contents"""
+		original_paths = load(ovl_path).extract(str(tmp / "original"))
+		ovl = load(ovl_path)
+		ovl.loaders["statements.pscollection"].is_dirty = True
+		out = str(tmp / "dirty_structs.ovl")
+		ovl.save(out)
+		out_paths = load(out).extract(str(tmp / "dirty_structs"))
+		assert len(out_paths) == 2
+		for out_path, original_path in zip(out_paths, original_paths):
+			assert filecmp.cmp(out_path, original_path, shallow=False)
+
+	def test_ovl_save_streamed(self, ovl_path: str, tmp: Path, monkeypatch: MonkeyPatch) -> None:
+		"""each archive is written once, and unchanged ones are copied without reading them into memory"""
+		written = []
+		write_archive = OvsFile.write_archive
+
+		def spy(ovs):
+			written.append(ovs.arg.name)
+			return write_archive(ovs)
+
+		def read_compressed(ovs):
+			raise AssertionError("Unchanged archive was read into memory")
+		monkeypatch.setattr(OvsFile, "write_archive", spy)
+		monkeypatch.setattr(OvsFile, "read_compressed", read_compressed)
+		in_place = str(tmp / "streamed.ovl")
+		shutil.copy(ovl_path, in_place)
+		ovl = load(in_place)
+		ovl.save(in_place)
+		assert written == ["STATIC"]
+		assert filecmp.cmp(ovl_path, in_place, shallow=False)
+
+	def test_ovl_save_in_place_dirty(self, ovl_path: str, tmp: Path, monkeypatch: MonkeyPatch) -> None:
+		"""a source is only copied if its checksum matches, and is replaced once everything was written"""
+		copied = []
+		copy_range = ovl_module.copy_range
+
+		def spy(source, stream):
+			copied.append(source)
+			return copy_range(source, stream)
+		monkeypatch.setattr(ovl_module, "copy_range", spy)
+		in_place = tmp / "in_place_dirty" / "in_place_dirty.ovl"
+		in_place.parent.mkdir()
+		shutil.copy(ovl_path, in_place)
+		ovl = load(str(in_place))
+		ovl.rename_contents([("a", "b")], ["textfile.txt"])
+		ovl.save(str(in_place))
+		assert not copied
+		assert sorted(path.name for path in in_place.parent.iterdir()) == ["in_place_dirty.ovl"]
+		out_paths = load(str(in_place)).extract(str(tmp / "in_place_dirty_out"))
+		assert filecmp.cmp(out_paths[1], TEXT_FILE, shallow=False)
+
+	def test_ovl_save_in_place_failed(self, ovl_path: str, tmp: Path, monkeypatch: MonkeyPatch) -> None:
+		"""the files of the ovl are left as they were if saving fails"""
+		def compress(*args):
+			raise ValueError("Compression failed")
+		monkeypatch.setattr(OvsFile, "compress", compress)
+		in_place = tmp / "in_place_failed" / "in_place_failed.ovl"
+		in_place.parent.mkdir()
+		shutil.copy(ovl_path, in_place)
+		ovl = load(str(in_place))
+		ovl.rename_contents([("a", "b")], ["textfile.txt"])
+		with pytest.raises(ValueError):
+			ovl.save(str(in_place))
+		assert sorted(path.name for path in in_place.parent.iterdir()) == ["in_place_failed.ovl"]
+		assert filecmp.cmp(ovl_path, in_place, shallow=False)
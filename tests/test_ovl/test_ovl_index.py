@@ -0,0 +1,50 @@
+import os
+import shutil
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from pytest import TempPathFactory
+
+from modules.formats.shared import djb2
+from modules.ovl_index import OvlIndex
+
+
+@pytest.fixture(scope="module")
+def game_dir(tmp_path_factory: TempPathFactory, make_ovl: Callable[..., str]) -> Path:
+	"""create a game folder with an ovl made from the text file"""
+	game = tmp_path_factory.mktemp("index") / "Game"
+	(game / "Content0").mkdir(parents=True)
+	shutil.copy(make_ovl("Index"), game / "Content0" / "Main.ovl")
+	return game
+
+
+class TestOVLIndex:
+
+	def test_ovl_index(self, game_dir: Path, tmp_path: Path) -> None:
+		ovl_path = os.path.normpath(game_dir / "Content0" / "Main.ovl")
+		with OvlIndex(str(tmp_path / "index.sqlite")) as index:
+			assert not index.is_indexed(str(game_dir))
+			assert index.update(str(game_dir), max_workers=2) == [ovl_path]
+			assert index.is_indexed(str(game_dir))
+			assert not index.is_indexed(str(tmp_path))
+			assert list(index.search_files(str(game_dir), "text")) == [(ovl_path, "textfile.txt", ".txt")]
+			assert list(index.search_files(str(game_dir), "missing")) == []
+			assert list(index.search_files(str(tmp_path), "text")) == []
+			assert index.lookup(str(game_dir), [djb2("textfile"), 5]) == {djb2("textfile"): "textfile"}
+			# windows paths are not case sensitive
+			assert list(index.search_files(str(game_dir).swapcase(), "text")) == [(ovl_path, "textfile.txt", ".txt")]
+			assert list(index.search_dependents(str(game_dir), "missing.tex")) == []
+			# nothing changed, so nothing is read again
+			assert index.update(str(game_dir)) == []
+			copy_path = os.path.normpath(game_dir / "Content0" / "Copy.ovl")
+			shutil.copy(ovl_path, copy_path)
+			assert index.update(str(game_dir)) == [copy_path]
+			assert len(list(index.search_files(str(game_dir), "text"))) == 2
+			os.remove(copy_path)
+			assert index.update(str(game_dir)) == []
+			assert list(index.search_files(str(game_dir), "text")) == [(ovl_path, "textfile.txt", ".txt")]
+		# the index persists
+		with OvlIndex(str(tmp_path / "index.sqlite")) as index:
+			assert index.update(str(game_dir)) == []
+			assert len(list(index.search_files(str(game_dir), "text"))) == 1
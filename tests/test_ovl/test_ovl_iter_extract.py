@@ -0,0 +1,56 @@
+import os
+import zipfile
+from pathlib import Path
+
+import pytest
+from pytest import TempPathFactory
+
+from generated.formats.ovl import OvlFile
+from generated.formats.userinterfaceicondata.compounds.UserinterfaceicondataRoot import UserinterfaceicondataRoot
+from modules.formats.BaseFormat import BaseFile
+from tests.test_ovl.conftest import create_ovl, TEXT_FILE
+
+
+@pytest.fixture(scope="module")
+def tmp(tmp_path_factory: TempPathFactory):
+	path = tmp_path_factory.mktemp("iter_extract")
+	return path
+
+
+@pytest.fixture(scope="module")
+def ovl(tmp: Path) -> OvlFile:
+	icon_path = str(tmp / "icon.userinterfaceicondata")
+	header = UserinterfaceicondataRoot(OvlFile())
+	header.tex_name.data = "tex"
+	header.ovl_name.data = "ovl"
+	with header.to_xml_file(header, icon_path):
+		pass
+	ovl = create_ovl(tmp / "Memory", {"textfile.txt": TEXT_FILE, "icon.userinterfaceicondata": icon_path})
+	filepath = str(tmp / "memory.ovl")
+	ovl.save(filepath)
+	ovl.load(filepath)
+	return ovl
+
+
+class TestOVLIterExtract:
+
+	def test_ovl_iter_extract(self, ovl: OvlFile, tmp: Path) -> None:
+		out_dir = tmp / "disk"
+		on_disk = {os.path.relpath(p, out_dir).replace("\\", "/"): Path(p).read_bytes() for p in ovl.extract(str(out_dir))}
+		in_memory = dict(ovl.iter_extract())
+		assert sorted(in_memory) == ["icon.userinterfaceicondata", "textfile.txt"]
+		assert in_memory == on_disk
+
+	def test_ovl_iter_extract_zip(self, ovl: OvlFile, tmp: Path) -> None:
+		zip_path = tmp / "memory.zip"
+		with zipfile.ZipFile(zip_path, "w") as archive:
+			for name, data in ovl.iter_extract(only_types=(".txt", )):
+				archive.writestr(name, data)
+		with zipfile.ZipFile(zip_path) as archive:
+			assert archive.namelist() == ["textfile.txt"]
+			assert archive.read("textfile.txt") == Path("tests/Files/textfile.txt").read_bytes()
+
+	def test_extract_to_memory_fallback(self, ovl: OvlFile) -> None:
+		"""loaders without an in-memory extract go through a temp dir"""
+		loader = ovl.loaders["textfile.txt"]
+		assert list(BaseFile.extract_to_memory(loader)) == list(loader.extract_to_memory())
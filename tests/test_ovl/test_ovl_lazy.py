@@ -0,0 +1,85 @@
+import filecmp
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from pytest import TempPathFactory
+
+from generated.formats.ovl import OvlFile
+from tests.test_ovl.conftest import PSCOLLECTION_FILE, TEXT_FILE
+
+
+@pytest.fixture(scope="module")
+def tmp(tmp_path_factory: TempPathFactory):
+	path = tmp_path_factory.mktemp("lazy")
+	return path
+
+
+@pytest.fixture(scope="module")
+def ovl_path(make_ovl: Callable[..., str]) -> str:
+	return make_ovl("Lazy", {"textfile.txt": TEXT_FILE, "statements.pscollection": PSCOLLECTION_FILE})
+
+
+@pytest.fixture(scope="module")
+def multi_path(make_ovl: Callable[..., str]) -> str:
+	"""several loaders with structs in the same pools"""
+	files = {f"statements_{i}.pscollection": PSCOLLECTION_FILE for i in range(3)}
+	files["textfile.txt"] = TEXT_FILE
+	return make_ovl("LazyMulti", files)
+
+
+def owners(ovl: OvlFile) -> dict:
+	"""the name of the loader that owns each struct on a stack, by pool index and offset"""
+	owners = {}
+	for loader in ovl.loaders.values():
+		for pool, offset in loader.stack:
+			owner = loader.ovs.get_owner(pool, offset)
+			owners[(pool.i, offset)] = owner.name if owner else None
+	return owners
+
+
+def load(ovl_path: str, commands: dict) -> OvlFile:
+	ovl = OvlFile()
+	ovl.load_hash_table()
+	ovl.load(ovl_path, commands=commands)
+	return ovl
+
+
+class TestOVLLazy:
+
+	def test_ovl_lazy_load(self, ovl_path: str) -> None:
+		eager = load(ovl_path, {})
+		lazy = load(ovl_path, {"lazy": True})
+		assert list(lazy.loaders) == list(eager.loaders) == ["statements.pscollection", "textfile.txt"]
+		assert all(loader.is_collected for loader in eager.loaders.values())
+		assert not any(loader.is_collected for loader in lazy.loaders.values())
+
+	def test_ovl_lazy_extract(self, ovl_path: str, tmp: Path) -> None:
+		lazy = load(ovl_path, {"lazy": True})
+		out_paths = lazy.extract(str(tmp / "extracted"))
+		eager_paths = load(ovl_path, {}).extract(str(tmp / "extracted_eager"))
+		assert all(loader.is_collected for loader in lazy.loaders.values())
+		assert len(out_paths) == 2
+		for lazy_path, eager_path in zip(out_paths, eager_paths):
+			assert filecmp.cmp(lazy_path, eager_path, shallow=False)
+		assert filecmp.cmp(out_paths[1], TEXT_FILE, shallow=False)
+
+	def test_ovl_lazy_save(self, ovl_path: str, tmp: Path) -> None:
+		eager_out = str(tmp / "eager" / "Lazy.ovl")
+		lazy_out = str(tmp / "lazy" / "Lazy.ovl")
+		for out, commands in ((eager_out, {}), (lazy_out, {"lazy": True})):
+			Path(out).parent.mkdir()
+			load(ovl_path, commands).save(out)
+		assert filecmp.cmp(eager_out, lazy_out, shallow=False)
+
+	def test_ovl_lazy_owners(self, multi_path: str) -> None:
+		"""collecting in any order gives the same stacks and owners as an eager load"""
+		eager = load(multi_path, {})
+		lazy = load(multi_path, {"lazy": True})
+		for loader in reversed(lazy.loaders.values()):
+			loader.ensure_collected()
+		for name, loader in eager.loaders.items():
+			assert {(pool.i, offset) for pool, offset in lazy.loaders[name].stack} == {(pool.i, offset) for pool, offset in loader.stack}
+		eager_owners = owners(eager)
+		assert len(eager_owners) > 3
+		assert owners(lazy) == eager_owners
@@ -0,0 +1,45 @@
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from generated.formats.ovl import OvlFile
+
+
+@pytest.fixture(scope="module")
+def ovl_path(make_ovl: Callable[..., str]) -> str:
+	return make_ovl("Archives")
+
+
+def decompress_all(ovl: OvlFile) -> list:
+	with ThreadPoolExecutor(2) as executor:
+		return list(ovl.iter_decompressed_archives(executor))
+
+
+class TestOVLLoadArchives:
+
+	def test_decompressed_archives(self, ovl_path: str) -> None:
+		ovl = OvlFile()
+		ovl.load_hash_table()
+		ovl.load(ovl_path)
+		futures = decompress_all(ovl)
+		assert len(futures) == len(ovl.archives)
+		assert all(len(future.result()) == archive.uncompressed_size for future, archive in zip(futures, ovl.archives))
+
+	def test_truncated_archive(self, ovl_path: str, tmp_path: Path) -> None:
+		"""reading an archive fails on its future, not in the loop over all archives"""
+		ovl = OvlFile()
+		ovl.load_hash_table()
+		truncated = str(tmp_path / "truncated.ovl")
+		shutil.copy(ovl_path, truncated)
+		ovl.load(truncated)
+		with open(truncated, "r+b") as stream:
+			stream.truncate(ovl.eof + 4)
+		futures = decompress_all(ovl)
+		assert isinstance(futures[0].exception(), EOFError)
+		os.remove(truncated)
+		futures = decompress_all(ovl)
+		assert isinstance(futures[0].exception(), FileNotFoundError)
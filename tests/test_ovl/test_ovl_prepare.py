@@ -0,0 +1,84 @@
+import filecmp
+import os
+from pathlib import Path
+
+import pytest
+from pytest import TempPathFactory
+
+from generated.formats.ovl import OvlFile
+from generated.formats.userinterfaceicondata.compounds.UserinterfaceicondataRoot import UserinterfaceicondataRoot
+
+
+@pytest.fixture(scope="module")
+def tmp(tmp_path_factory: TempPathFactory):
+	path = tmp_path_factory.mktemp("prepare")
+	return path
+
+
+@pytest.fixture(scope="module")
+def src_dir(tmp: Path) -> str:
+	path = tmp / "Icons"
+	path.mkdir()
+	ovl = create()
+	for i in range(4):
+		header = UserinterfaceicondataRoot(ovl)
+		header.tex_name.data = f"tex_{i}"
+		header.ovl_name.data = f"ovl_{i}"
+		with header.to_xml_file(header, str(path / f"icon_{i}.userinterfaceicondata")):
+			pass
+	return str(path)
+
+
+def create() -> OvlFile:
+	ovl = OvlFile()
+	ovl.load_hash_table()
+	ovl.game = "Planet Zoo"
+	ovl.max_workers = 2
+	return ovl
+
+
+class TestOVLPrepare:
+
+	def test_ovl_prepare_files(self, src_dir: str) -> None:
+		ovl = create()
+		create_paths = [(os.path.join(src_dir, n), n) for n in sorted(os.listdir(src_dir))]
+		# txt has nothing to prepare
+		create_paths.append(("tests/Files/textfile.txt", "textfile.txt"))
+		prepared = ovl.prepare_files(create_paths)
+		assert sorted(prepared) == [p for p, n in create_paths[:-1]]
+		for i, header in enumerate(prepared[p] for p, n in create_paths[:-1]):
+			assert header.tex_name.data == f"tex_{i}"
+			# rebound to the ovl it was prepared for
+			assert header.context is ovl
+
+	def test_ovl_add_files_parallel(self, src_dir: str, tmp: Path) -> None:
+		paths = []
+		for parallel in (False, True):
+			ovl = create()
+			ovl.create(src_dir)
+			ovl.add_files([os.path.join(src_dir, n) for n in os.listdir(src_dir)], parallel=parallel)
+			assert len(ovl.loaders) == 4
+			filepath = str(tmp / f"parallel_{parallel}.ovl")
+			ovl.save(filepath)
+			paths.append(filepath)
+		assert filecmp.cmp(*paths, shallow=False)
+
+
+class TestOVLInjectPlan:
+
+	def test_ovl_plan_injection(self, tmp: Path) -> None:
+		src_dir = tmp / "Plan"
+		src_dir.mkdir()
+		names = (
+			"grass.tex", "grass_rg.png", "grass_b.png", "grass_[00].dds", "GRASS_[01]_a.png",
+			"orphan.png", "textfile.txt", "model.mdl2", "ovls.include", "readme.md")
+		for name in names:
+			(src_dir / name).touch()
+		ovl = create()
+		plan = ovl.plan_injection([str(src_dir / name) for name in names])
+		paths = {name: str(src_dir / name) for name in names}
+		assert plan.loaders == {paths["grass.tex"]: "grass.tex", paths["textfile.txt"]: "textfile.txt"}
+		assert set(plan.companions) == {paths[n] for n in (
+			"grass_rg.png", "grass_b.png", "grass_[00].dds", "GRASS_[01]_a.png", "model.mdl2", "ovls.include")}
+		assert set(plan.errors) == {paths["orphan.png"]}
+		assert set(plan.ignored) == {paths["readme.md"]}
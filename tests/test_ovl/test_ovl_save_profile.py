@@ -0,0 +1,73 @@
+import filecmp
+from pathlib import Path
+
+import pytest
+from pytest import TempPathFactory
+
+from generated.formats.ovl import OvlFile, SAVE_PROFILES
+from generated.formats.ovl_base.enums.Compression import Compression
+from tests.test_ovl.conftest import create_ovl, TEXT_FILE
+
+
+@pytest.fixture(scope="module")
+def tmp(tmp_path_factory: TempPathFactory):
+	path = tmp_path_factory.mktemp("profiles")
+	return path
+
+
+@pytest.fixture(scope="module")
+def src_dir(tmp: Path) -> Path:
+	return tmp / "Profile"
+
+
+def create(src_dir: Path) -> OvlFile:
+	ovl = create_ovl(src_dir, {"textfile.txt": TEXT_FILE})
+	ovl.user_version.compression = Compression.ZLIB
+	return ovl
+
+
+class TestOVLSaveProfile:
+
+	@pytest.mark.parametrize("profile", list(SAVE_PROFILES))
+	def test_ovl_save_profile(self, src_dir: Path, tmp: Path, profile: str) -> None:
+		filepath = str(tmp / f"{profile}.ovl")
+		ovl = create(src_dir)
+		ovl.save(filepath, profile)
+		# the profile must not change the compression stored on the ovl
+		assert ovl.user_version.compression == Compression.ZLIB
+		ovl.load(filepath)
+		assert list(ovl.loaders) == ["textfile.txt"]
+		expected = Compression.NONE if SAVE_PROFILES[profile].uncompressed else Compression.ZLIB
+		assert ovl.user_version.compression == expected
+		out_paths = ovl.extract(str(tmp / profile))
+		assert filecmp.cmp(out_paths[0], "tests/Files/textfile.txt", shallow=False)
+
+	def test_ovl_save_default_profile(self, src_dir: Path, tmp: Path) -> None:
+		default_path = str(tmp / "default.ovl")
+		balanced_path = str(tmp / "balanced_2.ovl")
+		create(src_dir).save(default_path)
+		create(src_dir).save(balanced_path, "balanced")
+		assert filecmp.cmp(default_path, balanced_path, shallow=False)
+
+	def test_ovl_save_unknown_profile(self, src_dir: Path, tmp: Path) -> None:
+		with pytest.raises(KeyError):
+			create(src_dir).save(str(tmp / "unknown.ovl"), "unknown")
+
+	def test_ovl_save_mapped_in_place(self, src_dir: Path, tmp: Path) -> None:
+		"""uncompressed archives are mapped from disk, saving over that file must still work"""
+		filepath = str(tmp / "mapped.ovl")
+		create(src_dir).save(filepath, "uncompressed")
+		ovl = OvlFile()
+		ovl.load_hash_table()
+		ovl.load(filepath)
+		mapped = ovl.mapped_files[0]
+		ovl.save(filepath, "uncompressed")
+		# the map is closed before the file is written
+		assert mapped.closed
+		ovl.load(filepath)
+		out_paths = ovl.extract(str(tmp / "mapped"))
+		assert filecmp.cmp(out_paths[0], "tests/Files/textfile.txt", shallow=False)
+		mapped = ovl.mapped_files[0]
+		ovl.close()
+		assert mapped.closed
+		assert not ovl.mapped_files
@@ -0,0 +1,56 @@
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from generated.formats.ovl import OvlFile
+from modules.formats.shared import djb2
+from modules.walker import scan_ovl_constants, set_mime_value
+
+
+@pytest.fixture(scope="module")
+def ovl_path(make_ovl: Callable[..., str]) -> str:
+	return make_ovl("Scan")
+
+
+class TestOVLScan:
+
+	def test_ovl_scan_header(self, ovl_path: str) -> None:
+		scan = OvlFile.scan_header(ovl_path)
+		ovl = OvlFile()
+		assert scan.files_name == ovl.load(ovl_path, commands={"generate_names": True}) == ["textfile.txt"]
+		assert scan.game == ovl.game
+		assert scan.mimes_ext == ovl.mimes_ext
+		assert scan.files_ext == ovl.files_ext
+		assert list(scan.files["file_hash"]) == list(ovl.files["file_hash"])
+		assert scan.dependencies_ext == ovl.dependencies_ext == []
+
+	def test_ovl_scan_header_magic(self, tmp_path: Path) -> None:
+		path = tmp_path / "encrypted.ovl"
+		path.write_bytes(b"FREA" + bytes(64))
+		with pytest.raises(AttributeError):
+			OvlFile.scan_header(str(path))
+
+	def test_scan_ovl_constants(self, ovl_path: str) -> None:
+		hashes, deps_exts, mimes, errors = scan_ovl_constants(ovl_path, {".txt"})
+		assert hashes == {djb2("textfile"): "textfile"}
+		assert deps_exts == set()
+		assert errors == []
+		ovl = OvlFile()
+		ovl.load_hash_table()
+		ovl.load(ovl_path)
+		mime = mimes[".txt"]
+		assert mime["hash"][1] == ovl.get_mime(".txt", "hash")
+		assert mime["version"][1] == ovl.get_mime(".txt", "version")
+		assert mime["pool"][1] == ovl.get_mime(".txt", "pool")
+
+	def test_mime_consistency(self) -> None:
+		mimes = {}
+		errors = []
+		set_mime_value(mimes, ".txt", "mimes", "version", 0, errors)
+		set_mime_value(mimes, ".txt", "mimes", "version", 2, errors)
+		set_mime_value(mimes, ".txt", "mimes", "version", 2, errors)
+		assert errors == []
+		set_mime_value(mimes, ".txt", "mimes", "version", 3, errors)
+		assert errors == ["mimes.version is not constant for .txt! (3 vs. 2)"]
+		assert mimes[".txt"]["version"] == ("mimes", 3)
@@ -0,0 +1,53 @@
+import logging
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from generated.base_struct import instance_attributes
+from generated.formats.motiongraph.compounds.Transition import Transition
+from generated.formats.ovl.compounds.MemPool import MemPool
+from generated.formats.ovl_base import OvlContext
+import generated.formats.motiongraph.imports
+import generated.formats.ovl.imports
+
+
+class TestSlots:
+
+	def test_slots(self) -> None:
+		"""generated structs store their fields in slots, unless their format opts out"""
+		transition = Transition(OvlContext())
+		assert not hasattr(transition, "__dict__")
+		with pytest.raises(AttributeError):
+			transition.not_a_field = 1
+		# the ovl tools attach attributes to its structs
+		pool = MemPool(OvlContext())
+		pool.not_a_field = 1
+
+	def test_xml(self) -> None:
+		transition = Transition(OvlContext())
+		transition.name = "walk"
+		transition.count_0 = 7
+		attributes = instance_attributes(transition)
+		assert attributes["count_0"] == 7
+		assert attributes["io_size"] == 0
+		elem = ET.Element("root")
+		Transition.to_xml(elem, "transition", transition, 0, None, False)
+		sub = elem.find("transition")
+		assert sub.attrib["name"] == "walk"
+		loaded = Transition(OvlContext(), set_default=False)
+		Transition._from_xml(loaded, sub)
+		assert loaded.count_0 == 7
+		assert loaded.name == "walk"
+
+	def test_xml_metadata(self, caplog: pytest.LogCaptureFixture) -> None:
+		"""metadata that does not fit into the slots is dropped with a warning"""
+		transition = Transition(OvlContext())
+		elem = ET.Element("root")
+		Transition.to_xml(elem, "transition", transition, 0, None, False)
+		sub = elem.find("transition")
+		sub.attrib["custom_name"] = "run"
+		loaded = Transition(OvlContext(), set_default=False)
+		with caplog.at_level(logging.WARNING):
+			Transition._from_xml(loaded, sub)
+		assert not hasattr(loaded, "custom_name")
+		assert "custom_name" in caplog.text
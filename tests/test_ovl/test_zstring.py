@@ -0,0 +1,46 @@
+import io
+
+import pytest
+
+from generated.formats.base.basic import ZString
+from generated.formats.ovl_base.basic import ZStringObfuscated, _obfuscate
+from generated.io import MAX_LEN, ViewStream
+
+
+def obfuscate_bytewise(s: str, delta: int) -> str:
+	"""the reference, one byte at a time"""
+	b = bytearray(s.encode())
+	for i in range(len(b)):
+		b[i] = max(0, b[i] + delta)
+	return b.decode()
+
+
+class TestZString:
+
+	@pytest.mark.parametrize("length", (0, 1, 63, 64, 65, 200, 1000))
+	@pytest.mark.parametrize("stream_type", (io.BytesIO, ViewStream))
+	def test_read(self, stream_type: type, length: int) -> None:
+		"""strings across chunk boundaries are read whole and the stream is left right behind the terminator"""
+		name = "".join(chr(97 + i % 26) for i in range(length))
+		stream = stream_type(name.encode() + b"\x00next\x00")
+		assert ZString.from_stream(stream) == name
+		assert stream.tell() == length + 1
+		assert ZString.from_stream(stream) == "next"
+
+	@pytest.mark.parametrize("stream_type", (io.BytesIO, ViewStream))
+	def test_errors(self, stream_type: type) -> None:
+		with pytest.raises(ValueError):
+			ZString.from_stream(stream_type(b"no terminator"))
+		assert ZString.from_stream(stream_type(b"x" * (MAX_LEN - 1) + b"\x00")) == "x" * (MAX_LEN - 1)
+		with pytest.raises(ValueError):
+			ZString.from_stream(stream_type(b"x" * MAX_LEN + b"\x00"))
+
+	def test_obfuscated(self) -> None:
+		for name in ("pz_animal_base", "ä€", "\x00a", ""):
+			for delta in (-1, 1):
+				assert _obfuscate(name, delta) == obfuscate_bytewise(name, delta)
+		stream = io.BytesIO()
+		ZStringObfuscated.to_stream("1234::some_name", stream)
+		assert stream.getvalue() == b"1234::tpnf`obnf\x00"
+		stream.seek(0)
+		assert ZStringObfuscated.from_stream(stream) == "1234::some_name"